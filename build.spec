@@ -19,6 +19,12 @@ a = Analysis(
         'tkinter',
         'sqlite3',
         'pyperclip',
+        # 页面模块按名称延迟导入（见 core/app.py 的 PAGES），需要显式列出，其依赖的模块会随之打包
+        'pages.home_page',
+        'pages.customer_page',
+        'pages.inventory_page',
+        'pages.order_page',
+        'pages.setting_page',
     ],
     hookspath=[],
     hooksconfig={},
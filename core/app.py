@@ -1,13 +1,24 @@
+import importlib
 import sys
 from pathlib import Path
 
 import customtkinter as ctk
 
-from pages.customer_page import CustomerPage
-from pages.home_page import HomePage
-from pages.inventory_page import InventoryPage
-from pages.order_page import OrderPage
-from pages.setting_page import SettingPage
+from core import startup
+from pages.setting_page import get_table_settings
+
+# 页面名称 -> (模块, 类名)；页面模块在第一次创建该页面时才导入
+# （没有静态导入，新增页面时需同时加入 build.spec 的 hiddenimports）
+PAGES = {
+    "home": ("pages.home_page", "HomePage"),
+    "customer": ("pages.customer_page", "CustomerPage"),
+    "inventory": ("pages.inventory_page", "InventoryPage"),
+    "order": ("pages.order_page", "OrderPage"),
+    "setting": ("pages.setting_page", "SettingPage"),
+}
+
+# 首屏显示后多久开始预创建下一个页面（毫秒）
+PREWARM_DELAY_MS = 300
 
 # ======= 全局外观 =======
 ctk.set_appearance_mode("light")
@@ -58,18 +69,17 @@ class YeahBusinessApp(ctk.CTk):
         self.main_frame.pack(side="right", fill="both", expand=True)
 
         # ======= 页面初始化 =======
-        self.frames = {
-            "home": HomePage(self.main_frame),
-            "customer": CustomerPage(self.main_frame),
-            "inventory": InventoryPage(self.main_frame),
-            "order": OrderPage(self.main_frame),
-            "setting": SettingPage(self.main_frame)
-        }
-
-        for frame in self.frames.values():
-            frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        # 页面在第一次显示时才创建；启动时只创建首页
+        self.frames = {}
 
         self.show_frame("home")
+
+        # 空闲回调在首屏绘制之后执行，记为“启动到可用”
+        self.after_idle(lambda: startup.finish(self))
+
+        # 首屏绘制完成后，在空闲时逐个预先创建其余页面（可在 settings.json 中关闭）
+        if get_table_settings().get("prewarm_pages", True):
+            self.after(PREWARM_DELAY_MS, self._prewarm_next_page)
     
     def _setup_icon(self):
         """设置窗口图标"""
@@ -116,6 +126,29 @@ class YeahBusinessApp(ctk.CTk):
         except Exception as e:
             print(f"⚠️  PNG 图标加载失败: {e}")
 
+    def get_frame(self, name: str):
+        """获取页面，不存在时创建"""
+        frame = self.frames.get(name)
+        if frame is None:
+            with startup.phase(f"创建页面 {name}"):
+                module_name, class_name = PAGES[name]
+                page_class = getattr(importlib.import_module(module_name), class_name)
+                frame = page_class(self.main_frame)
+            frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+            self.frames[name] = frame
+        return frame
+
     def show_frame(self, name: str):
-        frame = self.frames[name]
+        frame = self.get_frame(name)
         frame.tkraise()
+        self.current_frame = name
+
+    def _prewarm_next_page(self):
+        """每次只创建一个页面，页面之间让出主线程，保证界面可以响应操作"""
+        for name in PAGES:
+            if name not in self.frames:
+                self.get_frame(name)
+                # 预创建的页面放在当前页面下方，不改变用户看到的页面
+                self.frames[self.current_frame].tkraise()
+                self.after(PREWARM_DELAY_MS, self._prewarm_next_page)
+                return
@@ -0,0 +1,172 @@
+"""
+批量操作窗口（客户 / 库存 / 订单共用）：
+选择范围（勾选的记录 / 当前筛选结果全部）与操作（删除 / 把某个字段改为同一个值），
+先在后台预览影响的记录数，确认后以一条语句、一个事务执行（见 data/bulk.py）。
+"""
+from tkinter import messagebox
+
+import customtkinter as ctk
+
+from core.tasks import read_cursor, run_async
+from data.bulk import bulk_delete, bulk_update, filter_scope, preview_counts
+
+ACTION_DELETE = "删除"
+ACTION_UPDATE = "修改字段"
+
+
+class BulkWindow(ctk.CTkToplevel):
+    """
+    page 为列表页（使用其 conn、window、selection、table、refresh_table）；
+    fields 为可批量修改的字段 [(显示名, 字段, 可选值列表或 None), ...]；
+    delete_only 为删除时的附加条件 (SQL 条件, 说明)，不满足的记录会被跳过，如订单只删除草稿。
+    """
+
+    def __init__(self, page, name, table, fields, delete_only=None):
+        super().__init__(page)
+        self.page = page
+        self.name = name
+        self.table = table
+        self.fields = {label: (field, choices) for label, field, choices in fields}
+        self.delete_only = delete_only
+        self.selection = page.selection
+
+        self.title(f"批量操作 - {name}")
+        self.geometry("520x460")
+        self.grab_set()
+
+        # ======== 范围 ========
+        ctk.CTkLabel(self, text="操作范围", font=("微软雅黑", 16, "bold")).pack(anchor="w", padx=20, pady=(15, 5))
+        self.scope_var = ctk.StringVar(value="checked" if self.selection else "filter")
+        checked_text = self.selection.text(page.table.total) or "勾选的记录"
+        ctk.CTkRadioButton(self, text=checked_text, variable=self.scope_var,
+                           value="checked", font=("微软雅黑", 14), command=self.clear_preview,
+                           state="normal" if self.selection else "disabled").pack(anchor="w", padx=30, pady=4)
+        filter_text = "当前筛选结果（全部）" if page.search_filters else "全部记录（当前没有筛选条件）"
+        ctk.CTkRadioButton(self, text=filter_text, variable=self.scope_var, value="filter",
+                           font=("微软雅黑", 14), command=self.clear_preview).pack(anchor="w", padx=30, pady=4)
+
+        # ======== 操作 ========
+        ctk.CTkLabel(self, text="操作", font=("微软雅黑", 16, "bold")).pack(anchor="w", padx=20, pady=(15, 5))
+        action_row = ctk.CTkFrame(self, fg_color="transparent")
+        action_row.pack(fill="x", padx=30)
+        actions = [ACTION_UPDATE, ACTION_DELETE] if self.fields else [ACTION_DELETE]
+        self.action_menu = ctk.CTkOptionMenu(action_row, values=actions, width=120, command=self.on_action)
+        self.action_menu.pack(side="left")
+
+        self.field_menu = ctk.CTkOptionMenu(action_row, values=list(self.fields) or [""], width=120,
+                                            command=self.on_field)
+        # 有固定可选值的字段（如状态）只能从列表中选择，与单条编辑一致；其余字段手动输入
+        self.value_menu = ctk.CTkOptionMenu(action_row, values=[""], width=180, command=lambda _: self.clear_preview())
+        self.value_entry = ctk.CTkEntry(action_row, width=180)
+
+        self.preview_label = ctk.CTkLabel(self, text="", font=("微软雅黑", 14), text_color="#555",
+                                          wraplength=460, justify="left")
+        self.preview_label.pack(anchor="w", padx=20, pady=(20, 5))
+
+        button_row = ctk.CTkFrame(self, fg_color="transparent")
+        button_row.pack(pady=15)
+        ctk.CTkButton(button_row, text="👁 预览", width=120, fg_color="#4A5568",
+                      command=self.preview).pack(side="left", padx=10)
+        ctk.CTkButton(button_row, text="✅ 执行", width=120, fg_color="#2B6CB0",
+                      command=self.execute).pack(side="left", padx=10)
+
+        self.on_action(actions[0])
+
+    # ========== 选项 ==========
+    def on_action(self, action):
+        if action == ACTION_UPDATE:
+            self.field_menu.pack(side="left", padx=10)
+            self.on_field(self.field_menu.get())
+        else:
+            self.field_menu.pack_forget()
+            self.value_menu.pack_forget()
+            self.value_entry.pack_forget()
+        self.clear_preview()
+
+    def on_field(self, label):
+        _, choices = self.fields.get(label, (None, None))
+        if choices:
+            self.value_entry.pack_forget()
+            self.value_menu.configure(values=choices)
+            self.value_menu.set(choices[0])
+            self.value_menu.pack(side="left")
+        else:
+            self.value_menu.pack_forget()
+            self.value_entry.delete(0, "end")
+            self.value_entry.pack(side="left")
+        self.clear_preview()
+
+    def value(self) -> str:
+        """要写入的值"""
+        _, choices = self.fields[self.field_menu.get()]
+        if choices:
+            return self.value_menu.get()
+        return self.value_entry.get().strip()
+
+    def clear_preview(self):
+        self.preview_label.configure(text="")
+
+    def scope(self):
+        if self.scope_var.get() == "checked":
+            return self.selection.scope()
+        return filter_scope(*self.page.window.current_filter())
+
+    def extra(self):
+        """删除时只处理满足附加条件的记录"""
+        if self.action_menu.get() == ACTION_DELETE and self.delete_only:
+            return self.delete_only[0]
+        return None
+
+    # ========== 预览 / 执行 ==========
+    def count_then(self, on_done):
+        """后台统计范围内的记录数，完成后调用 on_done(总数, 实际操作数)"""
+        scope, extra = self.scope(), self.extra()
+        self.preview_label.configure(text="正在统计…")
+        run_async(self, lambda: preview_counts(read_cursor(), self.table, scope, extra),
+                  lambda counts: on_done(*counts), self.on_count_error, key=(self, "count"))
+
+    def on_count_error(self, error):
+        self.preview_label.configure(text=f"统计失败：{error}")
+
+    def describe(self, total, matched) -> str:
+        text = f"范围内共 {total} 条记录"
+        if matched < total:
+            text += f"，其中 {total - matched} 条不满足条件（{self.delete_only[1]}），将跳过"
+        if self.action_menu.get() == ACTION_DELETE:
+            return text + f"，将删除 {matched} 条。"
+        label = self.field_menu.get()
+        return text + f"，将把 {matched} 条的“{label}”改为“{self.value()}”。"
+
+    def preview(self):
+        self.count_then(lambda total, matched: self.preview_label.configure(text=self.describe(total, matched)))
+
+    def execute(self):
+        if self.action_menu.get() == ACTION_UPDATE and not self.value():
+            messagebox.showwarning("提示", "请填写要修改成的值。", parent=self)
+            return
+        self.count_then(self.confirm)
+
+    def confirm(self, total, matched):
+        text = self.describe(total, matched)
+        self.preview_label.configure(text=text)
+        if matched == 0:
+            messagebox.showinfo("提示", "没有需要操作的记录。", parent=self)
+            return
+        if not messagebox.askyesno("确认批量操作", f"{text}\n确定执行吗？", parent=self):
+            return
+
+        scope = self.scope()
+        try:
+            if self.action_menu.get() == ACTION_DELETE:
+                affected = bulk_delete(self.page.conn, self.table, scope, self.extra())
+                self.selection.clear()
+            else:
+                field, _ = self.fields[self.field_menu.get()]
+                affected = bulk_update(self.page.conn, self.table, scope, {field: self.value()})
+        except Exception as e:
+            messagebox.showerror("错误", f"批量操作失败，已回滚：{e}", parent=self)
+            return
+
+        self.destroy()
+        self.page.refresh_table()
+        messagebox.showinfo("成功", f"已{self.action_menu.get()} {affected} 条{self.name}记录。")
@@ -0,0 +1,256 @@
+"""
+虚拟滚动表格：
+Treeview 中只保留可见的行（外加少量缓冲行），滚动时按需向数据窗口（KeysetWindow）取对应位置的行，
+总行数再多，控件中的行数与内存占用也不变。
+竖向滚动条、鼠标滚轮、方向键 / 翻页键都由本类换算为“从第几行开始显示”。
+重绘时按记录ID对比新旧行，只删除移出的行、插入新出现的行、更新值有变化的行，
+Treeview 中的选中行与横向滚动位置在刷新后保留。
+统计与读取都在后台线程执行，界面不会因查询卡住；再次刷新 / 滚动后，之前的查询被中止、结果丢弃，
+也可以通过 cancel() 手动取消。
+"""
+from tkinter import ttk
+
+from core.tasks import cancel, read_cursor, run_async
+
+# 可见行之外多放的行数（窗口拉高时不会先出现空白）
+BUFFER_ROWS = 5
+# 鼠标滚轮每格滚动的行数
+WHEEL_ROWS = 3
+
+
+class VirtualGrid:
+    def __init__(self, master, columns, window, format_row, on_scroll=None):
+        """
+        master 中放入 Treeview 与横竖滚动条；列标题、列宽由页面通过 self.tree 设置。
+        window 为页面的 KeysetWindow；format_row(行 dict) -> (记录ID, values)，values 与列一一对应。
+        on_scroll(文字) 在每次重绘或开始加载时调用，用于更新状态栏。
+        """
+        self.columns = list(columns)
+        self.window = window
+        self.format_row = format_row
+        self.on_scroll = on_scroll
+        self.total = 0
+        self.offset = 0
+        self.loading = False
+        # 当前显示的行：Treeview 行（记录ID 的字符串）-> 记录ID / values，以及显示顺序
+        self._ids = {}
+        self._values = {}
+        self._order = []
+        self._render_job = None
+        self._reloading = False
+
+        self.tree = ttk.Treeview(master, columns=columns, show="headings", height=10)
+        self.y_scroll = ttk.Scrollbar(master, orient="vertical", command=self.on_scrollbar)
+        x_scroll = ttk.Scrollbar(master, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=x_scroll.set)
+        self.y_scroll.pack(side="right", fill="y")
+        x_scroll.pack(side="bottom", fill="x")
+        self.tree.pack(fill="both", expand=True)
+
+        # 窗口大小变化时可见行数随之变化
+        self.tree.bind("<Configure>", lambda e: self.schedule())
+        self.tree.bind("<MouseWheel>", self.on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(WHEEL_ROWS))
+        self.tree.bind("<Up>", lambda e: self.scroll_by(-1))
+        self.tree.bind("<Down>", lambda e: self.scroll_by(1))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self.page_rows()))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self.page_rows()))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(self.total))
+
+    # ========== 数据 ==========
+    def reload(self, reset=False):
+        """
+        查询条件或数据变化后（页面已调用 window.set_query）重新统计并显示：
+        在后台统计总数并预读当前位置的行，完成后重绘。reset 时回到顶部，否则保持当前滚动位置。
+        """
+        if reset:
+            self.offset = 0
+        start, count = self.offset, self.wanted_rows()
+        self._reloading = True
+        self.set_loading()
+        # 旧条件下尚未完成的统计 / 滚动读取已无意义（run_async 会作废同一 key 的上一次统计）
+        cancel((self, "rows"))
+        run_async(self.tree, lambda: self.window.load(read_cursor(), start, count),
+                  self._on_reload, self._on_error, key=(self, "reload"))
+
+    def _on_reload(self, total):
+        self._reloading = False
+        self.total = total
+        self.render()
+
+    def _fetch(self, start, count):
+        """滚动到尚未读取的位置：后台读取，完成后重绘（读取期间继续显示原来的行）"""
+        if self._reloading:
+            # 重新统计完成后会重绘
+            return
+        self.set_loading()
+        run_async(self.tree, lambda: self.window.rows(read_cursor(), start, count),
+                  lambda _: self.render(), self._on_error, key=(self, "rows"))
+
+    def cancel(self):
+        """
+        取消正在进行的统计 / 读取，正在执行的 SQL 随即中止。
+        取消的是重新统计时表格清空（条件已变，原来的行不再对应），只取消滚动读取时保留当前显示的行。
+        """
+        reloading = self._reloading
+        cancelled = cancel((self, "reload"))
+        cancelled = cancel((self, "rows")) or cancelled
+        if not cancelled:
+            return
+        self._reloading = False
+        self.loading = False
+        self.tree.configure(cursor="")
+        if reloading:
+            self.total = 0
+            self._apply([])
+            self.y_scroll.set(0, 1)
+        if self.on_scroll:
+            self.on_scroll("查询已取消")
+
+    def _on_error(self, error):
+        self._reloading = False
+        self.loading = False
+        self.tree.configure(cursor="")
+        print(f"⚠️  列表查询失败：{error}")
+        if self.on_scroll:
+            self.on_scroll("加载失败，请点击刷新重试")
+
+    def set_loading(self):
+        """加载提示：鼠标显示为等待，状态栏显示“加载中…”"""
+        if not self.loading:
+            self.loading = True
+            self.tree.configure(cursor="watch")
+        if self.on_scroll:
+            self.on_scroll("加载中…")
+
+    def row_id(self, item):
+        """Treeview 行对应的记录ID"""
+        return self._ids.get(item)
+
+    def items(self):
+        """当前显示的 Treeview 行"""
+        return tuple(self._order)
+
+    # ========== 滚动 ==========
+    def visible_rows(self) -> int:
+        """按控件高度与行高估算能显示的行数（含标题高度，多算的一行正好是半露出的行）"""
+        rowheight = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, self.tree.winfo_height() // rowheight)
+
+    def wanted_rows(self) -> int:
+        return self.visible_rows() + BUFFER_ROWS
+
+    def page_rows(self) -> int:
+        return max(1, self.visible_rows() - 1)
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(int(offset), self.total - 1))
+        self.schedule()
+        return "break"
+
+    def scroll_by(self, rows):
+        return self.scroll_to(self.offset + rows)
+
+    def on_wheel(self, event):
+        # Windows 每格为 120，macOS 为较小的整数
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll_by(-steps * WHEEL_ROWS)
+
+    def on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.total)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self.scroll_by(step * self.page_rows() if args[2] == "pages" else step)
+
+    def schedule(self):
+        """连续滚动时合并为空闲时的一次重绘"""
+        if self._render_job is None:
+            self._render_job = self.tree.after_idle(self.render)
+
+    # ========== 显示 ==========
+    def render(self):
+        if self._render_job is not None:
+            self.tree.after_cancel(self._render_job)
+            self._render_job = None
+
+        visible = self.visible_rows()
+        self.offset = max(0, min(self.offset, self.total - visible))
+        wanted = visible + BUFFER_ROWS
+        row_maps = []
+        if self.total:
+            row_maps = self.window.cached_rows(self.offset, wanted)
+            if row_maps is None:
+                self._fetch(self.offset, wanted)
+                return
+            total = self.window.total
+            if total < self.total and not row_maps and self.offset > 0:
+                # 估算的总数偏大，滚动位置已超出实际末尾：按更正后的总数重新定位
+                self.total = total
+                self.render()
+                return
+            self.total = total
+        if self.loading and not self._reloading:
+            self.loading = False
+            self.tree.configure(cursor="")
+
+        rows = [self.format_row(r) for r in row_maps]
+        self._apply(rows)
+        # Treeview 自身始终停在顶部，滚动由 offset 决定
+        self.tree.yview_moveto(0)
+
+        shown = min(visible, len(rows))
+        if self.total:
+            self.y_scroll.set(self.offset / self.total, min(1.0, (self.offset + shown) / self.total))
+        else:
+            self.y_scroll.set(0, 1)
+        if self.on_scroll:
+            self.on_scroll(self.range_text(shown))
+
+    def _apply(self, rows):
+        """
+        把 rows 同步到 Treeview：移出的行一次删除，新出现的行插入到对应位置，
+        仍在显示的行只有 values 变化时才更新。滚动一行只需删一行、插一行；
+        编辑一条记录后刷新只更新这一行。
+        """
+        tree = self.tree
+        new_ids = {str(record_id): record_id for record_id, _ in rows}
+        stale = [item for item in self._order if item not in new_ids]
+        if stale:
+            tree.delete(*stale)
+            for item in stale:
+                del self._values[item]
+
+        # 保留下来的行相对顺序不对时（一般不会出现：两次都按主键排序）先调整顺序
+        kept = [item for item in self._order if item in new_ids]
+        wanted = [item for item in new_ids if item in self._values]
+        if kept != wanted:
+            for index, item in enumerate(wanted):
+                tree.move(item, "", index)
+
+        for index, (record_id, values) in enumerate(rows):
+            item = str(record_id)
+            if item not in self._values:
+                tree.insert("", index, iid=item, values=values, tags=(record_id,))
+            elif self._values[item] != values:
+                tree.item(item, values=values)
+            self._values[item] = values
+
+        self._ids = new_ids
+        self._order = list(new_ids)
+
+    def set_cell(self, record_id, index, value):
+        """只更新一行中的一个单元格（如切换勾选），不重新读取数据；行不在显示范围内时忽略"""
+        item = str(record_id)
+        values = self._values.get(item)
+        if values is None or values[index] == value:
+            return
+        self.tree.set(item, self.columns[index], value)
+        self._values[item] = values[:index] + (value,) + values[index + 1:]
+
+    def range_text(self, shown) -> str:
+        if not shown:
+            return "没有记录"
+        return f"第 {self.offset + 1} - {self.offset + shown} 条"
@@ -0,0 +1,91 @@
+"""
+列表页（客户 / 库存 / 订单）共用的勾选与状态栏：
+页面需提供 self.table（VirtualGrid）、self.window（KeysetWindow）、self.selection（Selection）、
+self.columns（第一列为勾选列）与 self.cursor。
+"""
+import customtkinter as ctk
+
+from data.list_query import display_values
+
+
+class ListPageMixin:
+    # ========== 状态栏 ==========
+    def build_status_bar(self):
+        """表格下方的状态栏：顶部 / 底部、显示范围、取消查询、勾选数量与全选、总数"""
+        self.status_frame = ctk.CTkFrame(self, fg_color="#F7F9FC")
+        self.status_frame.pack(fill="x", pady=5)
+        ctk.CTkButton(self.status_frame, text="⏫ 顶部", width=80,
+                      command=lambda: self.table.scroll_to(0)).pack(side="left", padx=(10, 0))
+        ctk.CTkButton(self.status_frame, text="⏬ 底部", width=80,
+                      command=lambda: self.table.scroll_to(self.table.total)).pack(side="left", padx=10)
+        self.range_label = ctk.CTkLabel(self.status_frame, text="", font=("微软雅黑", 16))
+        self.range_label.pack(side="left", padx=5)
+        # 查询进行中才显示，可中止耗时的搜索
+        self.cancel_btn = ctk.CTkButton(self.status_frame, text="✖ 取消查询", width=100, fg_color="#E53E3E",
+                                        command=self.table.cancel)
+        self.total_label = ctk.CTkLabel(self.status_frame, text="", font=("微软雅黑", 16))
+        self.total_label.pack(side="right", padx=10)
+        self.select_all_btn = ctk.CTkButton(self.status_frame, text="☑ 全选筛选结果", width=130, fg_color="#4A5568",
+                                            command=self.toggle_select_matching)
+        self.select_all_btn.pack(side="right", padx=5)
+        self.selection_label = ctk.CTkLabel(self.status_frame, text="", font=("微软雅黑", 16), text_color="#2B6CB0")
+        self.selection_label.pack(side="right", padx=5)
+
+    def update_status(self, range_text):
+        """状态栏：当前显示范围与总数（滚动到末尾后估算的总数可能已更正），查询中显示取消按钮"""
+        self.range_label.configure(text=range_text)
+        self.total_label.configure(text=self.window.total_text(self.table.total))
+        if self.table.loading:
+            if not self.cancel_btn.winfo_manager():
+                self.cancel_btn.pack(side="left", padx=10)
+        else:
+            self.cancel_btn.pack_forget()
+        self.update_selection()
+
+    def update_selection(self):
+        """状态栏：勾选数量，全选按钮在“全选筛选结果 / 取消全选”之间切换"""
+        self.selection_label.configure(text=self.selection.text(self.table.total))
+        self.select_all_btn.configure(text="✖ 取消全选" if self.selection.all_matching else "☑ 全选筛选结果")
+
+    # ========== 勾选 ==========
+    def format_row(self, row_map):
+        """虚拟表格显示一行：(记录ID, values)，勾选状态来自 selection"""
+        mark = "☑" if row_map["id"] in self.selection else "☐"
+        return row_map["id"], (mark,) + display_values(row_map, self.columns)
+
+    def _get_checked_ids(self):
+        """勾选的记录ID（滚动出可见范围的行也保留勾选）"""
+        return self.selection.ids(self.cursor)
+
+    def toggle_select(self, event):
+        """点击勾选列切换该行的勾选"""
+        item_id = self.tree.identify_row(event.y)
+        # 只处理勾选列（第一列）
+        if not item_id or self.tree.identify_column(event.x) != "#1":
+            return
+        record_id = self.table.row_id(item_id)
+        if record_id is None:
+            return
+        self.table.set_cell(record_id, 0, "☑" if self.selection.toggle(record_id) else "☐")
+        self.update_selection()
+
+    def toggle_select_all(self):
+        """全选或取消全选当前显示的行（只更新勾选状态有变化的单元格）"""
+        ids = [self.table.row_id(item) for item in self.table.items()]
+        if not ids:
+            return
+        checked = not all(record_id in self.selection for record_id in ids)
+        self.selection.set(ids, checked)
+        mark = "☑" if checked else "☐"
+        for record_id in ids:
+            self.table.set_cell(record_id, 0, mark)
+        self.update_selection()
+
+    def toggle_select_matching(self):
+        """勾选符合当前筛选条件的全部记录（不限于显示的行），再次点击取消"""
+        if self.selection.all_matching:
+            self.selection.clear()
+        else:
+            self.selection.select_all_matching(*self.window.current_filter())
+        self.table.render()
+        self.update_selection()
@@ -0,0 +1,162 @@
+"""
+联想输入框：
+输入停顿 delay 毫秒后才查询一次（连续输入只查最后一次），查询在后台线程执行（core/tasks.py），
+输入不会因查询卡顿；结果回到主线程时输入已变化则丢弃。
+结果显示在输入框下方的下拉列表中，↑↓ 选择、回车确认、Esc 关闭。
+"""
+import tkinter as tk
+
+import customtkinter as ctk
+
+from core.tasks import cancel, read_cursor, run_async
+
+
+class TypeAheadEntry(ctk.CTkEntry):
+    """
+    search(cursor, text) -> [(显示文本, 值), ...]，在后台线程中以只读连接的游标调用，由调用方限制条数；
+    on_select(值) 在用户选中某一项后调用。
+    """
+
+    def __init__(self, master, search, on_select, delay=200, max_rows=10, **kwargs):
+        super().__init__(master, **kwargs)
+        self.search = search
+        self.on_select = on_select
+        self.delay = delay
+        self.max_rows = max_rows
+        self._after_id = None
+        self._last_text = None
+        # 后台查询进行中；查询期间按下回车时，结果回来后再确认
+        self._querying = False
+        self._choose_pending = False
+        self._values = []
+        self._popup = None
+        self._listbox = None
+
+        self.bind("<KeyRelease>", self._on_key)
+        self.bind("<Down>", lambda e: self._move(1))
+        self.bind("<Up>", lambda e: self._move(-1))
+        self.bind("<Return>", self._on_return)
+        self.bind("<Escape>", lambda e: self.hide())
+        self.bind("<FocusOut>", lambda e: self.after(150, self._hide_if_unfocused))
+
+    # ========== 输入防抖 ==========
+    def _on_key(self, event):
+        if event.keysym in ("Up", "Down", "Return", "KP_Enter", "Escape", "Tab"):
+            return
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(self.delay, self.refresh)
+
+    def refresh(self, force=False):
+        """按当前输入查询并显示下拉列表"""
+        self._after_id = None
+        text = self.get().strip()
+        if text == self._last_text and not force and self._popup is not None:
+            return
+        self._last_text = text
+        self._querying = True
+        # 同一输入框只保留最新一次查询，之前未返回的查询被作废
+        run_async(self, lambda: self.search(read_cursor(), text),
+                  lambda results: self._on_results(text, results), self._on_search_error,
+                  key=(self, "search"))
+
+    def _on_results(self, text, results):
+        self._querying = False
+        if text != self.get().strip():
+            # 查询期间输入已变化：结果已过期，丢弃（新输入的查询已在防抖中）
+            self._last_text = None
+            self._choose_pending = False
+            return
+        self.show_results(results)
+        if self._choose_pending:
+            self._choose_pending = False
+            self._choose()
+
+    def _on_search_error(self, error):
+        self._querying = False
+        self._choose_pending = False
+        self._last_text = None
+        print(f"⚠️  联想查询失败：{error}")
+
+    # ========== 下拉列表 ==========
+    def show_results(self, results):
+        self._values = [value for _, value in results]
+        if not results:
+            self.hide()
+            return
+        if self._popup is None:
+            self._popup = tk.Toplevel(self)
+            self._popup.overrideredirect(True)
+            self._popup.transient(self.winfo_toplevel())
+            self._listbox = tk.Listbox(self._popup, font=("微软雅黑", 12), activestyle="dotbox", exportselection=False)
+            self._listbox.pack(fill="both", expand=True)
+            # 点击列表时先取得焦点，避免输入框失焦后列表被关闭
+            self._listbox.bind("<ButtonPress-1>", lambda e: self._listbox.focus_set())
+            self._listbox.bind("<ButtonRelease-1>", lambda e: self._choose())
+            self._listbox.bind("<Return>", lambda e: self._choose())
+            self._listbox.bind("<Escape>", lambda e: self.hide())
+        self._listbox.delete(0, "end")
+        for label, _ in results:
+            self._listbox.insert("end", label)
+        self._listbox.configure(height=min(len(results), self.max_rows))
+        self._listbox.selection_clear(0, "end")
+        self._listbox.selection_set(0)
+        self._listbox.activate(0)
+        self._popup.geometry(f"+{self.winfo_rootx()}+{self.winfo_rooty() + self.winfo_height()}")
+        self._popup.deiconify()
+        self._popup.lift()
+
+    def hide(self):
+        # 关闭后不再显示尚未返回的查询结果
+        if self._querying:
+            cancel((self, "search"))
+            self._querying = False
+        self._choose_pending = False
+        if self._popup is not None:
+            self._popup.destroy()
+        self._popup = None
+        self._listbox = None
+        self._last_text = None
+
+    def _hide_if_unfocused(self):
+        focused = self.focus_get()
+        if self._listbox is None or focused is self._listbox:
+            return
+        self.hide()
+
+    def _move(self, step):
+        if self._listbox is None:
+            self.refresh(force=True)
+            return "break"
+        current = self._listbox.curselection()
+        index = (current[0] if current else -1) + step
+        index = max(0, min(index, self._listbox.size() - 1))
+        self._listbox.selection_clear(0, "end")
+        self._listbox.selection_set(index)
+        self._listbox.activate(index)
+        self._listbox.see(index)
+        return "break"
+
+    def _on_return(self, event):
+        if self._after_id is not None:
+            # 输入后立即回车：不等防抖，直接查询
+            self.after_cancel(self._after_id)
+            self.refresh()
+        if self._querying:
+            self._choose_pending = True
+        elif self._listbox is not None:
+            self._choose()
+        return "break"
+
+    def _choose(self):
+        current = self._listbox.curselection() if self._listbox is not None else ()
+        if not current:
+            return
+        value = self._values[current[0]]
+        self.hide()
+        self.on_select(value)
+
+    def set_text(self, text):
+        """设置输入框文本（不触发查询）"""
+        self.delete(0, "end")
+        self.insert(0, text)
@@ -0,0 +1,90 @@
+"""
+列表勾选状态：
+按记录ID 保存在控件之外，滚动、刷新后不丢失。两种形式：
+- 逐条勾选：记录ID 集合
+- 全选筛选结果：“符合当前筛选条件的全部记录”，只记下条件与取消勾选的记录ID，不列出全部ID
+scope() 给出对应的 SQL 条件，批量操作据此只执行一条语句（见 data/bulk.py）。
+"""
+from data.bulk import filter_scope, ids_scope
+
+
+class Selection:
+    def __init__(self, table):
+        self.table = table
+        self._ids = set()
+        # 全选筛选结果时的 (条件列表, 参数列表)，以及其中取消勾选的记录ID
+        self._filter = None
+        self._excluded = set()
+
+    @property
+    def all_matching(self) -> bool:
+        return self._filter is not None
+
+    def __contains__(self, record_id):
+        if self._filter is not None:
+            return record_id not in self._excluded
+        return record_id in self._ids
+
+    def __bool__(self):
+        return self._filter is not None or bool(self._ids)
+
+    # ========== 修改 ==========
+    def clear(self):
+        self._ids.clear()
+        self._filter = None
+        self._excluded.clear()
+
+    def select_all_matching(self, where, params):
+        """勾选符合筛选条件的全部记录（where / params 为 KeysetWindow.current_filter()）"""
+        self.clear()
+        self._filter = (list(where), list(params))
+
+    def set(self, record_ids, checked):
+        if self._filter is not None:
+            if checked:
+                self._excluded.difference_update(record_ids)
+            else:
+                self._excluded.update(record_ids)
+        elif checked:
+            self._ids.update(record_ids)
+        else:
+            self._ids.difference_update(record_ids)
+
+    def toggle(self, record_id) -> bool:
+        """切换一条记录的勾选，返回切换后是否勾选"""
+        checked = record_id not in self
+        self.set((record_id,), checked)
+        return checked
+
+    # ========== 查询 ==========
+    def scope(self):
+        """勾选范围对应的 (SQL 条件, 参数)"""
+        if self._filter is None:
+            return ids_scope(self._ids)
+        clause, params = filter_scope(*self._filter)
+        if self._excluded:
+            excluded, excluded_params = ids_scope(self._excluded)
+            clause = f"({clause}) AND NOT ({excluded})"
+            params = params + excluded_params
+        return clause, params
+
+    def ids(self, cursor):
+        """勾选的记录ID（按ID 排序）；全选筛选结果时查询一次数据库"""
+        if self._filter is None:
+            return sorted(self._ids)
+        clause, params = self.scope()
+        cursor.execute(f"SELECT id FROM {self.table} WHERE {clause} ORDER BY id", params)
+        return [r[0] for r in cursor.fetchall()]
+
+    def count(self, cursor) -> int:
+        if self._filter is None:
+            return len(self._ids)
+        clause, params = self.scope()
+        cursor.execute(f"SELECT COUNT(*) FROM {self.table} WHERE {clause}", params)
+        return cursor.fetchone()[0]
+
+    def text(self, total) -> str:
+        """状态栏显示的勾选数量；全选时按列表总数（可能为估算值）计算"""
+        if self._filter is not None:
+            return f"已勾选全部筛选结果 {max(0, total - len(self._excluded))} 条"
+        return f"已勾选 {len(self._ids)} 条" if self._ids else ""
@@ -0,0 +1,88 @@
+"""
+启动耗时记录：
+设置环境变量 YEAH2_STARTUP_LOG=1 或使用 --startup-log 参数启动时，
+记录各阶段（模块导入、数据库初始化、页面创建、首屏绘制）的耗时，
+写入用户数据目录下的 startup.log。
+
+使用 --startup-check 启动时，首屏绘制后立即退出，
+“启动到可用”超过 YEAH2_STARTUP_BUDGET_MS（默认 1000 毫秒）时退出码为 1，可用于检查启动是否变慢。
+本模块只依赖标准库，需最先导入。
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+_t0 = time.perf_counter()
+
+CHECK = "--startup-check" in sys.argv
+ENABLED = CHECK or "--startup-log" in sys.argv or bool(os.environ.get("YEAH2_STARTUP_LOG"))
+BUDGET_MS = float(os.environ.get("YEAH2_STARTUP_BUDGET_MS") or 1000)
+LOG_FILE = Path(os.path.expanduser("~")) / "Yeah2Data" / "startup.log"
+
+_events = []
+_finished = False
+
+
+def elapsed_ms() -> float:
+    return (time.perf_counter() - _t0) * 1000
+
+
+def _format(at, label, duration=None) -> str:
+    if duration is None:
+        return f"{at:9.1f} ms  {label}"
+    return f"{at:9.1f} ms  {label}（耗时 {duration:.1f} ms）"
+
+
+def _append(lines):
+    try:
+        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(LOG_FILE, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError as e:
+        print(f"⚠️  写入启动日志失败：{e}")
+
+
+def mark(label, duration=None):
+    """记录一个时间点；首屏之后的记录（如预创建页面）直接追加到日志"""
+    if not ENABLED:
+        return
+    line = _format(elapsed_ms(), label, duration)
+    if _finished:
+        _append([line])
+    else:
+        _events.append(line)
+
+
+@contextmanager
+def phase(label):
+    """记录一个阶段的结束时间与耗时"""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        mark(label, (time.perf_counter() - start) * 1000)
+
+
+def finish(app=None):
+    """首屏绘制完成（启动到可用）：写入日志；--startup-check 时检查耗时并退出"""
+    global _finished
+    if not ENABLED or _finished:
+        return
+    total = elapsed_ms()
+    mark("首屏绘制完成，可以操作")
+    _finished = True
+    summary = f"启动到可用：{total:.1f} ms（预算 {BUDGET_MS:.0f} ms）"
+    _append([f"===== {time.strftime('%Y-%m-%d %H:%M:%S')} 启动记录 =====", *_events, summary])
+    print(f"✅ {summary}，详见 {LOG_FILE}")
+
+    if CHECK and app is not None:
+        over = total > BUDGET_MS
+        if over:
+            print(f"⚠️  启动耗时超出预算 {total - BUDGET_MS:.1f} ms")
+        app.exit_code = 1 if over else 0
+        app.after(0, app.destroy)
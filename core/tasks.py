@@ -0,0 +1,134 @@
+"""
+后台任务：
+数据库查询放到后台线程执行，Tk 主线程只负责界面，不会因查询卡住。
+所有任务在同一个后台线程中依次执行，因此该线程只需复用一个只读连接（get_read_connection）。
+Tk 控件不是线程安全的：结果由主线程通过 after() 轮询取回后再回调，回调里可以直接更新界面。
+同一类查询可指定 key，只保留最新一次提交，过期的结果直接丢弃；
+任务被作废时，通过 read_cursor() 执行中的查询会被中止，长时间的扫描不会在后台排队。
+"""
+import queue
+import threading
+
+from data.db import get_read_connection
+
+# 主线程检查任务是否完成的间隔（毫秒）
+POLL_MS = 30
+# 查询每执行多少条 SQLite 虚拟机指令检查一次所在任务是否已作废
+PROGRESS_STEPS = 5000
+
+_tasks = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+# 后台线程正在执行的任务
+_running = None
+# 已装上进度回调的只读连接
+_guarded_conn = None
+# key -> 该 key 最新提交、尚未回调的任务（只在主线程中读写）
+_latest = {}
+
+
+class Task:
+    """一次后台任务；done 之后 result / error 二选一有值，cancelled 的任务不再回调"""
+
+    def __init__(self, work):
+        self.work = work
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self.error = None
+
+
+def _run_worker():
+    global _running
+    while True:
+        task = _tasks.get()
+        if not task.cancelled:
+            _running = task
+            try:
+                task.result = task.work()
+            except Exception as e:
+                task.error = e
+            finally:
+                _running = None
+        task.done = True
+
+
+def _progress():
+    """SQLite 进度回调：返回非 0 时当前语句以 OperationalError("interrupted") 中止"""
+    task = _running
+    return 1 if task is not None and task.cancelled else 0
+
+
+def read_cursor():
+    """
+    后台任务中使用：后台线程只读连接的游标。
+    连接上装有进度回调，所在任务被作废时正在执行的查询随即中止。
+    不用 Connection.interrupt()：它中断的是调用那一刻连接上的语句，
+    任务刚好切换时会误伤下一个任务；进度回调只看当前任务自己的状态。
+    """
+    global _guarded_conn
+    conn = get_read_connection()
+    if conn is not _guarded_conn:
+        conn.set_progress_handler(_progress, PROGRESS_STEPS)
+        _guarded_conn = conn
+    return conn.cursor()
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_worker, name="db-worker", daemon=True)
+            _worker.start()
+
+
+def cancel(key) -> bool:
+    """
+    作废该 key 下尚未回调的任务：还没开始的不再执行，正在执行的查询被中止，结果都不再回调。
+    返回是否确实作废了任务。
+    """
+    task = _latest.pop(key, None)
+    if task is None:
+        return False
+    task.cancelled = True
+    return True
+
+
+def run_async(widget, work, on_done, on_error=None, key=None) -> Task:
+    """
+    在后台线程执行 work()，完成后在主线程调用 on_done(结果)；
+    出错时调用 on_error(异常)，未提供则打印提示。
+    widget 用于调度 after()，任务完成前 widget 已销毁则不再回调。
+    指定 key 时同一 key 只保留最新一次提交，之前提交的任务被作废（见 cancel），
+    用于再次滚动 / 重新搜索后丢弃过期的查询结果。
+    """
+    _ensure_worker()
+    task = Task(work)
+    if key is not None:
+        cancel(key)
+        _latest[key] = task
+    _tasks.put(task)
+
+    def check():
+        if task.cancelled:
+            return
+        try:
+            if not widget.winfo_exists():
+                return
+        except Exception:
+            return
+        if not task.done:
+            widget.after(POLL_MS, check)
+            return
+        if key is not None and _latest.get(key) is task:
+            del _latest[key]
+        if task.error is not None:
+            if on_error:
+                on_error(task.error)
+            else:
+                print(f"⚠️  后台任务失败：{task.error}")
+            return
+        on_done(task.result)
+
+    widget.after(POLL_MS, check)
+    return task
@@ -0,0 +1,62 @@
+"""
+批量操作：
+对勾选的记录或符合当前筛选条件的全部记录，只执行一条 UPDATE / DELETE，
+并在同一个事务（BEGIN IMMEDIATE，开始时即取得写锁）中完成，不再逐条执行。
+操作范围用 (条件, 参数) 表示：
+- ids_scope：勾选的记录，ID 列表作为一个 JSON 参数传入（json_each），不受 SQL 变量个数限制
+- filter_scope：build_where 得到的当前筛选条件
+"""
+import datetime
+import json
+
+
+def ids_scope(ids):
+    """勾选的记录"""
+    return "id IN (SELECT value FROM json_each(?))", [json.dumps([int(i) for i in ids])]
+
+
+def filter_scope(where, params):
+    """符合筛选条件的全部记录（没有条件时为整张表）"""
+    return (" AND ".join(f"({c})" for c in where) if where else "1"), list(params)
+
+
+def preview_counts(cursor, table, scope, extra=None):
+    """预览：(范围内的记录数, 其中满足 extra 条件、实际会被操作的记录数)，一次查询"""
+    clause, params = scope
+    eligible = f"TOTAL({extra})" if extra else "COUNT(*)"
+    cursor.execute(f"SELECT COUNT(*), {eligible} FROM {table} WHERE {clause}", params)
+    total, matched = cursor.fetchone()
+    return total, int(matched)
+
+
+def _run(conn, sql, params) -> int:
+    """在一个 BEGIN IMMEDIATE 事务中执行一条语句，返回影响的行数"""
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute(sql, params)
+        affected = cursor.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return affected
+
+
+def bulk_delete(conn, table, scope, extra=None) -> int:
+    """删除范围内（且满足 extra 条件）的记录，返回删除的行数"""
+    clause, params = scope
+    if extra:
+        clause = f"({clause}) AND ({extra})"
+    return _run(conn, f"DELETE FROM {table} WHERE {clause}", params)
+
+
+def bulk_update(conn, table, scope, values) -> int:
+    """
+    把范围内记录的若干字段设为同一个值（values: {字段: 值}），并更新 update_time。
+    字段名由调用方从固定列表中选择，不来自用户输入。
+    """
+    clause, params = scope
+    values = dict(values, update_time=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    sets = ", ".join(f"{field}=?" for field in values)
+    return _run(conn, f"UPDATE {table} SET {sets} WHERE {clause}", list(values.values()) + params)
@@ -0,0 +1,200 @@
+"""
+首页统计：
+概览数字保存在 dashboard_counter 表中，由触发器在增删改时同步加减，
+读取时只需一次主键查找，不再随历史数据增多而变慢。
+客户排名读取订单送达 / 退货时维护的 purchase_times、total_purchase_amount 字段。
+"""
+
+# 低库存阈值（与首页“低库存(<10)”一致）
+LOW_STOCK = 10
+
+_INVENTORY_ZERO = "IFNULL({r}.stock_qty = 0, 0)"
+_INVENTORY_LOW = f"IFNULL({{r}}.stock_qty > 0 AND {{r}}.stock_qty < {LOW_STOCK}, 0)"
+_CUSTOMER_ACTIVE = "IFNULL({r}.customer_status = '启用', 0)"
+_HAS_CUSTOMER = "({r}.customer_id IS NOT NULL AND {r}.customer_id != '')"
+
+
+def _adjust(deltas) -> str:
+    """生成按计数器名称加减的 UPDATE 语句：deltas 为 {计数器: SQL 表达式}"""
+    cases = " ".join(f"WHEN '{name}' THEN {expr}" for name, expr in deltas.items())
+    names = ", ".join(f"'{name}'" for name in deltas)
+    return f"UPDATE dashboard_counter SET value = value + (CASE name {cases} ELSE 0 END) WHERE name IN ({names});"
+
+
+def _adjust_status(row, sign) -> str:
+    """订单状态计数（状态名不固定，按需新增计数器）"""
+    return (
+        "INSERT INTO dashboard_counter(name, value) "
+        f"VALUES ('order_status:' || {row}.order_status, {sign}) "
+        f"ON CONFLICT(name) DO UPDATE SET value = value + ({sign});"
+    )
+
+
+def _adjust_ordered(row, sign, other_row=None) -> str:
+    """
+    已下单客户数：该客户的第一笔订单出现时 +1、最后一笔订单消失时 -1。
+    判断是否还有其他订单走 idx_order_customer_id，只需一次索引查找。
+    """
+    exclude = f"AND id != {other_row}.id" if other_row else ""
+    return (
+        f"UPDATE dashboard_counter SET value = value + ({sign}) WHERE name = 'customer_ordered' "
+        f"AND {_HAS_CUSTOMER.format(r=row)} "
+        f"AND NOT EXISTS (SELECT 1 FROM \"order\" WHERE customer_id = {row}.customer_id {exclude});"
+    )
+
+
+def create_counters(cursor):
+    """创建计数器表与同步触发器，并按现有数据初始化（迁移中调用）"""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS dashboard_counter (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+    """)
+
+    def inventory_deltas(r, sign):
+        return {
+            "inventory_total": f"{sign}",
+            "inventory_zero": f"{sign} * {_INVENTORY_ZERO.format(r=r)}",
+            "inventory_low": f"{sign} * {_INVENTORY_LOW.format(r=r)}",
+        }
+
+    def customer_deltas(r, sign):
+        return {
+            "customer_total": f"{sign}",
+            "customer_active": f"{sign} * {_CUSTOMER_ACTIVE.format(r=r)}",
+        }
+
+    triggers = {
+        # ===== 客户 =====
+        "trg_counter_customer_insert": ('AFTER INSERT ON customer', _adjust(customer_deltas("NEW", 1))),
+        "trg_counter_customer_delete": ('AFTER DELETE ON customer', _adjust(customer_deltas("OLD", -1))),
+        "trg_counter_customer_update": (
+            'AFTER UPDATE OF customer_status ON customer',
+            _adjust({"customer_active": f"{_CUSTOMER_ACTIVE.format(r='NEW')} - {_CUSTOMER_ACTIVE.format(r='OLD')}"})
+        ),
+        # ===== 库存 =====
+        "trg_counter_inventory_insert": ('AFTER INSERT ON inventory', _adjust(inventory_deltas("NEW", 1))),
+        "trg_counter_inventory_delete": ('AFTER DELETE ON inventory', _adjust(inventory_deltas("OLD", -1))),
+        "trg_counter_inventory_update": (
+            'AFTER UPDATE OF stock_qty ON inventory',
+            _adjust({
+                "inventory_zero": f"{_INVENTORY_ZERO.format(r='NEW')} - {_INVENTORY_ZERO.format(r='OLD')}",
+                "inventory_low": f"{_INVENTORY_LOW.format(r='NEW')} - {_INVENTORY_LOW.format(r='OLD')}",
+            })
+        ),
+        # ===== 订单 =====
+        "trg_counter_order_insert": (
+            'AFTER INSERT ON "order"',
+            _adjust({"order_total": "1"}) + _adjust_status("NEW", 1) + _adjust_ordered("NEW", 1, other_row="NEW")
+        ),
+        "trg_counter_order_delete": (
+            'AFTER DELETE ON "order"',
+            _adjust({"order_total": "-1"}) + _adjust_status("OLD", -1) + _adjust_ordered("OLD", -1)
+        ),
+        "trg_counter_order_status": (
+            'AFTER UPDATE OF order_status ON "order" WHEN NEW.order_status IS NOT OLD.order_status',
+            _adjust_status("OLD", -1) + _adjust_status("NEW", 1)
+        ),
+        "trg_counter_order_customer": (
+            'AFTER UPDATE OF customer_id ON "order" WHEN NEW.customer_id IS NOT OLD.customer_id',
+            _adjust_ordered("OLD", -1) + _adjust_ordered("NEW", 1, other_row="NEW")
+        ),
+    }
+    for name, (event, body) in triggers.items():
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {body} END;")
+
+    rebuild_counters(cursor)
+
+
+def rebuild_counters(cursor):
+    """按现有数据重新计算全部计数器（每张表一次条件聚合）"""
+    counters = {}
+    cursor.execute(f"""
+        SELECT COUNT(*), TOTAL({_CUSTOMER_ACTIVE.format(r='customer')}) FROM customer
+    """)
+    counters["customer_total"], counters["customer_active"] = cursor.fetchone()
+    cursor.execute(f"""
+        SELECT COUNT(*), TOTAL({_INVENTORY_ZERO.format(r='inventory')}), TOTAL({_INVENTORY_LOW.format(r='inventory')})
+        FROM inventory
+    """)
+    counters["inventory_total"], counters["inventory_zero"], counters["inventory_low"] = cursor.fetchone()
+    cursor.execute(f"""
+        SELECT COUNT(DISTINCT customer_id) FROM "order" WHERE {_HAS_CUSTOMER.format(r='"order"')}
+    """)
+    counters["customer_ordered"] = cursor.fetchone()[0]
+    cursor.execute('SELECT order_status, COUNT(*) FROM "order" GROUP BY order_status')
+    status_counts = cursor.fetchall()
+    counters["order_total"] = sum(n for _, n in status_counts)
+    for status, n in status_counts:
+        counters[f"order_status:{status}"] = n
+
+    cursor.execute("DELETE FROM dashboard_counter")
+    cursor.executemany(
+        "INSERT INTO dashboard_counter(name, value) VALUES (?, ?)",
+        [(name, int(value)) for name, value in counters.items()]
+    )
+
+
+def load_counters(cursor) -> dict:
+    """读取全部计数器 {名称: 数值}"""
+    cursor.execute("SELECT name, value FROM dashboard_counter")
+    return dict(cursor.fetchall())
+
+
+def get_overview(cursor) -> dict:
+    """首页三张统计卡片的数据"""
+    c = load_counters(cursor)
+    return {
+        "customer": {
+            "total": c.get("customer_total", 0),
+            "ordered": c.get("customer_ordered", 0),
+            "active": c.get("customer_active", 0),
+        },
+        "inventory": {
+            "total": c.get("inventory_total", 0),
+            "zero": c.get("inventory_zero", 0),
+            "low": c.get("inventory_low", 0),
+        },
+        "order": {
+            "total": c.get("order_total", 0),
+            "draft": c.get("order_status:草稿", 0),
+            "completed": c.get("order_status:已完成", 0),
+            "delivered": c.get("order_status:已送达", 0),
+        },
+    }
+
+
+def get_top_customers(cursor, limit=5) -> list:
+    """购买次数最多的客户 [(名称, 购买次数, 购买总额), ...]，走 idx_customer_purchase"""
+    cursor.execute("""
+        SELECT customer_name, purchase_times, COALESCE(total_purchase_amount, 0)
+        FROM customer
+        WHERE purchase_times > 0
+        ORDER BY purchase_times DESC, total_purchase_amount DESC
+        LIMIT ?
+    """, (limit,))
+    return cursor.fetchall()
+
+
+def get_low_stock(cursor, limit=5) -> list:
+    """启用库存中数量最少的 [(产品编码, 数量, 状态), ...]，走部分索引 idx_inventory_enabled_qty"""
+    cursor.execute("""
+        SELECT product_code, stock_qty, stock_status
+        FROM inventory
+        WHERE stock_status='启用'
+        ORDER BY stock_qty ASC
+        LIMIT ?
+    """, (limit,))
+    return cursor.fetchall()
+
+
+def get_recent_orders(cursor, limit=5) -> list:
+    """最新订单 [(订单号, 客户名称, 状态, 销售价, 创建时间), ...]"""
+    cursor.execute("""
+        SELECT order_no, customer_name, order_status, sell_price, create_time
+        FROM "order"
+        ORDER BY id DESC
+        LIMIT ?
+    """, (limit,))
+    return cursor.fetchall()
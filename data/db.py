@@ -0,0 +1,140 @@
+import json
+import sqlite3
+import threading
+
+from data.db_init import get_user_db_path
+
+DB_PATH = get_user_db_path()
+SETTINGS_FILE = DB_PATH.parent / "settings.json"
+
+# 每个连接缓存的预编译语句数量（sqlite3 默认 128）
+STATEMENT_CACHE_SIZE = 256
+
+# 默认性能配置，可在 settings.json 的 "db_pragmas" 中逐项覆盖
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",        # 读写互不阻塞
+    "synchronous": "NORMAL",      # WAL 下安全且显著减少 fsync
+    "cache_size": -65536,         # 负数单位为 KiB，即 64MB 页缓存
+    "mmap_size": 268435456,       # 256MB 内存映射读
+    "temp_store": "MEMORY",       # 排序/临时表放内存
+    "busy_timeout": 5000,         # 等待写锁的毫秒数，避免直接报 "database is locked"
+}
+
+# journal_mode 写入数据库文件本身，只需在启动时设置一次
+_DATABASE_PRAGMAS = ("journal_mode",)
+_ALLOWED_VALUES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+_lock = threading.Lock()
+_write_conn = None
+_local = threading.local()
+_read_conns = []
+
+
+def _load_pragma_overrides() -> dict:
+    """读取 settings.json 中的 db_pragmas 覆盖项"""
+    try:
+        if SETTINGS_FILE.exists():
+            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+                overrides = json.load(f).get("db_pragmas")
+            if isinstance(overrides, dict):
+                return overrides
+    except Exception:
+        pass
+    return {}
+
+
+def get_pragma_profile() -> dict:
+    """合并默认配置与用户配置，非法项直接忽略"""
+    profile = dict(DEFAULT_PRAGMAS)
+    for key, val in _load_pragma_overrides().items():
+        if key not in DEFAULT_PRAGMAS:
+            continue
+        if key in _ALLOWED_VALUES:
+            val = str(val).upper()
+            if val not in _ALLOWED_VALUES[key]:
+                continue
+        else:
+            try:
+                val = int(val)
+            except (TypeError, ValueError):
+                continue
+        profile[key] = val
+    return profile
+
+
+_profile = get_pragma_profile()
+
+
+def apply_pragmas(conn: sqlite3.Connection, include_database=False) -> sqlite3.Connection:
+    """
+    为连接统一设置 PRAGMA：
+    连接级配置每个连接都要设置；include_database=True 时额外设置
+    journal_mode 等写入数据库文件的配置（启动时执行一次即可）。
+    """
+    for key, val in _profile.items():
+        if key in _DATABASE_PRAGMAS and not include_database:
+            continue
+        try:
+            conn.execute(f"PRAGMA {key} = {val}")
+        except sqlite3.Error as e:
+            print(f"⚠️  设置 PRAGMA {key} 失败：{e}")
+    return conn
+
+
+def connect(db_path=None, include_database=False, **kwargs) -> sqlite3.Connection:
+    """创建一个已应用统一配置的新连接（调用方负责关闭）"""
+    kwargs.setdefault("cached_statements", STATEMENT_CACHE_SIZE)
+    conn = sqlite3.connect(db_path or DB_PATH, **kwargs)
+    return apply_pragmas(conn, include_database=include_database)
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    获取全局唯一的写连接：
+    所有页面的增删改都通过它完成，保证各页面看到同一份已提交数据，
+    也不会出现多个长连接互相抢写锁的情况。
+    """
+    global _write_conn
+    with _lock:
+        if _write_conn is None:
+            # Tk 页面都在主线程运行；允许跨线程仅用于退出时关闭
+            _write_conn = connect(check_same_thread=False)
+        return _write_conn
+
+
+def get_read_connection() -> sqlite3.Connection:
+    """获取当前线程复用的只读连接（后台线程查询使用）"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = connect(check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        _local.conn = conn
+        with _lock:
+            _read_conns.append(conn)
+    return conn
+
+
+def close_all():
+    """关闭所有由本模块管理的连接（应用退出时调用）"""
+    global _write_conn
+    with _lock:
+        conns = _read_conns[:]
+        _read_conns.clear()
+        if _write_conn is not None:
+            # 退出前让 SQLite 按需更新统计信息（通常为空操作）
+            try:
+                _write_conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conns.append(_write_conn)
+            _write_conn = None
+    _local.__dict__.pop("conn", None)
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
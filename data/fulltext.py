@@ -0,0 +1,98 @@
+"""
+全文检索（FTS5）：
+每张业务表对应一张 trigram 分词的 FTS5 外部内容表，由触发器与原表保持同步。
+搜索窗口中的文本条件原先是 LIKE '%值%'，无法使用索引、需要扫描全表；
+改为在 FTS 索引上 MATCH 后按 rowid 取回原表记录。
+trigram 至少需要 3 个字符，更短的关键字仍使用 LIKE。
+"""
+import sqlite3
+
+# 业务表 -> (FTS 表, 主键, 建立全文索引的字段)
+FTS_TABLES = {
+    "customer": ("customer_fts", "id", (
+        "customer_name", "customer_phone", "customer_address",
+        "wechat_account", "qq_account", "source_account", "remark",
+    )),
+    "inventory": ("inventory_fts", "id", (
+        "product_type", "size", "color", "material", "element", "supplier", "remark",
+    )),
+    "order": ("order_fts", "id", (
+        "order_no", "customer_name", "address", "express_no", "remark",
+    )),
+    "order_item": ("order_item_fts", "id", (
+        "product_code",
+    )),
+}
+
+# trigram 分词可匹配的最短关键字
+MIN_MATCH_LENGTH = 3
+
+_available = {}
+
+
+def create_fts_tables(cursor):
+    """创建 FTS 表、同步触发器并从原表重建索引（迁移中调用）"""
+    for table, (fts, key, fields) in FTS_TABLES.items():
+        cols = ", ".join(fields)
+        new_cols = ", ".join(f"new.{f}" for f in fields)
+        old_cols = ", ".join(f"old.{f}" for f in fields)
+        cursor.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {cols}, content='{table}', content_rowid='{key}', tokenize='trigram'
+        )
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert AFTER INSERT ON "{table}"
+        BEGIN
+            INSERT INTO {fts}(rowid, {cols}) VALUES (new.{key}, {new_cols});
+        END;
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete AFTER DELETE ON "{table}"
+        BEGIN
+            INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.{key}, {old_cols});
+        END;
+        """)
+        # 只在索引字段变化时更新（改库存数量、状态等不触发）
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_update AFTER UPDATE OF {cols} ON "{table}"
+        BEGIN
+            INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.{key}, {old_cols});
+            INSERT INTO {fts}(rowid, {cols}) VALUES (new.{key}, {new_cols});
+        END;
+        """)
+        cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def fts_available(conn: sqlite3.Connection, table) -> bool:
+    """该表的 FTS 索引是否存在（SQLite 不支持 trigram 时迁移会跳过建表）"""
+    if table not in _available:
+        fts = FTS_TABLES[table][0]
+        row = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (fts,)).fetchone()
+        _available[table] = row is not None
+    return _available[table]
+
+
+def match_query(field, val) -> str:
+    """单字段短语查询，关键字中的双引号按 FTS5 语法转义"""
+    return f'{field} : "{val.replace(chr(34), chr(34) * 2)}"'
+
+
+def fts_filters(conn: sqlite3.Connection, table, fields=None, key_sql="id") -> dict:
+    """
+    生成 build_where 的 special 条件：{字段: 函数(val) -> (条件, 参数)}。
+    fields 默认为该表全部索引字段；key_sql 为外层查询中与 FTS rowid 对应的列。
+    FTS 不可用时返回空字典，搜索仍按 LIKE 进行。
+    """
+    if not fts_available(conn, table):
+        return {}
+    fts, _, indexed = FTS_TABLES[table]
+
+    def make(field):
+        def clause(val):
+            if len(val) < MIN_MATCH_LENGTH:
+                return f"{field} LIKE ?", [f"%{val}%"]
+            return f"{key_sql} IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)", [match_query(field, val)]
+        return clause
+
+    return {field: make(field) for field in (fields or indexed)}
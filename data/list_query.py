@@ -0,0 +1,274 @@
+"""
+列表页通用查询：
+- build_where：把页面的 search_filters 转为 WHERE 条件
+- select_columns / row_to_map：只查询页面显示需要的列，并按列名取值
+- KeysetWindow：虚拟滚动列表按块读取行，块与块之间按主键做 keyset（seek）查找，
+  滚动位置再靠后代价也不变；符合条件的总行数按筛选条件缓存，只有条件变化或数据库被写入后才重新统计
+"""
+import threading
+from collections import OrderedDict
+
+
+def build_where(filters, exact_fields=(), special=None):
+    """
+    把 search_filters 转为 (条件列表, 参数列表)：
+    - dict 值为范围 {"min", "max"}
+    - exact_fields 中的字段精确匹配，其余文本字段模糊匹配
+    - special: {字段: 函数(val) -> (条件, 参数列表)}，用于需要特殊处理的字段
+    """
+    special = special or {}
+    where, params = [], []
+    for field, val in filters.items():
+        if not val:
+            continue
+        if field in special:
+            clause, clause_params = special[field](val)
+            where.append(clause)
+            params += clause_params
+        elif isinstance(val, dict):
+            min_v, max_v = val.get("min"), val.get("max")
+            if min_v and max_v:
+                where.append(f"{field} BETWEEN ? AND ?")
+                params += [min_v, max_v]
+            elif min_v:
+                where.append(f"{field} >= ?")
+                params.append(min_v)
+            elif max_v:
+                where.append(f"{field} <= ?")
+                params.append(max_v)
+        elif field in exact_fields:
+            where.append(f"{field} = ?")
+            params.append(val)
+        else:
+            where.append(f"{field} LIKE ?")
+            params.append(f"%{val}%")
+    return where, params
+
+
+def where_sql(where) -> str:
+    return (" WHERE " + " AND ".join(where)) if where else ""
+
+
+def select_columns(columns, key="id", computed=()) -> str:
+    """
+    根据页面当前显示的列生成 SELECT 列表：
+    第一列固定为主键（滚动读取、勾选都依赖它），跳过勾选列与非表字段（computed），
+    隐藏的列不会被查询。
+    """
+    names = [key] + [c for c in columns if c not in ("select", key) and c not in computed]
+    return ", ".join(names)
+
+
+def row_to_map(cursor, row) -> dict:
+    """按 cursor.description 把一行转为 {列名: 值}，不依赖列的位置"""
+    return {d[0]: v for d, v in zip(cursor.description, row)}
+
+
+def display_values(row_map, columns) -> tuple:
+    """按显示列顺序生成 Treeview 的 values（None 显示为空）"""
+    return tuple(
+        "" if row_map.get(c) is None else str(row_map.get(c))
+        for c in columns if c != "select"
+    )
+
+
+class KeysetWindow:
+    """
+    虚拟滚动列表的数据窗口：结果按主键倒序（最新在前）每 block_size 行分为一块，
+    滚动到哪里读取哪一块，只缓存最近用到的 max_blocks 块，内存占用与总行数无关。
+    读取某一块时优先从相邻已缓存块的首尾主键继续查找（keyset），不使用 OFFSET；
+    没有相邻块时（拖动滚动条跳到远处）只在主键索引上定位该块首行，并从离它更近的一端数起。
+
+    查询（load / rows）在后台线程执行，set_query / cached_rows 在主线程调用：
+    已读取的块由锁保护；查询期间条件已变化时，读到的旧结果不会放入缓存。
+    """
+
+    def __init__(self, table, block_size=100, key="id", approx_threshold=0, max_blocks=10):
+        self.table = table
+        self.block_size = block_size
+        self.key = key
+        self.max_blocks = max_blocks
+        # 无筛选且估算行数达到该值时，只显示近似总数（0 表示始终精确统计）
+        self.approx_threshold = approx_threshold
+        self.approximate = False
+        self.total = 0
+        self._counts = {}
+        self._counts_version = None
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+        self._query = None
+        self._on_block = None
+
+    # ========== 统计 ==========
+    def _check_version(self, cursor) -> bool:
+        """
+        本连接的 total_changes 与 PRAGMA data_version（其他连接提交时变化）
+        任一变化即视为数据已写入，统计缓存与已读取的行全部失效；返回是否有变化。
+        """
+        conn = cursor.connection
+        version = (conn.total_changes, conn.execute("PRAGMA data_version").fetchone()[0])
+        if version == self._counts_version:
+            return False
+        self._counts.clear()
+        with self._lock:
+            self._blocks.clear()
+        self._counts_version = version
+        return True
+
+    def count(self, cursor, where, params) -> int:
+        """符合条件的总行数，按筛选条件缓存（数据写入后失效）"""
+        self._check_version(cursor)
+        cache_key = (tuple(where), tuple(params))
+        if cache_key not in self._counts:
+            self._counts[cache_key] = self._count(cursor, where, params)
+        total, self.approximate = self._counts[cache_key]
+        return total
+
+    def _count(self, cursor, where, params):
+        if not where and self.approx_threshold > 0:
+            # 主键两端各一次索引查找即可估算，删除过的记录会使估算偏大
+            cursor.execute(f"SELECT MAX({self.key}) - MIN({self.key}) + 1 FROM {self.table}")
+            estimate = cursor.fetchone()[0] or 0
+            if estimate >= self.approx_threshold:
+                return estimate, True
+        return self._exact_count(cursor, where, params), False
+
+    def _exact_count(self, cursor, where, params) -> int:
+        cursor.execute(f"SELECT COUNT(*) FROM {self.table}{where_sql(where)}", params)
+        return cursor.fetchone()[0]
+
+    def total_text(self, total) -> str:
+        """状态栏的总数文字"""
+        if self.approximate:
+            return f"约 {total} 条记录"
+        return f"共 {total} 条记录"
+
+    # ========== 查询 ==========
+    def set_query(self, columns, where, params, on_block=None):
+        """
+        （主线程）设置当前查询：columns 为查询列（SQL 片段），第一列必须是主键；
+        where / params 为 build_where 的结果。
+        on_block(cursor, 行列表) 在每块读取后调用一次，可补充不在表中的列（随块一起缓存）。
+        列或条件变化时清空已读取的行。
+        """
+        query = (columns, tuple(where), tuple(params))
+        with self._lock:
+            if query != self._query:
+                self._blocks.clear()
+                self._query = query
+            self._on_block = on_block
+
+    def current_filter(self):
+        """当前查询的 (条件列表, 参数列表)，批量操作“全部筛选结果”时使用"""
+        _, where, params = self._query
+        return list(where), list(params)
+
+    def load(self, cursor, start, count) -> int:
+        """（后台线程）统计当前查询的总数并预读第 start 行起的 count 行，返回总数"""
+        _, where, params = self._query
+        self.total = self.count(cursor, where, params)
+        self.rows(cursor, start, count)
+        return self.total
+
+    def rows(self, cursor, start, count) -> list:
+        """
+        （后台线程）从第 start 行（0 起）开始的 count 行 [{列名: 值}, ...]，到末尾时返回的行数会变少。
+        总数为估算值时读到末尾之前就没有数据了，此时精确统计一次并更新 self.total。
+        其他页面写入过数据时，已读取的块全部作废并重新统计，不会与新读取的块混在一起。
+        """
+        query = self._query
+        if self._check_version(cursor):
+            self.total = self.count(cursor, *query[1:])
+        result = self._collect(start, count, lambda block: self._block(cursor, query, block))
+        if len(result) < count and start + len(result) < self.total:
+            _, where, params = query
+            self.total, self.approximate = self._counts[(where, params)] = (
+                self._exact_count(cursor, where, params), False
+            )
+        return result
+
+    def cached_rows(self, start, count):
+        """（主线程）只从已读取的块中取行，有任何一块尚未读取时返回 None"""
+        with self._lock:
+            return self._collect(start, count, self._cached_block)
+
+    def _collect(self, start, count, get_block):
+        result = []
+        block = start // self.block_size
+        skip = start - block * self.block_size
+        while len(result) < count:
+            rows = get_block(block)
+            if rows is None:
+                return None
+            result += rows[skip:skip + count - len(result)]
+            if len(rows) < self.block_size:
+                break
+            block, skip = block + 1, 0
+        return result
+
+    def _cached_block(self, block):
+        rows = self._blocks.get(block)
+        if rows is not None:
+            self._blocks.move_to_end(block)
+        return rows
+
+    def _block(self, cursor, query, block):
+        with self._lock:
+            rows = self._cached_block(block)
+            if rows is not None:
+                return rows
+            before, after = self._blocks.get(block - 1), self._blocks.get(block + 1)
+            on_block = self._on_block
+        rows = [row_to_map(cursor, r) for r in self._load_block(cursor, query, block, before, after)]
+        if on_block and rows:
+            on_block(cursor, rows)
+        with self._lock:
+            if query == self._query:
+                self._blocks[block] = rows
+                while len(self._blocks) > self.max_blocks:
+                    self._blocks.popitem(last=False)
+        return rows
+
+    def _load_block(self, cursor, query, block, before, after):
+        key, size = self.key, self.block_size
+        if block == 0:
+            return self._seek(cursor, query, None, None, "DESC")
+        if before and len(before) == size:
+            # 紧接上一块末尾继续
+            return self._seek(cursor, query, f"{key} < ?", before[-1][key], "DESC")
+        if after:
+            # 从下一块开头往回取
+            rows = self._seek(cursor, query, f"{key} > ?", after[0][key], "ASC")
+            if len(rows) == size:
+                rows.reverse()
+                return rows
+        anchor = self._anchor(cursor, query, block * size)
+        if anchor is None:
+            return []
+        return self._seek(cursor, query, f"{key} <= ?", anchor, "DESC")
+
+    def _seek(self, cursor, query, cond, value, direction):
+        columns, where, params = query
+        clauses, args = list(where), list(params)
+        if cond:
+            clauses.append(cond)
+            args.append(value)
+        sql = f"SELECT {columns} FROM {self.table}{where_sql(clauses)} ORDER BY {self.key} {direction} LIMIT ?"
+        cursor.execute(sql, (*args, self.block_size))
+        return cursor.fetchall()
+
+    def _anchor(self, cursor, query, offset):
+        """定位第 offset 行的主键：只读取主键列，从离它更近的一端数起（近似总数时只从头数）"""
+        _, where, params = query
+        if self.approximate or offset <= self.total // 2:
+            direction = "DESC"
+        else:
+            direction, offset = "ASC", self.total - 1 - offset
+            if offset < 0:
+                return None
+        cursor.execute(
+            f"SELECT {self.key} FROM {self.table}{where_sql(where)} ORDER BY {self.key} {direction} LIMIT 1 OFFSET ?",
+            (*params, offset)
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
@@ -0,0 +1,130 @@
+"""
+录单时的联想查找：
+只返回排序后的前 N 条匹配，每一路条件都走索引（名称 / 电话前缀、拼音首字母、完整拼音、全文索引），
+不会把整张客户表或库存表读进内存。
+"""
+from data.fulltext import FTS_TABLES, MIN_MATCH_LENGTH, fts_available, match_query
+from data.pinyin import initials_clause
+
+# 联想列表默认条数
+DEFAULT_LIMIT = 20
+
+
+def glob_prefix(text) -> str:
+    """前缀匹配的 GLOB 模式，转义通配符（GLOB 前缀查找可以使用索引）"""
+    escaped = "".join(f"[{ch}]" if ch in "*?[" else ch for ch in text)
+    return escaped + "*"
+
+
+def _ranked_search(cursor, table, columns, base, branches, order, limit):
+    """
+    按多路条件查找并排序：branches 为 [(条件, 参数), ...]，越靠前的条件排名越高。
+    每一路只取前 limit 条，合并去重后按排名返回前 limit 条。
+    """
+    parts, params = [], []
+    for rank, (clause, clause_params) in enumerate(branches):
+        parts.append(
+            f'SELECT * FROM (SELECT id, {rank} AS rank FROM "{table}" WHERE {base} AND {clause} LIMIT ?)'
+        )
+        params += clause_params + [limit]
+    sql = (
+        f'SELECT {columns} FROM ('
+        + " UNION ALL ".join(parts)
+        + f') r JOIN "{table}" t ON t.id = r.id GROUP BY t.id ORDER BY MIN(r.rank), {order} LIMIT ?'
+    )
+    cursor.execute(sql, params + [limit])
+    return cursor.fetchall()
+
+
+def search_customers(cursor, text, limit=DEFAULT_LIMIT) -> list:
+    """
+    按名称、拼音首字母、完整拼音、电话、微信查找启用的客户，返回
+    [(id, customer_name, customer_phone, wechat_account, customer_address), ...]。
+    排名：名称完全匹配 > 名称前缀 > 首字母前缀 > 拼音前缀 > 电话前缀 > 名称 / 电话 / 微信包含。
+    关键字为空时返回最近新增的客户。
+    """
+    columns = "t.id, t.customer_name, t.customer_phone, t.wechat_account, t.customer_address"
+    base = "customer_status='启用'"
+    text = (text or "").strip()
+    if not text:
+        cursor.execute(
+            f"SELECT {columns} FROM customer t WHERE {base} ORDER BY t.id DESC LIMIT ?", (limit,)
+        )
+        return cursor.fetchall()
+
+    branches = [
+        ("customer_name = ?", [text]),
+        ("customer_name GLOB ?", [glob_prefix(text)]),
+    ]
+    initial = initials_clause("customer_name_initials", text)
+    if initial:
+        branches.append(initial)
+        branches.append(initials_clause("customer_name_pinyin", text))
+    if text.isdigit():
+        branches.append(("customer_phone GLOB ?", [glob_prefix(text)]))
+    if len(text) >= MIN_MATCH_LENGTH and fts_available(cursor.connection, "customer"):
+        fts = FTS_TABLES["customer"][0]
+        branches.append((
+            f"id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)",
+            [match_query("{customer_name customer_phone wechat_account}", text)]
+        ))
+    return _ranked_search(cursor, "customer", columns, base, branches, "t.id DESC", limit)
+
+
+# 商品联想 / 扫码返回的列
+PRODUCT_COLUMNS = "t.id, t.product_code, t.stock_code, t.cost_price, t.sell_price, t.size, t.color, t.material, t.stock_qty"
+
+
+def search_products(cursor, text, limit=DEFAULT_LIMIT) -> list:
+    """
+    按产品编码、库存编号、材质、颜色、尺寸查找启用的库存，返回
+    [(id, product_code, stock_code, cost_price, sell_price, size, color, material, stock_qty), ...]。
+    排名：编码完全匹配 > 产品编码前缀 > 库存编号前缀 > 材质 / 颜色 / 尺寸包含。
+    """
+    base = "stock_status='启用'"
+    text = (text or "").strip()
+    if not text:
+        cursor.execute(
+            f"SELECT {PRODUCT_COLUMNS} FROM inventory t WHERE {base} ORDER BY t.id DESC LIMIT ?", (limit,)
+        )
+        return cursor.fetchall()
+
+    branches = [
+        ("(product_code = ? OR stock_code = ?)", [text, text]),
+        ("product_code GLOB ?", [glob_prefix(text)]),
+        ("stock_code GLOB ?", [glob_prefix(text)]),
+    ]
+    if len(text) >= MIN_MATCH_LENGTH and fts_available(cursor.connection, "inventory"):
+        fts = FTS_TABLES["inventory"][0]
+        branches.append((
+            f"id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)",
+            [match_query("{material color size}", text)]
+        ))
+    else:
+        # 关键字太短无法用全文索引，找够 limit 条即停止扫描
+        like = f"%{text}%"
+        branches.append(("(material LIKE ? OR color LIKE ? OR size LIKE ?)", [like, like, like]))
+    return _ranked_search(cursor, "inventory", PRODUCT_COLUMNS, base, branches, "t.product_code", limit)
+
+
+def find_product(cursor, code):
+    """扫码：按产品编码或库存编号精确查找启用的库存，找不到返回 None"""
+    code = (code or "").strip()
+    if not code:
+        return None
+    cursor.execute(
+        f"SELECT {PRODUCT_COLUMNS} FROM inventory t WHERE stock_status='启用' AND product_code = ? "
+        f"UNION ALL SELECT {PRODUCT_COLUMNS} FROM inventory t WHERE stock_status='启用' AND stock_code = ? LIMIT 1",
+        (code, code)
+    )
+    return cursor.fetchone()
+
+
+def load_products(cursor, product_codes) -> dict:
+    """按产品编码批量读取库存信息（编辑已有订单时填充尺寸），返回 {product_code: 行}"""
+    codes = list(dict.fromkeys(c for c in product_codes if c))
+    if not codes:
+        return {}
+    placeholders = ",".join("?" * len(codes))
+    cursor.execute(f"SELECT {PRODUCT_COLUMNS} FROM inventory t WHERE t.product_code IN ({placeholders})", codes)
+    return {r[1]: r for r in cursor.fetchall()}
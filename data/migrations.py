@@ -0,0 +1,366 @@
+"""
+数据库版本迁移：
+每个迁移对应一个递增的版本号，已执行到的版本记录在 PRAGMA user_version 中。
+启动时只需读取一次 user_version，数据库已是最新时只额外检查一次被跳过的全文索引；
+新的表结构变更（加字段、建索引、拆表等）只需在 MIGRATIONS 末尾追加一项。
+"""
+import json
+import sqlite3
+
+from data.dashboard import create_counters
+from data.fulltext import FTS_TABLES, create_fts_tables
+from data.pinyin import full_pinyin, initials
+
+
+class MigrationError(Exception):
+    """迁移失败：数据库停留在上一个版本，程序不能继续启动"""
+
+
+# ========== v1：基础表结构 ==========
+def _v1_base_schema(cursor):
+    # ===== 客户表 =====
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS customer (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_name TEXT NOT NULL,
+        customer_status TEXT NOT NULL DEFAULT '启用',
+        customer_phone TEXT,
+        customer_address TEXT,
+        customer_email TEXT,
+        wrist_circumference REAL,
+        source_platform TEXT,
+        source_account TEXT,
+        wechat_account TEXT,
+        qq_account TEXT,
+        last_purchase_date TEXT,
+        total_purchase_amount REAL,
+        last_return_date TEXT,
+        total_return_amount REAL,
+        purchase_times INTEGER,
+        return_times INTEGER,
+        remark TEXT,
+        create_time TEXT,
+        update_time TEXT
+    );
+    """)
+
+    # ===== 库存表 =====
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS inventory (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stock_code TEXT NOT NULL,
+        stock_qty REAL NOT NULL DEFAULT 0.00,
+        stock_status TEXT NOT NULL,
+        product_code TEXT NOT NULL,
+        product_type TEXT,
+        wrist_circumference REAL,
+        weight_gram REAL,
+        price_per_gram REAL,
+        bead_diameter REAL,
+        unit_price REAL,
+        cost_price REAL,
+        sell_price REAL,
+        size TEXT,
+        color TEXT,
+        material TEXT,
+        element TEXT,
+        remark TEXT,
+        create_time TEXT,
+        update_time TEXT,
+        UNIQUE (product_code)
+    );
+    """)
+
+    # ===== 订单表 =====
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS "order" (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_no TEXT NOT NULL,
+        order_status TEXT NOT NULL,
+        customer_id TEXT,
+        customer_name TEXT,
+        address TEXT,
+        express_no TEXT,
+        sell_price REAL,
+        cost_price REAL,
+        detail TEXT,
+        remark TEXT,
+        create_time,
+        update_time
+    );
+    """)
+
+
+# ========== v2：补充字段 ==========
+def _v2_extra_columns(cursor):
+    """
+    补充后续版本新增的字段。
+    旧版本程序可能已经加过其中部分字段（当时没有记录版本号），
+    因此这里仍需检查一次现有字段；此迁移只会执行一次。
+    """
+    def get_table_columns(table_name: str) -> set:
+        cursor.execute(f'PRAGMA table_info("{table_name}")')
+        return {row[1] for row in cursor.fetchall()}
+
+    new_columns = [
+        # order 表：最终售价、运费、包装费（REAL，可空）
+        ("order", "final_sell_price", "REAL"),
+        ("order", "shipping_fee", "REAL"),
+        ("order", "packaging_fee", "REAL"),
+        # inventory 表：库存单位、克重单位、供应商（TEXT，可空）
+        ("inventory", "stock_unit", "TEXT"),
+        ("inventory", "weight_unit", "TEXT"),
+        ("inventory", "supplier", "TEXT"),
+        # customer 表：手围单位（TEXT，可空）
+        ("customer", "wrist_unit", "TEXT"),
+    ]
+    existing = {}
+    for table, column, col_type in new_columns:
+        if table not in existing:
+            existing[table] = get_table_columns(table)
+        if column not in existing[table]:
+            cursor.execute(f'ALTER TABLE "{table}" ADD COLUMN {column} {col_type}')
+
+
+# ========== v3：二级索引 ==========
+def _v3_indexes(cursor):
+    """覆盖各页面筛选、关联、排序所用字段"""
+    # 首页按状态计数、订单列表按状态筛选
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_status ON "order"(order_status)')
+    # 客户与订单关联、已下单客户去重计数
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_customer_id ON "order"(customer_id)')
+    # 订单号前缀查找（生成订单号）与精确查询
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_no ON "order"(order_no)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_create_time ON "order"(create_time)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_status ON customer(customer_status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_phone ON customer(customer_phone)')
+    # 库存编号前缀查找（生成库存编号）与精确查询
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_inventory_stock_code ON inventory(stock_code)')
+    # 首页零库存 / 低库存计数
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_inventory_stock_qty ON inventory(stock_qty)')
+    # 部分索引：仅启用库存按数量排序（库存告急 TOP 5）
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_inventory_enabled_qty ON inventory(stock_qty) "
+        "WHERE stock_status='启用'"
+    )
+
+
+# ========== v4：订单明细拆表 ==========
+def _v4_order_item(cursor):
+    """把 "order".detail 中的 JSON 明细拆到 order_item 表（detail 列保留原值，不再维护）"""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS order_item (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id INTEGER NOT NULL,
+        line_no INTEGER NOT NULL DEFAULT 0,
+        inventory_id INTEGER,
+        product_code TEXT NOT NULL,
+        qty REAL NOT NULL DEFAULT 0,
+        cost REAL,
+        sell REAL
+    );
+    """)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_item_order ON order_item(order_id, line_no)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_item_product ON order_item(product_code, order_id)')
+
+    # 删除订单时同步删除明细
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_order_delete_items AFTER DELETE ON "order"
+    BEGIN
+        DELETE FROM order_item WHERE order_id = OLD.id;
+    END;
+    """)
+
+    # 回填历史订单明细
+    def to_float(v):
+        try:
+            return float(v)
+        except (TypeError, ValueError):
+            return 0.0
+
+    cursor.execute("""SELECT id, detail FROM "order" WHERE detail IS NOT NULL AND detail != ''""")
+    rows = []
+    for order_id, detail_json in cursor.fetchall():
+        try:
+            details = json.loads(detail_json)
+        except (TypeError, ValueError):
+            print(f"⚠️  订单 ID {order_id} 的明细无法解析，已跳过")
+            continue
+        if not isinstance(details, list):
+            continue
+        for line_no, d in enumerate(details, start=1):
+            if not isinstance(d, dict) or not d.get("product_code"):
+                continue
+            rows.append((
+                order_id, line_no, d["product_code"], d["product_code"],
+                to_float(d.get("qty")), to_float(d.get("cost")), to_float(d.get("sell"))
+            ))
+    cursor.executemany(
+        """
+        INSERT INTO order_item (order_id, line_no, inventory_id, product_code, qty, cost, sell)
+        VALUES (?, ?, (SELECT id FROM inventory WHERE product_code=?), ?, ?, ?, ?)
+        """,
+        rows
+    )
+
+
+# ========== v5：全文检索 ==========
+def _v5_fulltext(cursor):
+    """
+    为搜索窗口的文本条件建立 FTS5 索引（需要 SQLite 3.34+ 的 trigram 分词）。
+    不支持时跳过建表，之后每次启动由 _ensure_fulltext 再检查，升级 SQLite 后补建。
+    """
+    error = _trigram_error(cursor)
+    if error:
+        print(f"⚠️  当前 SQLite 不支持 FTS5 trigram（{error}），搜索将继续使用 LIKE")
+        return
+    create_fts_tables(cursor)
+
+
+def _trigram_error(cursor):
+    """当前 SQLite 是否支持 FTS5 trigram 分词：支持时返回 None，否则返回错误信息"""
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(x, tokenize='trigram')")
+        cursor.execute("DROP TABLE temp.fts_probe")
+    except sqlite3.OperationalError as e:
+        return str(e)
+    return None
+
+
+def _ensure_fulltext(conn):
+    """v5 因不支持 trigram 跳过了建表时，SQLite 升级后在这里补建全文索引"""
+    fts_names = [fts for fts, _, _ in FTS_TABLES.values()]
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name IN ({','.join('?' * len(fts_names))})",
+        fts_names
+    )
+    if cursor.fetchone()[0] == len(fts_names) or _trigram_error(cursor):
+        return
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        create_fts_tables(cursor)
+        conn.commit()
+        print("✅ 已补建全文检索索引")
+    except Exception as e:
+        conn.rollback()
+        print(f"⚠️  补建全文检索索引失败：{e}")
+
+
+# ========== v6：客户名称拼音首字母 ==========
+def _v6_name_initials(cursor):
+    """客户名称的拼音首字母列（如 “张三丰” -> “zsf”），按前缀查找"""
+    cursor.execute("ALTER TABLE customer ADD COLUMN customer_name_initials TEXT")
+    cursor.execute("SELECT id, customer_name FROM customer")
+    cursor.executemany(
+        "UPDATE customer SET customer_name_initials=? WHERE id=?",
+        [(initials(name), cid) for cid, name in cursor.fetchall()]
+    )
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_name_initials ON customer(customer_name_initials)')
+
+
+# ========== v7：客户名称索引 ==========
+def _v7_customer_name_index(cursor):
+    """录单联想按客户名称完全匹配 / 前缀查找"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_name ON customer(customer_name)')
+
+
+# ========== v8：首页统计计数器 ==========
+def _v8_dashboard_counters(cursor):
+    """触发器维护的概览计数，以及客户排名所用索引"""
+    create_counters(cursor)
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_customer_purchase ON customer(purchase_times, total_purchase_amount)'
+    )
+
+
+# ========== v9：重新生成拼音首字母 ==========
+def _v9_refill_name_initials(cursor):
+    """首字母改用完整的汉字首字母表（原先二级汉字没有首字母、后面的位置错开），重新生成"""
+    cursor.execute("SELECT id, customer_name FROM customer")
+    cursor.executemany(
+        "UPDATE customer SET customer_name_initials=? WHERE id=?",
+        [(initials(name), cid) for cid, name in cursor.fetchall()]
+    )
+
+
+# ========== v10：清空已拆表的订单明细 JSON ==========
+def _v10_clear_order_detail(cursor):
+    """
+    v4 拆表时保留了 detail 原值，之后编辑订单不再更新，与 order_item 不一致；已有明细行的订单置空。
+    （已发布的 v4 不再修改，否则已执行过 v4 的数据库与新数据库结果不同；之后的修正都追加为新的迁移）
+    """
+    cursor.execute("""
+        UPDATE "order" SET detail=NULL
+        WHERE detail IS NOT NULL AND EXISTS (SELECT 1 FROM order_item WHERE order_id = "order".id)
+    """)
+
+
+# ========== v11：客户名称完整拼音 ==========
+def _v11_name_pinyin(cursor):
+    """
+    客户名称的完整拼音列（如 “张三丰” -> “zhangsanfeng”），按前缀查找；
+    多音姓氏表补充了乐、朴、盖等，首字母一并重新生成。
+    """
+    cursor.execute("ALTER TABLE customer ADD COLUMN customer_name_pinyin TEXT")
+    cursor.execute("SELECT id, customer_name FROM customer")
+    cursor.executemany(
+        "UPDATE customer SET customer_name_initials=?, customer_name_pinyin=? WHERE id=?",
+        [(initials(name), full_pinyin(name), cid) for cid, name in cursor.fetchall()]
+    )
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_name_pinyin ON customer(customer_name_pinyin)')
+
+
+# (版本号, 说明, 迁移函数)，版本号必须递增
+MIGRATIONS = [
+    (1, "基础表结构", _v1_base_schema),
+    (2, "补充字段", _v2_extra_columns),
+    (3, "二级索引", _v3_indexes),
+    (4, "订单明细拆表", _v4_order_item),
+    (5, "全文检索", _v5_fulltext),
+    (6, "客户名称拼音首字母", _v6_name_initials),
+    (7, "客户名称索引", _v7_customer_name_index),
+    (8, "首页统计计数器", _v8_dashboard_counters),
+    (9, "重新生成拼音首字母", _v9_refill_name_initials),
+    (10, "清空已拆表的订单明细 JSON", _v10_clear_order_detail),
+    (11, "客户名称完整拼音", _v11_name_pinyin),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection) -> int:
+    """
+    依次执行所有未执行的迁移，每个迁移在独立事务中完成并写入 user_version。
+    某个迁移失败时回滚该迁移并抛出 MigrationError，数据库保持在上一个版本。
+    返回执行后的版本号。
+    """
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        _ensure_fulltext(conn)
+        return version
+
+    cursor = conn.cursor()
+    for target, description, migrate in MIGRATIONS:
+        if target <= version:
+            continue
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            migrate(cursor)
+            # user_version 不支持参数绑定；target 为代码内常量
+            cursor.execute(f"PRAGMA user_version = {int(target)}")
+            conn.commit()
+            version = target
+            print(f"✅ 数据库已迁移到 v{target}：{description}")
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(f"迁移 v{target}（{description}）失败：{e}") from e
+
+    _ensure_fulltext(conn)
+    # 结构有变化后更新查询规划器统计信息
+    cursor.execute("PRAGMA optimize")
+    return version
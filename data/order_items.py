@@ -0,0 +1,79 @@
+"""
+订单明细（order_item 表）读写：
+订单明细原先以 JSON 存在 "order".detail 中，现拆为独立表，
+按订单、按产品的查询都可以直接走索引。
+"""
+import json
+
+
+def load_order_items(cursor, order_id) -> list:
+    """读取单个订单的明细，返回 [{product_code, qty, cost, sell}, ...]"""
+    cursor.execute(
+        "SELECT product_code, qty, cost, sell FROM order_item WHERE order_id=? ORDER BY line_no, id",
+        (order_id,)
+    )
+    return [
+        {"product_code": r[0], "qty": r[1], "cost": r[2], "sell": r[3]}
+        for r in cursor.fetchall()
+    ]
+
+
+def load_items_for_orders(cursor, order_ids) -> dict:
+    """批量读取多个订单的明细，返回 {order_id: [明细, ...]}（一次查询）"""
+    result = {}
+    ids = [int(oid) for oid in order_ids]
+    if not ids:
+        return result
+    cursor.execute(
+        "SELECT order_id, product_code, qty, cost, sell FROM order_item "
+        "WHERE order_id IN (SELECT value FROM json_each(?)) ORDER BY order_id, line_no, id",
+        (json.dumps(ids),)
+    )
+    for order_id, product_code, qty, cost, sell in cursor.fetchall():
+        result.setdefault(order_id, []).append(
+            {"product_code": product_code, "qty": qty, "cost": cost, "sell": sell}
+        )
+    return result
+
+
+def save_order_items(cursor, order_id, details):
+    """整体替换订单明细（调用方负责提交事务）"""
+    cursor.execute("DELETE FROM order_item WHERE order_id=?", (order_id,))
+    cursor.executemany(
+        """
+        INSERT INTO order_item (order_id, line_no, inventory_id, product_code, qty, cost, sell)
+        VALUES (?, ?, (SELECT id FROM inventory WHERE product_code=?), ?, ?, ?, ?)
+        """,
+        [
+            (order_id, line_no, d["product_code"], d["product_code"], d["qty"], d["cost"], d["sell"])
+            for line_no, d in enumerate(details, start=1)
+        ]
+    )
+
+
+def restore_stock_for_orders(cursor, order_ids):
+    """把多个订单的明细数量合计后加回库存，一条语句完成（调用方负责事务）"""
+    ids = json.dumps([int(oid) for oid in order_ids])
+    cursor.execute(
+        """
+        UPDATE inventory SET stock_qty = stock_qty + (
+            SELECT SUM(oi.qty) FROM order_item oi
+            WHERE oi.order_id IN (SELECT value FROM json_each(?))
+              AND oi.product_code = inventory.product_code AND oi.qty > 0
+        )
+        WHERE product_code IN (
+            SELECT product_code FROM order_item
+            WHERE order_id IN (SELECT value FROM json_each(?)) AND qty > 0
+        )
+        """,
+        (ids, ids)
+    )
+
+
+def format_items(items) -> str:
+    """列表“明细”列的展示文本"""
+    return "; ".join(
+        f"产品:{d.get('product_code', '')} 数量:{d.get('qty', 0)} "
+        f"成本:{d.get('cost', 0)} 售价:{d.get('sell', 0)}"
+        for d in items
+    )
@@ -0,0 +1,180 @@
+"""
+订单状态转换（完成 / 送达 / 转为草稿 / 退货），单个订单与批量操作共用这一份实现：
+先在同一个事务（BEGIN IMMEDIATE）中一次读出全部订单并逐条校验，
+不满足条件的订单记入失败原因并跳过，其余订单的库存、客户记录与状态合并为少量语句执行，最后一次提交。
+完成订单时按产品合计检查库存：按订单ID 顺序分配，库存不够分配的订单失败，不影响其他订单。
+"""
+import datetime
+import json
+from collections import defaultdict
+
+from data.order_items import load_items_for_orders, restore_stock_for_orders
+
+# 目标状态 -> 允许的原状态
+SOURCE_STATUS = {
+    "已完成": "草稿",
+    "已送达": "已完成",
+    "草稿": "已完成",
+    "已退货": "已送达",
+}
+
+
+def _load_orders(cursor, order_ids) -> dict:
+    """{订单ID: (状态, 订单号, 客户ID, 实际售价)}；实际售价优先使用最终售价"""
+    cursor.execute(
+        'SELECT id, order_status, order_no, customer_id, final_sell_price, sell_price FROM "order" '
+        "WHERE id IN (SELECT value FROM json_each(?))",
+        (json.dumps([int(oid) for oid in order_ids]),)
+    )
+    return {
+        r[0]: (r[1], r[2], r[3], float(r[4] or r[5] or 0))
+        for r in cursor.fetchall()
+    }
+
+
+def stock_needs(items) -> dict:
+    """订单明细按产品合计需要扣减的数量 {产品编码: 数量}（忽略无产品编码或数量不大于 0 的行）"""
+    need = defaultdict(float)
+    for item in items:
+        qty = float(item.get("qty") or 0)
+        if item.get("product_code") and qty > 0:
+            need[item["product_code"]] += qty
+    return dict(need)
+
+
+def stock_levels(cursor, codes) -> dict:
+    """一次查询多个产品的当前库存 {产品编码: 库存}"""
+    cursor.execute(
+        "SELECT product_code, stock_qty FROM inventory WHERE product_code IN (SELECT value FROM json_each(?))",
+        (json.dumps(sorted(codes)),)
+    )
+    levels = {}
+    for code, stock in cursor.fetchall():
+        levels.setdefault(code, float(stock or 0))
+    return levels
+
+
+def deduct_stock(cursor, totals):
+    """
+    按产品扣减库存，每条 UPDATE 带 stock_qty >= 数量 的条件，库存不足时不会扣成负数。
+    有产品没有扣减成功（库存已被其他终端改动）时抛出异常，由调用方回滚整个事务。
+    """
+    for code, qty in totals.items():
+        cursor.execute(
+            "UPDATE inventory SET stock_qty = stock_qty - ? WHERE product_code=? AND stock_qty >= ?",
+            (qty, code, qty)
+        )
+        if cursor.rowcount == 0:
+            raise Exception(f"产品 {code} 库存不足或已被其他终端修改，请刷新后重试！")
+
+
+def _allocate_stock(cursor, order_ids, failures) -> list:
+    """按产品合计检查库存，返回库存足够的订单ID；不满足的订单写入 failures"""
+    items_map = load_items_for_orders(cursor, order_ids)
+    needs = {}
+    for oid in order_ids:
+        if not items_map.get(oid):
+            failures[oid] = "订单明细为空，无法完成！"
+        else:
+            needs[oid] = stock_needs(items_map[oid])
+
+    available = stock_levels(cursor, {code for need in needs.values() for code in need})
+    ok = []
+    for oid, need in needs.items():
+        for code, qty in need.items():
+            if code not in available:
+                failures[oid] = f"产品 {code} 不存在于库存中！"
+                break
+            if available[code] < qty:
+                failures[oid] = f"产品 {code} 库存不足（可用 {available[code]:g}，需要 {qty:g}）"
+                break
+        else:
+            for code, qty in need.items():
+                available[code] -= qty
+            ok.append(oid)
+
+    totals = defaultdict(float)
+    for oid in ok:
+        for code, qty in needs[oid].items():
+            totals[code] += qty
+    deduct_stock(cursor, totals)
+    return ok
+
+
+def _per_customer(orders, order_ids) -> list:
+    """按客户合计：[(客户ID, 金额合计, 订单数), ...]"""
+    totals = defaultdict(lambda: [0.0, 0])
+    for oid in order_ids:
+        _, _, customer_id, price = orders[oid]
+        totals[customer_id][0] += price
+        totals[customer_id][1] += 1
+    return [(cid, amount, times) for cid, (amount, times) in totals.items()]
+
+
+def batch_transition(conn, order_ids, target, rollback_stock=True, rollback_purchase=True, add_return=True):
+    """
+    把多个订单转为 target 状态，全部在一个事务中完成。
+    返回 (成功的订单ID 列表, {失败的订单ID: 原因}, {订单ID: 订单号})；执行出错时整体回滚并抛出异常。
+    rollback_stock 用于转为草稿 / 退货，rollback_purchase、add_return 用于退货，与单个订单操作的选项一致。
+    """
+    source = SOURCE_STATUS[target]
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        orders = _load_orders(cursor, order_ids)
+        failures = {}
+        valid = []
+        for oid in sorted(int(o) for o in order_ids):
+            if oid not in orders:
+                failures[oid] = "订单不存在！"
+            elif orders[oid][0] != source:
+                failures[oid] = f"状态为 {orders[oid][0]}，只有{source}状态的订单可以转为{target}"
+            else:
+                valid.append(oid)
+
+        if target == "已完成":
+            valid = _allocate_stock(cursor, valid, failures)
+        elif target == "已送达":
+            cursor.executemany("""
+                UPDATE customer SET
+                    last_purchase_date = ?,
+                    total_purchase_amount = COALESCE(total_purchase_amount, 0) + ?,
+                    purchase_times = COALESCE(purchase_times, 0) + ?,
+                    update_time = ?
+                WHERE id = ?
+            """, [(now, amount, times, now, cid) for cid, amount, times in _per_customer(orders, valid)])
+        elif target == "已退货":
+            customers = _per_customer(orders, valid)
+            if rollback_purchase:
+                cursor.executemany("""
+                    UPDATE customer SET
+                        total_purchase_amount = COALESCE(total_purchase_amount, 0) - ?,
+                        purchase_times = COALESCE(purchase_times, 0) - ?,
+                        update_time = ?
+                    WHERE id = ?
+                """, [(amount, times, now, cid) for cid, amount, times in customers])
+            if add_return:
+                cursor.executemany("""
+                    UPDATE customer SET
+                        last_return_date = ?,
+                        total_return_amount = COALESCE(total_return_amount, 0) + ?,
+                        return_times = COALESCE(return_times, 0) + ?,
+                        update_time = ?
+                    WHERE id = ?
+                """, [(now, amount, times, now, cid) for cid, amount, times in customers])
+
+        if target in ("草稿", "已退货") and rollback_stock and valid:
+            restore_stock_for_orders(cursor, valid)
+
+        # 状态已在本事务内读取并校验，条件中再带上原状态，防止重复转换
+        cursor.executemany(
+            'UPDATE "order" SET order_status=?, update_time=? WHERE id=? AND order_status=?',
+            [(target, now, oid, source) for oid in valid]
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    order_nos = {oid: info[1] for oid, info in orders.items()}
+    return valid, dict(sorted(failures.items())), order_nos
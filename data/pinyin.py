@@ -0,0 +1,94 @@
+"""
+拼音与拼音首字母：
+按随程序打包的汉字拼音表（data/pinyin_table.py，覆盖常用与生僻 CJK 汉字）取不带声调的拼音，
+不依赖第三方拼音库。多音字取最常用读音，名称首字为常见多音姓氏时按姓氏读音。
+表中没有读音的汉字（及其他文字）记为占位符 “_”，后面各字的首字母位置不会错开。
+"""
+from data.pinyin_table import BLOCKS, SYLLABLES
+
+# 不在拼音表中的汉字 / 其他文字的占位符（不是字母，不会与关键字匹配）
+UNKNOWN = "_"
+
+# 编码串中的 62 进制数字
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGIT_VALUE = {d: i for i, d in enumerate(_DIGITS)}
+
+# 常见多音姓氏：名称首字按姓氏读音
+_SURNAMES = {
+    "曾": "zeng", "单": "shan", "解": "xie", "仇": "qiu", "查": "zha",
+    "区": "ou", "尉": "yu", "覃": "qin", "翟": "zhai", "乐": "yue",
+    "朴": "piao", "盖": "ge", "缪": "miao", "繁": "po", "员": "yun",
+    "召": "shao", "秘": "bi", "种": "chong", "折": "she", "句": "gou",
+    "长": "chang", "宓": "fu", "隗": "wei", "冼": "xian",
+}
+
+
+def char_pinyin(ch) -> str:
+    """单个字符的拼音：字母数字原样（小写），汉字取不带声调的拼音，其他文字为占位符，符号为空"""
+    if ch.isascii():
+        return ch.lower() if ch.isalnum() else ""
+    code = ord(ch)
+    for start, codes in BLOCKS:
+        offset = (code - start) * 2
+        if 0 <= offset < len(codes):
+            index = _DIGIT_VALUE[codes[offset]] * 62 + _DIGIT_VALUE[codes[offset + 1]]
+            return SYLLABLES[index] or UNKNOWN
+    return UNKNOWN if ch.isalnum() else ""
+
+
+def syllables(text) -> list:
+    """文本逐字的拼音（符号不计），名称首字为多音姓氏时按姓氏读音"""
+    text = (text or "").strip()
+    if not text:
+        return []
+    first = _SURNAMES.get(text[0]) or char_pinyin(text[0])
+    return [p for p in [first] + [char_pinyin(ch) for ch in text[1:]] if p]
+
+
+def char_initial(ch) -> str:
+    """单个字符的首字母（拼音的第一个字母）"""
+    return char_pinyin(ch)[:1]
+
+
+def initials(text) -> str:
+    """文本的拼音首字母串，例如 “张三丰” -> “zsf”，“王梓涵” -> “wzh”"""
+    return "".join(p[0] for p in syllables(text))
+
+
+def full_pinyin(text) -> str:
+    """文本的完整拼音（不带声调、不分隔），例如 “张三丰” -> “zhangsanfeng”，“乐嘉” -> “yuejia”"""
+    return "".join(syllables(text))
+
+
+def is_initials_query(val) -> bool:
+    """关键字是否可能是拼音或首字母（只含英文字母）"""
+    return bool(val) and val.isascii() and val.isalpha()
+
+
+def initials_clause(column, val):
+    """
+    拼音 / 首字母前缀匹配条件 (条件, 参数)，关键字不是字母时返回 None。
+    拼音列与首字母列统一存小写，GLOB 前缀匹配可以使用该列索引。
+    """
+    if not is_initials_query(val):
+        return None
+    return f"{column} GLOB ?", [val.lower() + "*"]
+
+
+def name_filter(name_clause=None, column="customer_name", initials_column="customer_name_initials",
+                pinyin_column="customer_name_pinyin"):
+    """
+    名称搜索条件函数 val -> (条件, 参数)，供 build_where 的 special 使用：
+    名称本身按 name_clause（如全文索引）或 LIKE 匹配，关键字为字母时再匹配首字母前缀与完整拼音前缀。
+    """
+    def clause(val):
+        if name_clause:
+            name_sql, params = name_clause(val)
+        else:
+            name_sql, params = f"{column} LIKE ?", [f"%{val}%"]
+        initial = initials_clause(initials_column, val)
+        if initial is None:
+            return name_sql, params
+        spelled = initials_clause(pinyin_column, val)
+        return f"({name_sql} OR {initial[0]} OR {spelled[0]})", params + initial[1] + spelled[1]
+    return clause
@@ -0,0 +1,603 @@
+"""
+汉字拼音表（离线，随程序打包）：
+覆盖 CJK 统一汉字（U+4E00–U+9FFF）与扩展 A 区（U+3400–U+4DBF），每个字对应一个不带声调的拼音（ü 写作 v），
+多音字取最常用读音。每个字在编码串中占两个字符，按 62 进制（0-9a-zA-Z）表示 SYLLABLES 中的序号，
+序号 0 表示没有读音数据。
+由 pypinyin 0.55（MIT 许可）的 pinyin_dict 生成，程序运行时不依赖该库。
+"""
+
+# 拼音音节，序号 0 为空（没有读音数据）
+SYLLABLES = (
+    "", "a", "ai", "an", "ang", "ao", "ba", "bai", "ban", "bang", "bao", "bei", "ben", "beng", "bi",
+    "bian", "biao", "bie", "bin", "bing", "bo", "bu", "ca", "cai", "can", "cang", "cao", "ce", "cen",
+    "ceng", "cha", "chai", "chan", "chang", "chao", "che", "chen", "cheng", "chi", "chong", "chou",
+    "chu", "chua", "chuai", "chuan", "chuang", "chui", "chun", "chuo", "ci", "cong", "cou", "cu",
+    "cuan", "cui", "cun", "cuo", "da", "dai", "dan", "dang", "dao", "de", "den", "deng", "di",
+    "dian", "diao", "die", "ding", "diu", "dong", "dou", "du", "duan", "dui", "dun", "duo", "e",
+    "ei", "en", "eng", "er", "fa", "fan", "fang", "fei", "fen", "feng", "fiao", "fo", "fou", "fu",
+    "ga", "gai", "gan", "gang", "gao", "ge", "gei", "gen", "geng", "gong", "gou", "gu", "gua",
+    "guai", "guan", "guang", "gui", "gun", "guo", "ha", "hai", "han", "hang", "hao", "he", "hei",
+    "hen", "heng", "hm", "hong", "hou", "hu", "hua", "huai", "huan", "huang", "hui", "hun", "huo",
+    "ji", "jia", "jian", "jiang", "jiao", "jie", "jin", "jing", "jiong", "jiu", "ju", "juan", "jue",
+    "jun", "ka", "kai", "kan", "kang", "kao", "ke", "ken", "keng", "kong", "kou", "ku", "kua",
+    "kuai", "kuan", "kuang", "kui", "kun", "kuo", "la", "lai", "lan", "lang", "lao", "le", "lei",
+    "leng", "li", "lia", "lian", "liang", "liao", "lie", "lin", "ling", "liu", "lo", "long", "lou",
+    "lu", "luan", "lun", "luo", "lve", "m", "ma", "mai", "man", "mang", "mao", "me", "mei", "men",
+    "meng", "mi", "mian", "miao", "mie", "min", "ming", "miu", "mo", "mou", "mu", "n", "na", "nai",
+    "nan", "nang", "nao", "ne", "nei", "nen", "neng", "ni", "nian", "niang", "niao", "nie", "nin",
+    "ning", "niu", "nong", "nou", "nu", "nuan", "nun", "nuo", "nve", "o", "ou", "pa", "pai", "pan",
+    "pang", "pao", "pei", "pen", "peng", "pi", "pian", "piao", "pie", "pin", "ping", "po", "pou",
+    "pu", "qi", "qia", "qian", "qiang", "qiao", "qie", "qin", "qing", "qiong", "qiu", "qu", "quan",
+    "que", "qun", "ran", "rang", "rao", "re", "ren", "reng", "ri", "rong", "rou", "ru", "rua",
+    "ruan", "rui", "run", "ruo", "sa", "sai", "san", "sang", "sao", "se", "sen", "seng", "sha",
+    "shai", "shan", "shang", "shao", "she", "shen", "sheng", "shi", "shou", "shu", "shua", "shuai",
+    "shuan", "shuang", "shui", "shun", "shuo", "si", "song", "sou", "su", "suan", "sui", "sun",
+    "suo", "ta", "tai", "tan", "tang", "tao", "te", "teng", "ti", "tian", "tiao", "tie", "ting",
+    "tong", "tou", "tu", "tuan", "tui", "tun", "tuo", "wa", "wai", "wan", "wang", "wei", "wen",
+    "weng", "wo", "wu", "xi", "xia", "xian", "xiang", "xiao", "xie", "xin", "xing", "xiong", "xiu",
+    "xu", "xuan", "xue", "xun", "ya", "yan", "yang", "yao", "ye", "yi", "yin", "ying", "yo", "yong",
+    "you", "yu", "yuan", "yue", "yun", "za", "zai", "zan", "zang", "zao", "ze", "zei", "zen", "zeng",
+    "zha", "zhai", "zhan", "zhang", "zhao", "zhe", "zhen", "zheng", "zhi", "zhong", "zhou", "zhu",
+    "zhua", "zhuai", "zhuan", "zhuang", "zhui", "zhun", "zhuo", "zi", "zong", "zou", "zu", "zuan",
+    "zui", "zun", "zuo",
+)
+
+# (区块起始码位, 编码串)，编码串第 2i、2i+1 个字符对应码位 起始 + i
+BLOCKS = (
+    (0x3400, (
+        "4e5e00002x5x5S00000000005R0000000000000000005D00000000000E000000003K00000X0000005I5F005G2U2S5B5V5E6g"
+        "0W5x3Q4s0034475R5S3u0B1q0000006s1n055x6A006k19515R4d2A2K3s6l4Q0000005I00004M2d163K515R2W5T0d0000002G"
+        "3f5R2M285X310v000000265I254l006k001Q5y575P252l3432595P6e6b5X6s1k4j450C5x1Q594D4Y4d2K4y00002B44564Q5O"
+        "3N57003e5S155X3g2l3A5D5W00000z1q2K2M00310028000000004g000n2P1G38001H53000038364g4O2M005s2v1b6g5h0000"
+        "0j27191E0B004b2g2Y5F003q5D000e2d51001E005W5F463W141u31464659071x0N5J2H00004L152M215j3X134u1g4a5R6s4v"
+        "2a000C0D5y0032122S2k515C6300006l6c2a6v0G5D2M000C5y2a0028001o0F0d2d00062P2y005z0h2k2K5E075O2Y0b1g2Y00"
+        "000z3K5J1W5X001L5R5J1E2X5d2J4O00545P5A6v004h5S5y6i29202E5R2r1u4b02002r0F5D0F5t000023515W002l6e5I4O00"
+        "4R2B4U1T1w5N4e4M215y1m3R0X1n1E051u3t5K5W21000A1N3n212M1l5C43004Y00002J2S5R1Z005I4f1k00005L000000003B"
+        "5t5D5d1Y5n3B3B5S6g00000000005q4P3K5Q455j1Q2l19262Y2i272T005e300000000000001A5N4O5K3U0L3E1f661g5D5W1g"
+        "4N5u2w201A5z3632281Z6i00005q0007026q471F0X0b0k0F2M5C5H00000000001Y5d0Q2D2I6i5D5y004a6a5y00000O282756"
+        "5N5I424z0000001N5Q5B5K1T6A5R0N002L5A574q5R6i5y5A2i281Q003S2M002G4z1Q5N4f005N1Q2o0C3B27000e5z5v5J5r5W"
+        "4b5I3B0e1S2f050500006g582i006A0l2d02640N1l000000003B2U3a1d090e0a000F5z5e0x00001f5t1u1f5X5Q2B5t2y005t"
+        "5P2W5F0l0C5D3B2H5R6u366d5z1M5D00282Q5R285S000V5R5D1S5V2o0w57596i0a3c2B0w2K005y005y493r60002W1u6u001G"
+        "2n15212B001z5a004I2F3B1u1z4a08292u5y5X6q4M0M5C283H5C5R5X5R5N4M4j1S4y2l5W005E3T4e0w000l194Y1k00386028"
+        "00495G3S0F3V3K2d5R1k1f0000001f00004a2Y4e500o1a5y1q5R554a425E5i5E5W0b2W00000000602M562G36486k5N5y2Y5y"
+        "4C1m005t1l5R3s0B58284Q3X032x0u005A6i00001q2O5L5I3d253m5V6c5R3G595y604Q1u5R0V002O0q0o2i2Y513v05034700"
+        "0S0O004j3y355E5Z3p054M3400002G5y5Z6i5v223c3A5r3d3B4f632O6i6t1P5I1S5J6i3e0L1F000L2Z6l4P2Q2h5D172d4q37"
+        "002r5P3D5R2H5V5S5N51002S5M383i6y5X5R1F3d2l5u002p142W005F0S493e3c4b005r1002000f3G2O2e5X0K6A0k255P5m28"
+        "0331285t0k615I3y6000066f2i5t5D455R5D0N4e1b3A45285m004Z142I6c00005S0s28256t2G3s2i4b0W002d5I0O5V1a0C00"
+        "3h24532r6w1S0B5K3x0C2O033m4Y5B5O210U4e2I1u1d372H5o1Q370k4i451Q002W0i5f6645633d3T6c5B1y0045002Y00601g"
+        "1c3h5t4g503h5k003i5P2k2M2y1y5Y0V002I2X47050g5V370Z0005005y1u0X2h4w5i4f1g452828212c6y0g3c075t5R055X1S"
+        "1d5w3x0R002M2Y3A222M002Y1q3d5X002i00006c3V5R00280e004n241m1A2w2d4G004Y5i5Y6t0e2x2M245L3K006f5u5A465Q"
+        "3800004Q00496r2C5x5T0J5d2O0e1F375D1q2X656h0F362W005S406h2a2Z3B5R0028286b5X2h236i2E2T6i0c6a2i0X2Q5R6e"
+        "5A0C0N0C5N2H1a2W0w005m0u020C005T6f5j005m0u5P6u003Q492O4b2Y5N2p515R0w2g2b002f0019002j1Q1300001Y000C15"
+        "0e005L2Y005D0e000e005A4v0h1k2j006g0b1g5X4f633d5R4Y0000004I573m2f0f4q0t0o1700000000135i565F4Z1f5y5a00"
+        "5d4I2a6i5t5S0000236j456u005D5D665t0000566c3D00005E5R4n4Q0u6s003e281n3T021m054b465C1p1x491A5i0w5W1z0c"
+        "1u0F6l006k001R3C2k0D0u2u2R2M5X005X1P2M1Z1E2r5Y1025001K2g6A1u4a0b0z0N371Q5y4e2400000E4A5N6i105b3b2T4P"
+        "5m0o160z3V5R2i282F5e5Y000n455X2O0O0000005X285t3d535D5I0C4e25005X4a4W4V1f2X003R576k5S4C1o0A5Y5R264D5Q"
+        "3h1p1T005S0r3x051q2O0x0w3416202Y005R216a201g27543x5A2M5A5N2W3b2e28000f5X273f0E35002J2d5t5R5J5y0o2G5S"
+        "5D61312T47272a5w00001A6l165V285O4s5y4U5X5R47284f5e4P473m2e385S1w425J381n5M1y4Z255X1H1I2U1g6t6t0e5p00"
+        "2R00002y001P5S6l0D5A5J004e3T1L1k1E4d202I2M0A4A6s5w432t5n3V5b566s0g1G20000j6i191d6k3u2S42283h5t0z1F09"
+        "4s580l6u2B2I1Q5T6i2d5F5D5L4I475D511P3d263W00253o4Z0c0E2d242G00201a271M5P0r1L2a2a0Z2e34253e0o323W5O2i"
+        "2i4h00474H002h27600V5J5C1o0r5Q0011004b255n00485y3x4z3c5l2G1S0N6b05313g001u005D0k254c5D00000k47422c2k"
+        "2C4Z2i1g3B47161600456i456q2w5X4b2w1T1u1D135A1L1T4i1Q5i0k4I0e2Y5Q3x0H4A152Y5j2O2r4A6g0H2O3800472n4K5C"
+        "0e6a5S5y4I514y4v0M2Y2T0u002300002908201a002X2i2j2r55316f171c6l5N3R0u000000005R00005W255P5P6i1E451C00"
+        "001Z3d1u201K5813005N00004f000x3i5a0a0300005A000000382H3q0b0A001o6k282d4Q002C162Y000000005X570w363h23"
+        "5u3I231Z2f0k5A2M2e00373Y1S5O005A515t0z5y2e0t1T1p4H2T001d45445Z0k0025165N2i2c3q2R5X5d5e5x1Y5C1S005f6h"
+        "00241u00005n004o2c005E00005Y2k2100093l001y5t003a4Y0f2Y4f00001A6f2Y3P4q4e2R1E5A5y5E003A0000005D2R1u0U"
+        "6s066A6f6y1T28002a0000005k5A5N5956132k041Q5C2i5t096q3B5e3p00005W3e00003p4N0u5N1C0D4u294b381g2M0C641T"
+        "2d3y001J1Z1w000c555x285y4d1T5v5A2d263W4M0E6g006c4X284Z6i0c0000002H0e5J3T0W456i3W0w0e51271V2g0I2b3v1G"
+        "1n0000560S5y105A2z6f56200S2Y2j2Y473S6g002M0q4500005d2T4f2O2Y4Q1E6f3S2e4c00006u442e0g2a1M000i652R2M31"
+        "4M3e2a130b002O005A404h2W6y002k4I5K005D002G455R3K2M5Z005R0C281R5D2t6t1T5y4f1P5z1P1L0w5L5I4M2v5z4G5X5M"
+        "436w5W6t2O5A5z5R4G5N2c5y0C4O2p5S1U5R5y4D2e5Q5W4h5Q2Z2C6h000000005D000S5H035H0o0I6a005R3W2w4N2H5m5y2T"
+        "455w2O1b3b2G5t1c2y0262255R3k6t1p3V000e2M2Y311P6g1w4h6g2u0B2h2k282T004K4h4v0M3w6i2X3S00000a4q5A2K5C1u"
+        "4f004G6i584q515T383p0f004S591Q4C4q0012442c58004j3D2R16166j002Y0X5y1L283x5R3y5X5s1N665N0S5A2c5j1u3T00"
+        "5W4e5M0l0f4O6a5R0f001d2G5R0v0D5J5I5X5H000000561N0000002W5D0z2a583W635J5A3A00000000003d283G20215s5W66"
+        "0e3d485D1m5R582K5V002e4L5S28005100003p5s3e515R4H5R28315W386a536i0f2M00000000000000491J5y6g5V3B2l5D5P"
+        "5D6i3w004Y2W0A3d4h0X4I000000515D0k176w004Q4L1Q581z0000003o3d5L3b2a0S2k1T1o4O0z4M3H4136000000005R0E00"
+        "2w0a2K2r4G3d531A3W5R5A3x5T6l0L1q5I3Y5x2Q0p6v6A0f5P233P5H002K4c5C2c1N00005N5K6l1W5T5y00002O5A235S002O"
+        "4I0p0b2a4Q1m1400065X00003r2K5R0W000w0y1x2e3v0000002Q3k5W002U1Q005V2e0C4n3F00001Y5e00021H0g0k4d004Q0K"
+        "250y1u251g5t1p5800301T5V25005X6u5N4e6e2g570000000000005m2S2g6a5F20005I0000000S4c3k00650d0C00005N1A3k"
+        "0b2j166e005x5N002k5A571Q0014282d2q6x005D2F1m275y3B3d4j0R5S3d002k4f5i5r6f2M4K2u5A6f6i5f4Q0b5Q3X0w202s"
+        "2h030L470b061p2r5o5o6A2T001L5N4O1Z2R4G4Y000b4n1b0k2P471o286u251T2M5Y5Z5H0w132K2e0D4Y445P2b23235a4s5v"
+        "5T4l5S4O5S2k5n5J296j4a6l15005W00005R4O5R3k00004h5C5x1D5T5h4O3x1D565w2i0w3Y6s203s5N1F5X1Z004Y0C205O5v"
+        "5A404q2X2I4I5C661P1m1Q0w6c00566l3F1Q5X6s5W2M275y5A0w2O004Y2h444e1E6t5X00004o3E3a062h005I410f38000000"
+        "005R5X00414f0a250000000l372E5k5x2M2T00282l6v1f2k0W0b00000000002E0i535k5K00000000001f0000530e5k4D0o5k"
+        "3e2e2Y00006c0e28685J2M0000535V4Q00001g0000005T4d316g5n1G5X2K0k3u3X2O592O5u0Y2M5h5p6k1y5F041m3V0k5o4Q"
+        "5R0k4a5j1E5i1Q0B2d235F140v193W4u2R4N3N135X0I4q2p590O3Y0J2Y5i6h2M4y3Q4Y000Y205R5A5D312U00581x00580000"
+        "005W3q001y2l0C1F5r2M2U2R5z0b035X2i4r5L6t0U0o695V1u4u005y4Q2c2c5I6d00004V0A1m286i001G5x004a4Q1P5o1b6t"
+        "4j3m1u2T285H5J3p5M2d2M0V4s5Y2Y4M2M2P1D5E5D4b4a0z5W0l2A4h024b480F3T2D5R1I4N3X006k2425200b00006a281G5y"
+        "1z0v346l5m6q5A2H0000006i025A1N5y005m0o4C5A2d1p4i005P0Z292K5N2Y5m5T3W312M0h00380724005P1T0L1T3D0E2M59"
+        "230e060z5O0V055K006t0V4j090U5r560a1x5N5y6l5M1m5W035m3c4L2e1G28492c5N5y2o3e5J4I5w47234n6g5e2k5D45043a"
+        "1G005a1m2i0w4W0e384X1G1Y21311R294g1w240l1G1q3m025T4W2P2d0C2d0E410A5N1b13002P5A0g5F3c5Q3d45455w5D5X46"
+        "0B5P5T5O286u5J3h2X2n5P5N541L245T4N0u2O005J0I0z3x4f3f275X6c200t0g475y2b2v35376c0f282k3r0e4O4X3k2R3g3k"
+        "5y0w4f2c275A5I3E5i1Z5X000D0k6x156s2846005F254O2w001d5P5X092d6f294O13190N1u3h6g6g005N491R1E49321I2E4v"
+        "1l0U5N1E2d1I1N555w6h3B152F560S5M1M000013003e2d3h2i5X6g6e6a5F00081T1F1Y2I5x0k2t2Y0Q2O5R494Q005J2e4b25"
+        "510J1e2W003s580X5t1x0V2M0m5A3Q2E6l3A225T5A2G3k06001L0e1u275R2U5O5S2j270B1a1g005N6q6a455X4g273B242i4L"
+        "00003V3i0q2X2M0J000S4I0X45002F2T2Q4o5X5R15455R3y1u2a5M1n4v5A00000e4O423y6i5a5e5e4s5R2R031T4d2M1L6t51"
+        "5Y5M0u5r2j5h5W252a4v372i6t2i03532F264g0x1f2u3t0o5d5I2h24452d385N006i5m00023R0p591i26450F556s3G5k4M2X"
+        "0g2M365E0s213a1z2O0Z6c6t00006i060S4e002W5A1o1N0B2h1g0D5Z1Y5P5M5P5i6a5W5K5P2r232H5Z0A00004M003D3i1Y0J"
+        "605J2e6s5X582p4d000B2h5K6h0D3Q49004f2G5R4q4Y474Y001l003c2100001P490F4h1d2M062d5I3100606j205S006i4700"
+        "1x2a6l6l2w3B4v66046i1E5R0C286l2I4n4q6h3o0r00005R2k0h0B2l1a5t5R6f5N004A30416e1Q5X0W6e1o4G2T564f375Q0a"
+        "1L1H3q1A004O2r550N6k572y4b5I1b0r230O4z6h472e6u5t00005y3o44502i6g4K5a0856475v4q3120506j443g2e4K3d4Q2T"
+        "2K2b2L6i15004A1G1m3a532a595D2w5x1m310o0t2T5R0O603c5X6i5R0X275t584D5D504Z472U5R002K2M1o2R2S5A5C3N3d5A"
+        "4k6o4U5N0f2T1Y452Q080e2020000r3T4d3i2h0l3a4A5t00002M4g00265B004O5T003q242h5N004y5l5D6f3b5y360024585C"
+        "5Q0e311m2M0S0G0Z132A0F5A0w3d474e6g000000201x0C1I3m0k211D5P385s0000004s5K6h3h2b006c6A5Z2R006k0e4n5X00"
+        "0M1k5R3d4c005s280l000h1m5Z2M1m4f1u1k1g6h5e5X2e452i2F0z0b3E5R5I3l5L1u003C5h0d6a5t2r5P3N5C1D591L255600"
+        "5P0V452e323d3d2a2Y1m3N3d2d1u0h24515P3B2e2O0k2a5d2T6x4O5S0Z0E0m3g5N2G0D2c4U4g3B31004O316l000E2j2g1k5R"
+        "4v0n4n1u2G535X5W142T6l56416b2c0K0l2v0T001Q1Q3l201E131u5J3d3a2H1G6e565X6u2M2Y5x2K282M2M00425O5p5o3V00"
+        "6e1L005I3p4h5t6h195t0k00235J632M5N245K200a4j5C422Q6k5R5I312q0F003o1Q0y2Y6c561u1Y694951401J00260F001k"
+        "1k4u454Y2i005N095Q6t3t0J060q5d1Q6A066f5p1D0e1k6l5x5u6i6k2Y5u1M4e2E62503e13450q3Y2O4O2W51455Y1q5I2k13"
+        "3X1J3E4n6g1w3W580y0L1T6o3k0h454O0e2k4Y001H3o255y1k5H3l005y6i4w2i166f4K3c0e1Q5X5A3R3w0o0l0045286s2Y2l"
+        "5A5y0n5u6i6t2C0O5e0F130L4e6f6a4r0i285y6l2k1A280V0A554x5B24456l540v5v2r2q1G1w1m0O0q6i0w2K5H6b6f5X1L1E"
+        "630X2750581G5y361f053W5x023c3W3c5O6i0k5T5t4k2G5N0w4g6g4400571o4Q000Y0U585e0C56294W242Q00000A2e1g1F1u"
+        "1f001g0d5a1300130l5r6e30453m47006u50005W6k5600510l5y2b0q1u5c0z1u1o5x5y5O3i3R374F3c0q5f2n075C5E450000"
+        "4K233E5C0A0X1q5S044j4p361m4f4O1T0f0W3k1200002A000u1f5W1S001H5K2K2e454f5s5R2Q00005N5R5S456f5y5R5Q5x6i"
+        "6i1Q0M1u0L412y0E005o4d0O1z2x4f4f6i3c2M6k566i1G2P202E140N5T0000456s0u381b5S0v4v1V4u1u2F5F2a5R3a003728"
+        "551Q002M6t6w5P1A2M451E2M0j550000510E2a5D0b5I2f442T5B6A150L4c3q6b2Y5R4K5X212M3O00002M00004U005R3D4Y2w"
+        "1u5R124j0r005d4b0g535t1e4D02456z2z1o005S004C1a255D6658596i5R1u1g002l290u5A36000e2T2d2B29000B2H5F1o2Y"
+        "6a1T283x5T5C5c2I662B00472i3Y1m5j2S3d6s5D203d2d610O2M4j6l5S1Q005R2Z5Z4j2T3z5X3L005R3L5R475z0F5S3d5y3o"
+        "2o6w5z5N5k5d5x555S0D6k375Y3H3f655r2M4f3o4O0e6t09002j5B2B3P2A5L6a5P2C255y1g5O5f5W2k2M002M0B28206c1u0x"
+        "1J2i3c0x583l5F2M5N504O5R0j0O1Z5r13281A1Q0k5H2U0o0o5R5J5N651Q5V6u002p5X456f3400004U2e1J442S005h2b2E5R"
+        "5V0N5N2d5L5t5A3D1u1A003k6l3p5A5u2M0o3g2a3x0v5r5I3H356y2o2m1R00005X5t6l00005R00151u0e6l6t4Q5z3x002c5L"
+        "0D3G4q6i4B004I5X002e002Y1Q0h5R6y6c5X5r3x1J2k0d0o001f455P2B4u1Z5L5D002B005D0k2r0S5I073N6u005d0F0C3A1J"
+        "1q5D125t2k2B694y1f2T3c001N3c2W005T001J0Q2M1b000g475y0010105A2O004K5D4O5t00001T5W2Y2F5T4N2j452a600045"
+        "002S28350J3y0i2M2T1y0B5J5A200e6w0W0W264z0z5d003K6i2U1o2c1J5y2S5J4o5a3W5E4I6i5p5j5e5R5D3W5P5P3H1S4n5S"
+        "1m3q5P5r5Y5z6k5Y4O3e5y285a1o5K3x0N3d0f003o5X1g6i4n5I32255L3s1Q291a215k410Q5y4Z3d5E5x4d6d5a5F2h2i265d"
+        "365N284P2K5r0z0o2d5W256a511A3s5y001d0C5t6f1M0y0C65252Z2Q2I5o255x054L5335585E2f03560w5t5l280A0z5X5A5E"
+        "0000003s005N4e2b4Z2l2Q2i00362R000F0C5B4b3a4Q0v0C1G5X5S002U2I4Q6f4U2500001g004G6u2k2l5l2X5t0D6l2R006f"
+        "6e005R0F3x0k525R1S5M2336364f2I1S6j3h5A6g4Q6A6l1F5J5R6i5D2e0o000l2P6i285r1J2i2f021u1L1Z5N4u6i0g5R5516"
+        "1L4N5L0A4L4c00000L1Y190B5t4s4Q0n2861455N1u5X1u426i586A0z4f5W1T1Z1L1g2b605j0T5k1u6A20000k6e2k592k1u24"
+        "0L5V0K550C470n5C360o452a0e286i6l4f6c280f002M2M5Z4g0B1u0u594O1R4a450k3o5j0F0Q5Z6i0A0F0e3c065e3h2R1q0B"
+        "4e5f1u2D2a0000006g4e6A0C2B2R0b1b5x006s2Y59000F2P5e2C0x2k5k231o0e005z5w284f2B204e530n004e3W3R5p5P4q5L"
+        "0Q160C0U3c5J1f0h6f0F0w1L1c6v122F5c5Z4g6l2T0A6g1u4L5f2x02004d4Q1P4I5q6c2W2h2M000L4q5Z2k2p1m451Y1u2Y1Y"
+        "5o3h5e2j456h4c1E5e2H385S2Y5Y2i3W005D0f266l4q4B5x0u2t4I3V365H000O2t6o0w4Y0D530b2n006i5t3h2T6x3B2T455Z"
+        "005R5y0A004q0A3F5W280k1n00000Q132c5X1T5I5X4f00071D2g005M4Q5W4Z5Q0p5P4Q5N4S2Q0O5X0k53005N2K2S5d1b5Z28"
+        "006000002i2i0F0A1E5B5A031L5X2K005k0A5F4e1R000Y0n135N6t005T0w002M55343400593T2X450U5k1g0o2d5R280Y2k0e"
+        "2K5R0L0L422M6257420Q2i5I1m005I1k276l4j1l2j1Q2P6i3d5X000s3a5S3e5k2B00003d4q5X483d2i3W2e5s283c2a5K0a1x"
+        "0w2M2M4e1e5T600A6i4j00322n1L5Z253W0u1f0w4G4O4L5F5T4O0C5Q1Q1o5Q5N6x502e1f5A1J5a4a0w1Q3c5Z0Q472e4I3m5Y"
+        "003V6h6i0L5X3l352b45513Z5e2z0Q53002d2a052c5Q005Q2W650a2O00232Y5t5A5g0k6h6l0b3c5D3N5W005C2M6a3d005Q00"
+        "00425D0000004I6s004I2k282d003A050F5x1J5D5h5K0Y6c583V5D5I5A4Y2x6h5x274w0H1b232D1u0H5A4b4a2G005M5T4h1R"
+        "0L6i005t5N5B5R3x6h0H004O176t2k5I5Y00005I0Z5e1A5R1Y5R002M2w5A535y5J0000132F6k3y0B2a0e6o2T1S09590C345A"
+        "4T5V4f0044255t5R5Q000z1S0i005A0w26001Q0N6i452B4r005T5G00200S004h135x4e005N2Q0e000i005Y3L0a5T1Y0N465d"
+        "5X2K0a00281u5A0s204D0d4c5X5p021Q0X1A13273R006q2T35352O5C5K6g421u3G5y1d0X605A5S4Q1d0d201o1o610b1o5A4O"
+        "3e6c6c6c251u5r3k492Q003g201Y5X451f040006135J130e6k3S5g5R00296i5k5D0X5f5D0x5Y1J2P0d002Y285J4Q1b502060"
+        "0w094q1g5v061q5X6f1p1J0l1A1e241b5d0k472R2W5t6c2G533o0e5o6l160l2i425z5t420V1m0w206100000000001m5D1Y0C"
+        "0a5S002f0k4u0E5T5R1w2C606g5M2i1Z3h071A0f6s1S6g4N1C0e1f0L0G4A0B4j0A383T5t3W1u6s452S5R3b5x45160A5z1T4B"
+        "1H1Z051u49263W5N4Y5y3i2B1A00054A4U2X6g250w002S3o1Q1b2e3e1m1g0y1Y1Y5X5K3S0e0y5W5R5K4y5I2M2M5Y1d274G2L"
+        "43201N0l4v5t50035X5B1W5O5C5P000e001W5a2U006l005y635R1a5Y2h000k5d5T005R3y4K0c1F083k1w1i4L006i5O2a5Y4V"
+        "5d5t5L6i5R4n4O203t5Q2a535T0a20205Q005O2O5y1i1d636l5T5T2e0J0X002y5R5Q2a1i3D0N475K0k3d4V3k2P45454P1u0k"
+        "0d0h5R5t231m45381u04041p454i5o5R0k3X06005J00005X0C2Y5R2M003A5y5x002K446s6y6s0x031k5X2L1u6a260L500e0e"
+        "6a001T2M001Q621G0B2X3k3d35056f6l241m125i001b5w5t280C2S0g2W2a3B314M001H3B5R2w5r5p460k2q2T1x1H1P2A1W2B"
+        "665h2H0e23425P5r5d532x1d052a3k2B2y03344c49002q1S1f5A3p552d3W3O4Z0x3B364Z0N5A2D0013435f6w5w1o0n3V4z00"
+        "4r450U3Q0k366u0N2B282G003c3e3Q2Y6x2h2U5R5u2M2M696l264M0C5F5s19273W203a0z3a0y2i3G005R4s2T5M00456t0009"
+        "1E662d5X4b0b065o5O495W6i2d3k4N4I454I3d1E5R1D1D5j1u5K5Q5h5f3l2U0o2M4Q2Y270U3P2U2i6c2i6h6w5A6i00002E00"
+        "002E5I1D1g3m6j5d5Y6c1D5v2H5X506a1P216c0x2X0w6i5t5J653h1L5100004Y1f0s2z5c3u2I2Y5R5D5N4c440E5A1J2d2F3c"
+        "5Q002M5S0L4e5c5X00000W1b1Y005y0045005Y28601n1E1R6g4h00002d3W1x5J4N4O490N160k155r0N6i075x0a19065i001E"
+        "2h1L0N5W5Y2I2i1u3B1g1g5F2o5N5k430d3i4V5N455Y0h005J1Z245P2j2B1g283k0D0a5x6g5I560C5y0O342v5N0o001T124j"
+        "5i5X5B3s4W1p442T05235R233c5T2K5N0a162T4O2c2R2f2i5d3W1y5C5q0H13235P2M3d204N295S5t003Y2Y2T5R0n4I204Q5o"
+        "3k215g0j3V261u1N0l2M0w3W0U3c55486i2A0e053c5A2w5j5l5t5A005l2I0w3x3x2M192i470k4H6a5a473F5R2f1x132a3a0V"
+        "2a5X5D62372M1M5L566f5O5l4J5y495t5T0G4f5p006i5h254J0m1u5g56566s1Q411T6q6k0k2U3H5y3S131T5d5q5d45280C06"
+        "2e2r2M2i4f2E1G46455A2a4O2a02216a665P6c280u5N2a005N002c5i3q5Z000C002c5P6A000000000000"
+    )),
+    (0x4E00, (
+        "5R172q454J5z1Q5r6d4A4J5z280l5X3e1w0E0E6o4a3W4O4O4e0j5Q0O194Y0B184e2P185W2P5N0j4B1M2h1A5M486j282d1q1J"
+        "0I0w2S6s6l065r0X5t6l2f2M2i3Z1u5R5R3p5x2h2h5o395R5R6i5x6a201l2J5S413R49201I0B0B5R5S5M3g2h455Q5y5B1w2h"
+        "5z204Q1a4O283r292i4O3820352Z6t4s5K5N1u4G3o1x555X0S6f476i1L1x2Z2S5R2k2J345X6h4O4O1k0F5X2B5X6020455x2f"
+        "4Y531C1C5M5D5M455M285j5s2p0V2c1P5R0w1W3m5Q5B2f5h2P5B2f5Q4b0k5W5D0X2O1f5t4n4n28285s5R4M4n2J17662e440E"
+        "066d2e2d0j4o0O1s4A300j0p624O566d1u5A5A5o1Y5i4n471x1A0k0W2T5R0y0x4y0x5R3m3b4n1m0y5O476j3W5w5x2a295P1q"
+        "0p4n5s1p131n6j453T5X151e5x5R5E2p5R28025x281u1l5H2e3W0X1u596j5W27255X0S604A5t0I0z5M474J0x300p5L5E5t6l"
+        "665A3H0k1G3x3x5D085I2T6k4M4f0N0d4O1v3W5R4Y5R6h141Q350X6l0l4f0e6e0N5t136l6A5W5O5d6c1T0e5o4L5X5R1u6A1F"
+        "3D5i3x5A4f5V5p474O2m0a3T251T2I5B1A5O071l3i291k0j281V271L4g5f2c0N5R4O5F4M5o2o6i1w2F5R0C2x1K2M5S4O3d6l"
+        "5I5W032Y3l1k30190u0C5L1E6k5R4s0T5z4Y0W2Y562c6g0r492y0v3D3F2e5x1Z2g0B6g6A0E4b2Y2i4Q5h4M5m0k3q5C0f5m5X"
+        "5y0Q1g4e5I1K2w5x2l5R1u2P6w492M5V262f474A3T511u5y2M1u410a5X455z5E5H5X130z0E6i5N2N2M2F4Y2a5H1u272i5C3P"
+        "2a0g0F1o1q5M030b5X5E0e200x6i0j2h5P0S2N5r2F0p6u1A1J0b5e4Q4Q3b0Z582k0K5F3V591Z5R455d1x2f2d530x2d1n6i2u"
+        "2j6u2i473x306s5w314Z2L26196t0c5x2i3p0n2a6b5Q6i4G4c3D5T0B475N4u6j0L29285t5X0j4x5d5t3X5N1q595w1g5D0z4N"
+        "2o136A0u5h0b5D245P6c0E5N5W2a5I6a0N1u0e6i6u3e285R5D5L0n1c0r6g3N5j5j0b612X2d5t1p0x1L506i515z1u5Y4q2M3H"
+        "602b340914591S2d5y4I472k0p0F4A0b5C5V5P58555O1l0j290W62591G0i0F3K0o2K0S5V656u0d4Z050I5X6b6w4J0J2f0C4G"
+        "1Q6d4c5N135D2X0b3Y2e2O2Y36475A585T196o5B4I492g5m6z445y2I0x1K2Q450B0w5t280k250I5g0X2c2h4F1p5A2i1g2c2a"
+        "5i2S0k1G5A515A2b3h5Q2e29493W1q6k024z5R2l3F0w5R0Y2f5J2y2a0F0X2c4G620o0i034s570E0v2G3x2e473c5x3D4d3x0x"
+        "2R2K2Y2A0a5X0g636i4Y5W1S4c0A2M5c5t2W0F0w4k4Q252M31633K595N2K3r1k5x60635Y5G0D6e5G5A1K1d2r1d3e5k0x1k1d"
+        "1k2e5k4Y5N5N4O000Y471a1p384M1a002f2M244s5s3u4g2P5X061E2U5y1Q2G1E5e1J5F0j452i146t1p5O2a4P285R280w2g38"
+        "4j3u5Y381y4j0r2g0r621H2g386k381F5I3e3d4q5S5D2o2l3F5R3d4O1J3c6j2i5Y3i2v2S1u5D3d0j19571y1q0j200D2k202A"
+        "5Q2L3Q1u3h195A2R462a2f503a5k451G6r4Z2f2P4c152T191x2a5S0P022M0J3i6r0S4Y1f2e2S2S3D5y1b281m1m1m1q2i0F6h"
+        "1q3m6i1u1q411q2n242n1x1241475G2y5k050F280Y1Q1Q650Z150Z4n4n0J1p4a5R282o470T0F5u280X5F215r2k2M5Z2R2U66"
+        "1y0J1u0F4f154I3h2T6j3Q0h2d2d3S2M4I0h0w2f1H1D0Z0J2B2w1f1k6i4R4g4G0N2r2d1L0N1L2n1f285d2f2X31665Y0U5K2r"
+        "2E474G0J1H2a0U2M5d1o430w450J6t1y5r0k281f4c4I1b2a280k5N2i274N2a1f1c5x1H1u4N2a1A0V2n0J0I0w5l2Y2M3V4I3Y"
+        "2v2c1H492k216a6s2O2i3W2U1L2c1L2a2a5927282a5R2a6i0w2a3k2M6l2M5M4g081E295x352R2e2t5D6i196l3H2d4f4K5R6l"
+        "3k2M2e2I2I2j2v5O5p5C3l2A2d2R1T4O2r2e1z0k3h0C2H5V5V3e2r5L2j4c2Y0l3c0C2K2n3e195I5I2o5x5R5L5v4N2I3m2Y3Y"
+        "4O284b2b0y4g5B5R2k1m2j5i2i0X5D355L5L2Y2M0z4k4g0a4K602h0a1F5x605u5G1w1w0a0O5R5G3V2i5a1A441g3S1u1E0V2h"
+        "1E0e210b3s4O1n2h5R612b2p2b2A205z4f1m1L4a642A1o205X1L2B250X1L2O2O521b2h2k5y3W4f5R2r5N0f3x4f4O5L473y4y"
+        "6w4N5x25084O5y5r215D5r0b6w6s5D0X353q0X280k4S0k2A0f0l6c2m2Y5W2Y5y1H5w5D2d2d5t044d6i385S5t4K284h2Z0C2j"
+        "5D5I2e4h5x281g4c5y4A0x5t1g5h2M6f1Q2M5M5M5N4L136a3R5M4a5M6i0r3R5d2M4L1Z5h6y0U1o5Y0r5Y5B5N2M2k4G140F2h"
+        "2e051L5N4Y2M0x2G2M5N5N5Y4Y1E2S4r4f4f1k2K1b5A6o4A0o0o0o0o020W5W0u285W4U1m4P1I061l4x4O4Q6s4f4P0f5I293Q"
+        "50285t50164v0O2v1G2i2T1H0Z2v6i2c6e06172r570C4O5W4e425Q1S4Y580C2J15282Q1Y3g5I370C1A5J5P6t1T28150T5i3i"
+        "1Z2M5k5B6a5z5Q2Y5M343N275R2l0E2S5n5S1o0e4b4b2d0l1t061e1p1g1Q5h2t4W451Y6i5S5x5x0y3o5K5y0K1a5u1Z1Y5x1z"
+        "5M2l2Y1g1A3a0W450B5x1z1u2c1Y0C4N3o5n5x5R0W3N2M0b5Y1N5u485x1g4O2j3U5u3t332T4j5W136k4O6k5g5y5R45416t1G"
+        "0N5t5I1T3s1v3T5R5C4M203i0V4f2i1x615o1f433S0h1u5O1T611T1P2h5V1u0V6k5p2m1G2m6A0l2W193D564Y5A27451k1g1K"
+        "6a5y5R2R6t3g3d6i5P286k1A4Q635C2r252x225a5A1g5J5H1N5N2I5R02404M5i1Y5G1f5p1O625W163P5B021C2A5M0V5C0e25"
+        "3y215F2y1f1p283F3l5U1S5Y2W43371A3M0C4K2M3o6w1T2w5C5A2I0k6f6a2P063g2R531u0l1Q1W1D4X1A5W5N1G1G0b1Q550L"
+        "5R02295k5A5r2M5y596A4e0z5x655M1a45134b343k1E1a4f2I2P5565232H4G286w5w1q2e20454P5t4R0x1k2M4803665U3y5X"
+        "5e2F4G5y5o20026e3G2s6s6s4J131W2S010n5B5n5x5u0S4G1G45455a0X0X5Q6t0e0S0H1T5M456f1o2P5A3W4G2E665T1H3O6f"
+        "4D6o3B1N315N134g0w0k172H5C2i590C5d032h0X2m5V5t3q4I5X6f2E2d1Z1Q166k0v5q3K5X5S615P3M3e20600I2523235y1T"
+        "282B6j5t4G5I241f3B5J2P5X4B0C495N0X3U0o2M5U6a5t3f5T3U0l2B5y5X2d2X2w65205d5P1T015H484D5V511Y5D0255340u"
+        "1P2r0V4B0A4s505p283R5x474O1A6t2d2I5v5p4Y0C1S55001P554b3B1T6i4z3n1A3o1602485i0e05052O6y6f3k5050581345"
+        "2c0D2c2n584I0q29025C3Y2X1v1G5C20251N3N5A660x5I42103434202K1b1v595Q0d5T4z2c3d5C21354j0H3V2I5C286l0y2B"
+        "6y5C4Y1S1u2Q495y0F0w0X1U5L1g6z1m0C25630J0Q0X5X5n0t2c5Q5y451S2O5I12255S442k4b5L3B2Y4Y5N5T0V6c3M6k2e3F"
+        "5Z5D451g655R4O2c5Y025V2k2y5X3U0Z1v1X1e0Y5E4z3W3W5S6y3D132G56274s1S5z5Q1f3W0E282e1S5d0x5L390m5d2Y250k"
+        "5W3B5S20391Y6f2M2U1P3r5C3k5N2M2Y2W3k0X0A403W5B273k5y1f2w5N0w5T4k142E565C2k0M23276o3B5C0m2M0w0v2M5R31"
+        "3r61515y682a616l2G3B3r2G2V5t255S4e4Y3C2a255E5S3q5l5l1e2p5Y2g3X600O20255Y1g1N2C0O5i5k5t301N4i4p2T1G1N"
+        "571N5k5W1N5S26445X1Q5Y304g5X4c1N0I5t5Y4g2w445Y5Y5M5k5k5k5l32255R232Z2Z5k5M5k5h4N442Y2y5M625t1A5X5x1L"
+        "3W5R1347476g6s0Y465z4I2A0x453B3k28296i6i085L5R4b3a2l4q5n1n0c0c582o226A2t0e2f132f282y132f2a582M065x1p"
+        "6q4208592C4f586i5o1x41141H3x573W2g5O1s052Y4e3m2r1F5K060C0z2T6l1u206i0K2E2W2W2Y050W3S3h5F19281T2Y0N0C"
+        "2K1w5S1Z1d6e1u1K5P1f1f1L0u5O5S1l1F5Y165D2s4J4P1g0j141Y5M2x0V2m0Y2n1R3s035F5A5Y091u065R5S1Q5I0K4b1D02"
+        "0d1n4h5V2l2913352H2j0B4I2e6f2R2R440B210l4O5L1N2g5Q3y135X0l5M4g533W4c5r2i306h2u0D190W58030n0F0d2o6i1f"
+        "5R6i5R3T286r454C2i3x2w2r592C3x2a1d2e1y5X1g3V1G5k2L1n5M472C034M1f3s5k0B5S260e2O1N166o1Z0a0a5X13382d4u"
+        "5Q1D2o6u5X241g5P5N0a0N3a0x1b5o5S1q6j2d2e1W1y0L2a412K5B242L1c5r5J28282y5T560B5V2n51514O3d565v0B5k594h"
+        "6j2M6j094z641d5e5x6h5L1A6g021E5N2o5e5Y5u5D2U1P2H0x3V0d0A2Y2Y3N473a3k6o4U4Q2X0C360g2f0r4Q6i6d2o5V140A"
+        "6i5y1N482e134J3m0S5N566947482P5t6q49695I4I4I06442y191m4h3k1e1e6z134N1f1f58123m1p24580V5Q6l2a05482849"
+        "2s5R3W0e142b5Q5V5K582G2i220Y4k475L5A5y1T025M0Z1S4u2e2K2A2Y5N585t222W2W4v2M2S4k0w5L5N2K065r4O4n4A6p6p"
+        "4N5R352r6l6p20202C5R205I2C4P376z4P5R6i1G0F2b1q0b6b0f534i2T1u0U5z5G5D3s5z2B5y5q5Y38511f1f5Q4c5q1F1F45"
+        "3c3c5S270A0V665e571u1I5P5O1R1z4O5a575j5N0e5R2x291f212A6029061i2O23135N3S2j453p1q5D1p144g2B6v23452n6a"
+        "0c5R2b5a640c5y241o155L0d14054L5v1O055x052b2O1f602b4O1p270e2Z1f3H3H173p472a562h3I0u1S5A1m284X4s1o5s1Y"
+        "6p1u340X4n1u2f5N1P5u6j3O1b282t6j5P2e603f1t0C5Z6p3E5N3o5E1p0e5X5o1q5r1n5x5X1L1b063x6k6s6e0V3x5Y5j5A6i"
+        "1g3a3k450e4M4a1g1T5I1l6h3h083m1u2T6t6t4O4j4I5O362d1G4Y5F5t6t2i4I404n5P192b4Q281w5B212j2c1F2I2a2a5R3y"
+        "6i28285A1W1K2l2x5N3i2R3T1g5W5N0u4M5S4O1L4g6t4Z5t1Y5p2X5M4l2c2Z415A4K2M0B5D371u553a5t2r0M0M5h3z5F3q5X"
+        "3o433u2j4M6i1Q136p1g405m5A3e5x5N5x025N5X4Y5X5p2M5A2i4f6q455A6s190x2Y021g1g2X3e0O432i420n2T5r0g5C4Q45"
+        "251m5w4v581o1o2d5e3x4g2f262f47145F205r2F0e5S0E0M1u2f30032G2C5S5M2i2M145A21215T0w4M5h0Y5P5x3q0M295j5I"
+        "5X5t134r3a0X4u4b255w470L3f1u2d1c5R6j3a243e035T5J2d5t3a5Y6h4e4O5D5o2O384j4Y3X5t5p0Q20052d0a5I5j1L0F5P"
+        "3W5y5Y5T4q4s0C2U3a3Q05341F2B4b294C6g5Y2d4q3i5T28513A5A5a3R2H3s0a023W405R3Y5X2K5J365R6d2p5V3x2M131L5N"
+        "2e6o0x661Q3v2I3k6f2020053v48343Z1G5x495o6c3f5A5A3k2Q2O211L126i5I5R215y2B4l5y5N0w2c3a1m1m5A5R252c1u4O"
+        "0e4I53482O235E3A195R0o023z3D345f0E2e0N5X404q4s3p5N575T473A5Z5T3e0e344M5F3x1b2U5Y2G5N4U2T2c3z2G475T4U"
+        "254g3d2M2Z5N6l2G6t2d2k2k2u60346t0T541u0b6t5C5E3c4Y570a281G3H5K5W6o1P2Z543s3g0O474Q0o5M6t3x1u6t2M5K0k"
+        "4s3p3B3B5T2Z3e3D4q561L6b4d5X4P035k4Z5r4r5P1Y5R2f6r3d6l0Y1Y6u1J6k175r5R0a4O4O0D4M2r5J4O5W235R5f4O5A1E"
+        "0B4i1E5C626a0a1P5N5C294M0A4q243d2v2z0i510n63285Y285S3d2v4c1T6g2a1u3D0j233a4b1Q5X4O3D2e3D6i5X0a2z3D4b"
+        "3k0u2i1H4b205x2Q4O3D6b4M5t5D2z252Q2l235R5R0a4b0D0a1q0T1d4Y5L0Z2Y1d4P421q6o1u4L2r2b2b6o5t6z5L4Q1d0Z5C"
+        "2d4K1k1k1k1v2a4Q0A4J4J3k1v0x2Q5A5A2C5W5s5W2Q2Q5P375s5s5s1v5P1f2B6j2h1x1G1x5m1x1x4O5S0C2q3x2e5t3A2i3W"
+        "0t5y0e2i2d5e4f5d2d5x154O4O41285D6g5D3x6c5y5t361g2X415d1o4Q5D5k2Y2Y5y0t2Y2i5D2i2k2Q2k4Q5y0z5n3x4I5p5A"
+        "2M1g25252W5R454n5x1Q4M5X0F53454n5Z085P045M5x2d1g28471p5r450s47450u2d4f1y5A052G0Z066A6A5O2i1y2r1F5K42"
+        "2M5f4f5N1u5H292T5o3W050W2A5Z4f20423h035f2T0C41191Q2B5H385i5K5R0f1T06311g1u5L162Y1i1k1w4g195R3m4O035t"
+        "236i3d2M285i5t5W465z2M5P2c6h2Z2c1g1g5X5D0l494i1q1q3s2M5W5A4q0Z4M0B5k1D2l1z5z5S5X2H2o2I2F5A4h2u0D0D56"
+        "2S212i2F453h2C2C6w1G0S5M5M1y30302L2k1f6h1N5S191Q6h5t5C3W5N4Z2d0d6w2w196c1G5S6t66245X5q5O1q4e5O5d5R6i"
+        "4O625P1g6l2o2Y5N3a1Q2828235h4N3a475x5X6u2G2r5N5N5t6u0u534q2r4b5X452X5k1d5y5v0p0Y4q2d2n2U5x4Z496t5t0d"
+        "140U475V3B0U284O4x4Z6u2b2Q2p0w160s175k2X6d6c6c050q4f480S6y0Z0Z5y5X3T2W5B0t0k4b2c5N2I6c2S2Q2Q2e121f6z"
+        "2c1L5P2c5P2k6c5R5K3s5Q5Q5R3B5A285D2r5y13056y5t5R4q0Z2T2d5X5Z5S4s2d2M1L2W2W144q5y2i0w5T2B5N5t3s4g0y0R"
+        "2Z14143B5N5N5N2B5N0I2y0I6k242f5L0y0y2R1E6A492i1E2i5x44440u4e4e285R4Y066i6e5B5R2e5L2j065L2e1u610e4O0l"
+        "174S1m3B4O1p3O6i5y200X5t6d590W3k3T3O5g0k2O6i6k0k6i133k5R5R41462j4s4S0W6g4V496g4O4i5y090W1L0E416d4A5r"
+        "0W5t0x4G45661N381b1Z6h5I3d5t5w1u5R0941161E3Q245a3d295c256j4I363m0g1N663m096d2f0w1u6i201m0J0e0e6d3d49"
+        "0w1p3c090E3g0F2d5A2G1x413y2a0j0j5F1x5P235W5W281K3W5h661K6p3k4c0e4b1e0J1L5M072d5I2Y5x6p2w5T133S145M3f"
+        "1D0N1u5i3R1o5B5R6i5f6i5H1b6A5C5k1L2w375h5W0l0j0B2F0e28034Q2p5V5o4Z4Q4c5X5X3f500r5B1o2h1g1L2U4G2O2H50"
+        "6i0l4c2h2h2e052D2X5S2Q0W2Y5R0F0w5k4Y5E3f0x5x1o1K2w2y0e485D2S2S2Q2Y285T5A5h5V2M5h5S5L5N5h133P2a253p25"
+        "1E3y2n0f5R453F1p2i5N5R640e5R5R1k4A4O1k4O4O1E155S201u1Y5x5m0C2b064M136d2k5a1u133d5A200y3H2f6g5R3d4g5r"
+        "4K4x5J2f156d2b483V0X480e0e4L0X2a1F1A1l0e2v2a0h5C0X1N2b1Y3d1N5r2k28281L0Y2Y2Y5l256i25255R5R5R5R5Z5Z4I"
+        "5F5u5i5N5N5X0C0n0g150i3V5V3Y6d5T0C0C6s5o283R6j5R5s0z0e132T1u5s6h0Q5s2f0W5y5L1V5O222Y1Z5s0B6i5I2f5k0O"
+        "6i2F0O103P5y19280x6i0O6k2F5X5D2d2a4O290f241u5L5t3R5P5t5y6h3Y5d106h6h0h100D0z2c252c253a2W5B0a4f5E5E0e"
+        "5R2J4n0Z171w284n4n0w585b5b1x454O0T6i5s375y1m5T5e3h5u6j0D5x285x5y295W5r0O4Z2y5X0f6i450S0A575n473y265G"
+        "3E2A5A5E2p202n1p22574Z5x3N0x0J2i5R0a0y3h3T6A685O2i083H3s6h3O0l5g20202i0V2O4Y0E130W5R5k5W1u283V5F5Y3x"
+        "1I1u5y0e5W4a5J0O0j245I0F0e4Q5y585V6u1d3k6i5R4O3v5L4O5y2I1W2A3l6i5D2O5f24161S2u1L1W5y2c4Q4Y204e5O2525"
+        "0C295R5G1I2S256t5I0C4J3H1V1i2r195e1E4g5y465Z3V2s10251g5C5i5N2n0r3s60375V5V5Y3W2C495Z5X5k2d5y6f2S5d1Q"
+        "1S4a5d0l5R47255y0b365R1W4Z4g0B2B5x5x5W2M2P230O5R5Z2M3C3s1g4h5J475x3h0O1o0b100S0x3b2M281J1J5F0Z452u5e"
+        "305y2o1M3x4c0E1e1N6c2f5r5Y2e282G5X271T4g585d5d3B5s0M20265y0x5E5t251g556u2a5V142i0o0B100b4a0o0X1J1f3s"
+        "605B6q16240L4d4m5F0r0f3h6u5d490E0b5J5t1A475t5X5X0e5J233h0e5R3e5V2n0Y5S1g0A38462r5X024a5N3K1x606u4z2L"
+        "1p5T2B2B4h1E605151455P4Z24281G2i0J3x5D2n6h5V0q5L4M0k2n5Y5y265V5O2M4C5a5S0N5I475724604M3i1E4L0O3Y3m3m"
+        "1N0C0o0o0o0S3h5b6d5i054U361J4h652h252n2O3N4Z4b5S2Y4J5t5l36474L5V4c2p136i2X2j45455X412Q0O5W0D6i5i0B45"
+        "4f3V0b0h4d2c690C2O412B25490B5S5S5y5y0X581f1d1d512k0r5C1m1p2I2I0D1Q455A3h2f2Q5x0o2k0Q5A584N3W5R0F5A3s"
+        "0X582f4Z1Q2c5t5J194b4b2i0q2s5D5T05385R2S4D2l223b2G022S5N2D5z0C5X5S0W3c023c1d453k2G3b0E6i3K3K5N5O0k6i"
+        "2A2A5W1u2U3g0B250w3c2G225J4k0w282i234L5R2O3q3d592k1y1y6p1A5Z5x2a5I4Q4q5y0B5w2d1A2a4827486c1945291667"
+        "29286i2o282B1w126c481A2a2d5X2a5N2Y206c5y5y0M0W4f2020201g4O5d38202M1n550f142g4J5R5R4I201o5N4P4P0n6a4e"
+        "2J44060V4o1m4s625o6d152p5X2w1x4M0u5o1G2v5x11476i4n2D3b4C5O3E080z4l5y4708295X1u055y3W6i6i1g116e0B285N"
+        "2A0f0y2i5u205Z2k064b0X6h605r3t5R4Q6m435j1a2p6f431u3S0605665l2v304860200a0j6i3V3q0l3W575P6g6a5O0a1T3x"
+        "5Q130C3W293k3a0A5M0E4f3h0F291u6a6l0X0v3m3y2E1u3S083P2S3o1I472i5o065o5o052i6s3Q6e0707133x2i2D2W2a465V"
+        "2G3D0k66471V2D4O2d6h3C1E1E4g4T0T612q5R5D0r25406n4O3o070C1H6i2D1f1f6i4a033F6g1A2c2x193o5f2R6a2Y165p2k"
+        "2R2i6i2Z5M5w565D3s0Y2c6h28255A5X025o3K0U0k1D5d6g0B4y4y2t3a3F2i3V2a5R5h4I4t5r5D0u1q2c5x2l2h5i2C275k6s"
+        "432Y061Q4K3B2j664Q5Q2k0l5r0l6z5Q6b2Y505o2I54092a230Z5t5r4b3V4L2R3h3b1u072i0Z5w022j5Z6u0A0K2d5k0c3o3y"
+        "4x6A5w455A0B144C304c1y1f4P1543136d26285a46453P4Q472T5Q5M2k6h2P1H5R274I6h320n580z0j2d5d2u5m5N0U6k2i5e"
+        "472s073O2d2Y1I3i2d6i0X3c0o4C1J3V5Y3K2a6h2h2a5X5N2B3q1Y4r3W5t4z6v5J3f5d3B0u4O6u6g5R5L5V0f5O235N63035I"
+        "5M5w2r0H285d2E2E0A2n2h2h5k2d251C0D5C165D5Y475Q0u6a0b5P5t0d2G5u4b0w1A2X6u1C2c1F4b4q4h0E0H6c54540k0F4q"
+        "090U4C2r5P0Z6i3H2E2a504e1z5A4X4B2e3g1g0K3K4I566a593Q080V2M5a206i5p21475u485e6g1g5D3K4g0u6a1A5x1i4L2p"
+        "4L4Q075P0i50584y0w552h0D0J1I0j1q4S1345506b2O0B0C1J2Y312X6u1w206a0J59210S3p3k2b1L5T6i056i3B360w2v0F4L"
+        "5l2c3k3k6f0o2t0g2b5P1F472Q285T2k3Z3Z2I1e5A4u1L635R5A0B0B4y3s1Y4Y1Q1K0V6z3y2S6h256p2c280q0X0X0z0k0z2k"
+        "1u2Q0c1u490k0U6s6o5t444b1e3y215D2Y2c0R561Q495w2a1x5V2K3r2Y4I6s66440M280Y4D0q4c4c232d4b2y0X5D2m3W0705"
+        "2i5Q1g3c503d28576s0Z5F2G0m2i5Q4s5Q5Q3x5w2d0i3D1A6i6i2D3k2a5D2R5807502Y324l5d3Q5O2K0m4Q633y5A2l272M2E"
+        "235T2Y2W474763472G5A5T3a4k0w5v0R5D4L312l3d0C632Z586x2M145p0Y2c2k2G2M3r6i1L1L455L44444P2q5W1w5R1E1x08"
+        "1n6h42142v3h5x1G1T0r5C3d0F1A135I2c3h0A2h4M1f5X0C05075I2c1f2O3B0e0x141f5R1x4A2r5N1e285j5C1f2c2f5O5z3h"
+        "4Q0249026h136g1u4Q2Q4f5G5R2c4I2c6s5R2O0e2M5C5C5u5K45456b0i2k6b2H1o08082G5X2G5t1a4N2Q29205D295X6g2c5w"
+        "5f1a2e0C5S1u486c4f6s6c1c0U4Y5E6s6s4b2S6s0F1c6l1n0w1R5X4O3T5W3a3R456c382Y3T3W2U1u1n5J2f2f3x6w6e5R2U4K"
+        "2a5X5R456i1m3Y1m6c2y535X5x282828274p0X2h6i655D5f5L5I1v2E1x1Q57135I0w4O2A5O4O5s3h3h5n0L5x600b0466082d"
+        "2C4N201n1S1L0x5J3i261p4b205R5y5E5N661n584M2i5O630j5F5T5J426g2T0L1S3a6A3k0f5I266e6u4O4O5X1o16383x0x5u"
+        "19020j046k2W5A2A5f0y4O24245J2B5I2c2e6i2e4J5i1Y5N1w5B4H5C5Q60251Q1Q2l5r5A2C6k5y0B4N0l6f6f5x5r251S0A5r"
+        "5e6s6y6k442f5y4I3x5y4c452f1L6h5R6i035r2S2P0x5s5C631o5J1D5R5z60255I3h2B5Q5T4Q5t4Q4c383q2a3I035O0L5P55"
+        "443i2c2n1z5v0x451S5N2M0228283b635D1S3m3k0O3x6d250a1Q5J0I2Q5A582f3Z2S5n5y5R28240W5Q5Q2M585i5C1o4M6e1S"
+        "5R5B5F4M2c0a2f5N025Q4s4Q3c5L5P442M0A2A162Q5N272Y5y4q2W3r312Z4H595N6l5Z5Z4f5Q1D5Q201T4Q0q0q4N360t0t5d"
+        "6y0o5I255S4a1p3W5Z5W4u3V1p1u2T1o4f5d3H5f4X6g2H2H6y3i245s5n0y28455T6u5s5i2H2I3c2W3m125t3k0c6a4Q4Q3m6l"
+        "4n06441f1f0Z2M1L282h0e5H0B0N4G4s614g475X1x5x0u4I5L1m5x6t2M5F0n0T4n0g5o136d370C5R1w1E1b2M454Q1y5f2d3e"
+        "5r2F2h375O343f4Y5Y1R1o0b2d191z5P5A0F0L3O4Q215E0E6l0E4Z084Z285w2e1F28383W0e5s041n1p5R1u3q5y205M1a5E6g"
+        "5P2S4v1g3a6e1N6i0O60214N4Q65132M2Y2a0B4Z481q6c5C5A2w41575y6i1I5C29291F0a3k5R5Q5Q4O3B0e1f5R2T0j3x2E1T"
+        "081m6j0W0N5O1u073l1x454j4r384K4Z6f5z5W4M1L5o6a3q3D5V136i6a0u0X1G0l2h051u2a061f2r3p6l0e2U0v4I4Y0F3T4O"
+        "1I6a5P0B2h4O6i2U3a2M4q6a650g6c6i2W192Y4N2M2G5V4Q5L4T456g452M5R5B6g2M4D1H2o0c4n5C074n0j6t0E5R0N5I6l2a"
+        "6y1k1k5W1l1E2q2I6c2R5S5O1T1C5R4O1A622Z1u2d1W1L5a1K5t2A4s03032j5R6s2w6i4d5i4B4B232i2h5K1f6q5X63005T2d"
+        "2U6c5M4l6g0Y4549211L2b6p5L554G6g0b5h2D2f420c1u4v5i2k5y2H2U1q455u2l1x512P4e5h5W3a092W3V6p135J5k65051G"
+        "0e131Q6t6i4n0b1D2a235r3K295f285C2Y264K0s1p4Z3c5x2M2M1a4b5T552i5d5D2C6s4Q0w1m5t2f2M0i5z1s5a6i2F2O2a6s"
+        "2T2M450j300O473e45450n1M0w101o3P0909266u0B65282M3V5X5X1G2l19591y5s130U1m0B6c455Y5N5X4g5R4E4n0K2L456s"
+        "1u2r2F6v6v6e1J1p1p4M4c3x5r1N2Y1S2d5R0E2i2i0B6A2P486i0K5M2i0b2c6s6t0i3V170F0x3b212a1L5y1b470Z1L14316i"
+        "4g3i1u1D3V4I5R5o4E1f5Q1u5t5t1c296u2a5R4M5y5N5N0I2a0L5X1T6a5w3X0e5P275I4x5O2E5N0c252B2d2B4Y1q5D5o6i2a"
+        "3m380F20202O2L5h3q5X5W3a4Z5J5J5O6g3X5Q282d5Q0F1e5X6v5t3a5d282d2n4e5T4r242X2J4g5B404O1w582G5u5X0A2Y2i"
+        "4M0F0e5D295R6c1u3K3d2H4q1G2a2i565P6g094G5Y6t3i51295P2d241x1o6a4734545Y5D4q4O6i0S5u5h2U4q594h6b4Y4N56"
+        "2r5y1G451z1z543Q5a1A0L143G284X1F0K480u47223a5I1y1z6s5o495O14292o6y0Z2W0i6l4B5y282O255V471N1w1w5l2145"
+        "4E0S3V5W202b20231L3B5R1z2p1L1L0q362e136p2J2H0A0O2M5H4c4U1m5i1J66512K2Y2P3d2X0y512r0F590g2Y2h6f6a4Q6d"
+        "363k3A5O5f3V6l4G5y4g1W2a0O285N485K5T1k5L6i496y0O444Q212B6g6z5Z4I5y0L141l1x3k5x494l2S2U495A4w1m6c5o2I"
+        "604W1e0B593c2i0B512k2k1425283K5B5o3D4v6l5i691p4d4j1W471G2U2I1z0F5y4N6t4A281a2f2Y2a0F5Y564Q2b582S3F5S"
+        "5y254I6y5J0B1x2i6y5R4b445N2K1q250Y28530k410B0F6m1L282d294c6b2a480Z5R0g4Z4L2S2M0u3c5S5a573e455l0i2728"
+        "473x3D5R1z2o5S3G4c5N453d6e1L0L282B42120F1A3e5W6i24472K2K4y2Y2M0R2Y3g253N2Y6i1z1b5Y2M1o6s502O2b0F4c6l"
+        "2Y5N2M6l0A2d1g51223B5X2W2F2c5A1L2i5C2T5T2a5S5W5T5B3F0k0w2G2i4U4L5t0O4g4f0p2h5X312M0R2Z0Y2k5N2G2G6l2K"
+        "2M063r5X2T1K470N235E5X5R473N5I0y0F452n5R2k5y5I1T5X2B2H2z4X5y025R450G0C4b2z2o2z2o0I4G1H5S5E5D5X475C5Q"
+        "1A5x582e3N205d235I3U5y5C0G4L4I1Q0F5R1g5X0M236i6h0N0l5x450l0l5q2i470C4D0C4D6j53532M665X2M1L0W1g4Y2a6f"
+        "3k3k5P3k0Q5O5e4N0W4J5I5L4Q0o2k3Y464e514c602O5R1t6i5Q0o260X28166g605u0E0i5d2e4J5S152h250R5R0X1b2b2O0i"
+        "1b2a2a4Q3N1c6l5S4c5R4G492r5C5L1425251G49285R3N251c5R5C5x1J3m3a3a022d1b5X0e0e0e3W3W0e0w381S0n3W2R296c"
+        "4z3m5o5L1k4q5A2i3m1S4e1a4G583T2i1f0S0e4A4A384z4Q4Q5o1T2a564A2Y3m385i4q0x442Y6c4C6c3c2Y4f164O133h2k37"
+        "453Z3p450Z5A0I1p5O3u0i1u4M194c455S5y1P5O035M2r4c5M190X2Y4c5O60604V4V6h0j5V0Y4V2J3x5n1m1L5h6i4e0i663e"
+        "0R25151Q0u6s0I5r1m0V5y5o374e454I401Q475x5x5L4Y4s1E2b0C5x5k2h596i6i473d1G5s2f2f4v2l1Y574g280f0f1x5u6j"
+        "1n5G2k203E451p5I5I4b5R5w605Y1R5N4M0A0X5W1e2027453m3H3a0V3e3d0D3R0e4G6i3T3Q6q611F2U3a661q3N2M300p1q5t"
+        "203k3a4Q2i615o5o5o1T2M3d5R1l1o5W5e6i6e1G6c5N4Y2A2g2i5D4e5R296j4g42253d0c666l2J5W1G1Y1x1l384Y20410N1m"
+        "6i513D0B2T3S0k454Y3x2i4y6l4N2K5J2k1u3Q3h575O285V1J0d5K2W2Y0X315D42662f5S3Q2d5Q2525620B5S5t1Z2a5O2R4Y"
+        "281k5F1u4y4D6i5S5x5y2q6l2b313103195d3l2K5R3d4g2e425t5C5D1Y5I512A5a4a2i1k6k4s415L5G6i1K233i275p463P5x"
+        "4f2U5R292f472b2c6g4O6s0r1l25282U0w26203F5L2e2R4e5t6f2l1Q09376s5W5y0k1a231Y5R445T2G1S2H1Q2M1D1u5x2O0L"
+        "1q5R5X5i2I1P2e290D2g3a530B3T5A4M5k2C413B1Q2f5C4L3y5k5V5C5A5h1g515n2j0s5d2M4V4Y2K4V5a1b2I2F2O5t5w6023"
+        "131W4w2a6d4D1u1J5F4P4T5M0M6d5Q2u5w1Q5o191T5w2i4L2P26566s144a102j6t5y5C451G1N5N2S596k3V1S0x4Q451n6i2Y"
+        "3s2i5a0O2K6f411o4Z5e3W0X5X3x5X2Y1x3d2f2T305S0S4f225X3y4M0g0L205Y2F264c5N475e3f6i5S0k0c5Y5u4x1o4c5Y2r"
+        "284L5Y4D2Y6t1b5R2a3e3P5y5X5Y4M4M4r236l2a3I5X4e5h4f1b1m6a0k5w5w135t5u4s5D0r5t1T1y5N1Y5J3d2r385T5N5W1Y"
+        "3f4N3a62263p1L0C1g3P3a2O45453a5e0P5t0o5l3e253k5I283U2a2a201q5B5R5S6c4O2d6g24585X0e3h4O5k4N5V2i195l2c"
+        "2c4e5N592W275Y3q085W4g6p2P0w5A0L3B6t5r4O365T2E2B1q2a5I2X5t1w0k5T422e5N595Y555Y2O5P3c6r0B2r57565p2U1F"
+        "4C3i6a4O5R3034445t2M625x5y5u48664O51024b50605H5S4q2651553x564O4s023Q0F0F3R5v0p3g1A141S245y6t136i5F1u"
+        "2d211A6t5a5c530e2c251M5S1z2W6i5N4L365T0L2Y2G2Z5P0i585X5H200e0g6i2b2v4M4J133d052Y20205W0w1m5V1M364c5X"
+        "3Y285M0y455y282Y2X2W2e1N0O2X6i1w482M5N0q2c0O0L5l3N5c5Q5y3d593k4J1Q2O2G5p0C1x1q5J5R366t372p313V4Q6d6d"
+        "6p5I23272a5N4U2Q0S5d5O2b0O5T1Y5H4Q1J5T5C6u2C5I2O6i5t3W5X2c420Y252d5x3O283Q5t5147475y2Y5y5L1e243h4w51"
+        "2I6g0O5R6f5r4I580y5L2B5Q4K5k6l4y1U0e4I0w0w4Q5i442S5t4D4D0B2g0B212c2I0z1x0T1Y4Y4Q3V1Q602U1Y1u1S1T5A2a"
+        "4I5y5X2Y2G3D5X2S3e650Y23665D5X2M4O5K2T5r6t5V250o2O145Q05236g0w360X0X5R533W2i564b286s2O3F1N2e1p4D2853"
+        "250F564Z174D6l2F0i2O3d4O4Q3d3D5T5T3c2e450e281S4s0S5w5a5S5S1d0N274c2G2l02446s5t0i1G475T0i2D1o0p392a5t"
+        "31632Y2M5W5O2Y4Y6i5T1b5s255D3Q4M0g0w3k2U2a444D0B1G0i275A2Y4b1Q5T4q2M2f5C5T535t5D225K6l2W2F1d1m202F4Q"
+        "2T5T3d282O2a5T1p2S5R2a5Z0w0W4k2a2G1m4U5Y6s1q4L2K2G0O4f5V471l1J2k5N1S5T4y632Z5N2M3d4I580Y2c0w5T1S066l"
+        "2G2G3r5r2Z5L5A5N1x5N5X270g3g1K12255C5C251Y2T656o2h6a5D0C6s62620o5O456j1p3E2g5u445R2Y0K3W2n3Q5N2n3R3m"
+        "0y2Q1L2p1e1K5E6i1K1K5t480f0V5z6h6l2r6e1u065D5D2T6s5J2i583S2g3S57570j5O5i4I6l6a145t4O2O0C246k204X2G5h"
+        "2c5I1W4g2R235O5H5H5A5S5x6k5P4O5t5i3g622n1Y2I5z6l5J6h425N251K0z252q2i1m4K5Q2500592e4m2R5y1u2g5D445h6s"
+        "5h5r1P3V2H5N5I1q0C4q205y4Q1T5L2w2j5C5y5N1Q6p2l135D285x5N2Y1Q5N233b2i0Z0b1p2S2C265n5y0S5x1Y0y1u5w2c0O"
+        "1q414d4x5y4d5E0y5N5N5R2k5X1y4j3W5G1y4N0x4K5G3y1D5t0A1T2B6j1c5z251q2O5J5F242c2a0e5T6l5t5l4I5y3I3I0w5N"
+        "2g2g5X3a4G5t6a2e4d4r3a235I6e5t1m4e535O2R6l2d651H0a20603q4O2P0f1F5m590y4I1i0k245D5y5x5y601T1T5y605G3p"
+        "4I4d5P5L3d2O5T5x4q1E5N482U5y0e0g0O2Y2a4Q5R2X3V535R5c2k6u60205R6i055t2U1Q3N4m2g362C4J0R692a5y5y5y5R5C"
+        "0C240w5Q584j5N5L492l121e4M2c1p4Y2Q5X2S5i4K1p1m5N5L2G3a595R2g3b2f2c5T5X5R5K2G57650o535y4h6u2O256l5D2T"
+        "5t5R5D6e250V3F2G4s5A1T5L2e0E0Z5P1T2G0g4q2M3k0a4x2Y2E055L2A4X2Q2M2Y2k2Q5N5y5D2W5Q0o4k5Z2G0O2k0D1J2i0z"
+        "3d592G6l2G2T0R5X6e6e3O6h3S0B5Y025t1Q2k2k1u5Q06165Q5P6w4U1k3Q0J2r6416485V483X083Q0y2a3P1b0J5X6a0f1609"
+        "0k0J5W5W1b5M0B3E3E402h3l563m2I4n371n383m1y5x5N1A0b4Y2a1G5W1A4N3m13474g4g6t5b5y372t475x1G5y2M2M43281y"
+        "6i0c4g0L1b2i292a1q3X2r2i2q0F5y0b312d344A5t381e5i492b5y2M1b2R3P3Y0k5y0E5t2B0E4g4g061m4e280v6s031A6p1K"
+        "345W2p0k1Z5M5S236p602A3E132A6j3m0b3W2i5R4N3S5z5o202T1o3W3x5P5W1F5K2i0X0k2w5A3D231V2c1T6e285L4I564q4P"
+        "5i2I1b5z4O2y6h5X545X0e375y2j2M5z5S522H0b6i5N4G2M1Q5A2f3P1o5C07453x0g5S2F2R2a482C5N1N6u3d0x5R6i6h5M3c"
+        "0n0Q4L2R1431206u1L5t1q5w5Y5F6l385t0I5A5l5M3s5D291Z0f5W5W3a0u5P540k3i215Y50345Y0W5X4O1S485R6g0p1S362f"
+        "2b3k6d0w05051S0S0c2k0e0e24442S5I5i5P2Q4X5C4P1e2c1A2j1b252y5A5D565A5L3D0f273G3c2R3s1K4P2Y565A3d4k233s"
+        "315A452k5J3f6t2Y2Y5X515s4e1v172J06281Y130I1x2h5X455X0x341Y5x1u5u2d5M0i0f095Z2k3b2k5r2a3a0X405t235A48"
+        "2T0W5R0341141u5J5y0k0N1F294K420N2r4j4N4M5R6w293h4I2U0e6g6g2k1l2W2e2c2a2M1K5A6k1E5N5H5O5I31516l4b5S5L"
+        "0a1k5B5P5z1R1L0D5I083T2I0Y5T255u1g0B135x5x0B2l3a0b5h5A0F1Q5J5N4e5J2H2M5H1u2U5M5y2T2M2e2O55551q5r1440"
+        "6c4D3h5X2i0A2F3h4N5t5e0F6A0d0B20451g2C0x450d5r2Y0O1J5N150b2S4b3W3O4h6s4b1l2e4d1b2d265X383a0L5J5d5F0W"
+        "4r3h2a5t4u235D0I2a6o0x2O4g5z1c5Y5M3s205T5X244v4D2U4O4q555P5u5x6g2e5T345a2U592M2H1L6g480U2k6e5P020i4Q"
+        "0x2C6o0O2e5R0S0O452M2f554e5J052O3b6d5S5Q5T5t2Y5x125H695L4f0Y2S2Q4d51241L442f1m2e2U28252f020e0o4f650Y"
+        "2c1M5825234D535e0F5X2e2Y0i4Q5u6y2G5y6t5J4u5w1w2K1b2M6i4r2M634d5d1L532E2W2Y2M632G5T3d5B4d1J0Z63231H0k"
+        "160k206i3Y084k2M5p005B47083U1n0X5v3N00005p202T5R410N072j0x0C000Y3c0l6q410f6k6g000N5T455A2X133N3c6o0d"
+        "2S695x3W0X5v5T5N1x0W4M5e5e1Q0x4N4c4M0w0w4v4N514M5V4S2Y1u5V0d1q3D5e5W294M6a141u3q14415h215h6g623c0e0e"
+        "2U5L2U0x3m601m1u1D5e2d2d4g5t1u5e3m1f3Q2b5p0V3q2U0c6g0F3m3m0r5e1w0e0V6i3245323Q5R1m214L5X3m2l5R2U4L16"
+        "0E210Y6q285r2b0B0x5n2K280u2U165l2S2b2b0E3W16163W2d0X4Q4Q6i5R3t3p170e2d2Q1y1A2h6k5z4I5I3L2M5O0A5W062d"
+        "2k455z0S0e5R2M6u0J1q6l3S3W1x2r0N5K6i0X6g1l6i5c2i281o2i4I295J6a0j3B6h5V2f4g5c5i5R2d5t25585O0C6i1V5M3a"
+        "1a2f5C5i5k373W5C521u2M6i0U1f5x4G2I4P235A5R0d6d1J581o342S0C285e030C0e0e3h1G1d1g5t5X0S5M6l0Q0X4M6j0C5X"
+        "1Z1q2E5O0A5k5X1N5u232w295S5R2X4C2k0C5y1J5R5u280J08252U0v4P3L140V0h586d0g4M0Q315R6u0E6d6b504D4h152X2X"
+        "3k4b5S5T241u2Q2W492U2I5A1o0X5S1T02085A1J1L3F5X5t5R5V3W2K2M4Q0X2S142S2F0h280C5O5J2d6h392M272F28145J5T"
+        "5S4f5V5814312Z2Z0k0k1L061l121l07074a28656538103O2d241L0N2T1z3k282c3V1z021g1S1Q0e5r0E475y025C1S241S66"
+        "0S1S5C5Q421S2c025F242M3Y1T2c3W1x3S6k2l4e0T4h6a1G2l2l6k6a1G6e1b3h455T5X0b6e6j3U1T5T1T5R0k5r1T046c5N2a"
+        "1T5X2B1m1w0Z3Q1u4e4N0Z2Y6c3c2M2e5I2a3Q1J032Y5I6k0Y031G2M3m171x5I375s6i455Y5e5B1e5E5y3Q1q1e3h3i4N4O60"
+        "3e3Q1n3f0X3a382o5A2v4O5O6h5P4M270V6g2A2i4M5R4N3a3k6l6g6g3e4O5Y163x6t6t0y6a5J0j3d2W535i3d16133t3i5J0C"
+        "2A2j3l6g5f5O5N3k6j3k6f6h3a554K1Q23130B0U2j1g365A5y2C2F2a4I5e1M5r2L4O4d2R5M2f6h2M2F532j4V531b0e3W3m26"
+        "3x2Y5R2d0n6k5X26345z5F251M620L2a3a1b1Z5J5e2B1z4v385I1l5w3f0E2B3d5v2v0Y0A2r505z4d3k3i361p666d5R152v3k"
+        "4W0O2X0C363Y0B1L3c5r4w3Z5y49446l124M4W2Q0z5A2o5Q5I5i3l2S1L2a5Q02256c2a1G6e4f3a0E4C3D5L5P273c3e403e2K"
+        "2A2k5J3e272Y3c2W1J365y0F592o6l382e2e5X4X662k4O5R4M6i1Z4M5T2i6k2c0U1c022c695Z064O1745286t1x5x6f2w1y5y"
+        "1m2A0Y344G0X2k2M1u3h1g272p6i452o2d0i1g5M3W6f5N536o0z1e5p5N2e1q1l3k6a2i5X2r5o5o136b6g1g1u3m6l2E0f3H41"
+        "3V2T3S2J420k424M61022M2W5i5V2M2A0F2t4g6l2A1L1g3s462Y5t021A5A5F5N193V5y2I1Y4X5z494c5t495R2t5C4h0w2H1Y"
+        "5X5C5z37315V0z0z5w2U5T374h5N4G2C5X0C212Y0A2a3L4Z6s2t3V5N6q2u0B456u4c2S2l0k173h152a1T2Y02534h2L0b5S1d"
+        "5x45305r143s0b450A4u5N16171b5o2d5T0f2r0e5t4X6g1c5z0Y5d3s3V2a13580u5e451e1q5J4h4h341E3y511g0N2U4Y5909"
+        "213W5t4B2K0U5e5z5y2O3Q5t601d6f2r2E6o5P1M6o0w45053V2U2Y2o0J0A5S2K0g453k450S6u4c0M30284I2I4f69122a5y2S"
+        "1758243Q6149132M2a2c5y6d491e2a5X6q1T2r662K2d0F5Q4h0Y5R2b3W3W5X401g022r2a5X4u3c3S0N0k5O340m5A2A2K2K6i"
+        "2M2M1m4h3S5T2M2W2W3k0k4U1J2G0m5N4O4O2M4o4L5Z4Y4556345D5P5A45456i0d1d6j4n5R4O5W6i5f1u1u3d6w6i523a6A4f"
+        "206l4M530N0v3d2Y5X5B5x5f3Y6l1L5z6i281z6g1z4V2e4M1w2C130Z275a451G1J6y2T2Y0j2e0Z6i2Y0w0e6f255W5y5S6t27"
+        "6g1u5Y5x5A5O6i5R3a4Y130b6s6g5V281z594Y34561u5J455X5y284Y0w0X1L532M3F3d0Z2M4k5Z5d632K4r5X5X2M5D4b1T5k"
+        "5H4Y4n5k6t0u1x5R5A0j3y4e4e6j1p1S602r3f6i2f0e6i5X3d2w083W3x2M5W6w3W0k2T3k0B3y4b5O6A6i6i4Q2i6t27280B5i"
+        "6i271T5S6t6i2d4n1b5R6l253F1u5y1z2H1u5L4V2Y2C1x2f5d0B5k4K4V5M302Y1G6A4n6r0907286i6i2C2L3V2r0j0E6y5X51"
+        "325B5R5y0f281u3W3K2d6j6u5I0B0Z5u5A6t5X285I6g6i0Z29281z1z1G4q534q282p3m0o3a6i282Y51285T5u4e4D1T5R244a"
+        "28535C442c6s6j6y2Y533F4D254k3K5X40285m5u0B272A2Y0g4D4k6s2M0R5K5p2h4d5y4d2u5X4M2f5P0I6r5k2I4a6b5P0f0a"
+        "5P0j5p6l2c49155x1L5P6i0J5P5f2c0J2g5C0B2v0R5w0X2w2r6s5I511J2B1a6s5L5w5p5M5X2i4d5P5P5f0y5X5e152i2Q5y5x"
+        "2B0J6e2z2z2W0B0S2Q650R494d1a652W4a2M0F4O1u470F1Y451S4N1p4Q3f4f6c6l2T2W0j2f2f6d074Y2l1Y5i4Z2f155R4Q2f"
+        "4f2d411c2M6o0t120T5q2f2o2f6l6l2J3V5X0C1x376l5r1b282c0652284b6e545M6q5Y201R5C0s0e0e2a5R194I4N0V136l3o"
+        "0C1G2M4a3h0a5f4Y1u0r0c1l0V6t132T663H1u1F1m291x1m4O38425d2a4d2W3h0f311L4f0C5S5P5A0e4d2D125C2e4g544s1l"
+        "2A6l5i280V1R0r6j2v2F0e4H0Y6h0r1u605k3O2M2H2i1J2a1Q5i5z6i0B524O6l6A5C4K5h0r5N1z2y1x0E2A1y603N475C2a43"
+        "2F6v0e0e0e1A571I5X2a0Z1G0C6h4c4G6k2Y0k282S522l1u6a1G2u47472l0K1J5Y0r6w0k664a5o310X5C4x2a5J0f545B5A41"
+        "6g5F205R6l5Z0L2Y5x194X282d245F3a1m0I6o3X1q6l244a1Z4e3f471G2B4O2X601T595Z0E1z1o4x6h1F3B475C0R2W3V1b2M"
+        "0e6s0F4H0C6l482W2G2a0l2M250e130O5N3V0o6o3W3Y1a5X3g5l664H1L5R200w2v0Q4165281L512X0r2Y3y550R15552J1c6l"
+        "5C0k3d4H0Y2Q0X141u2a3h2B0W2c1224542I635C2Y4O63453P453P1x2i2Y2Y5N0k0Y4z6m1F472O0l6k2F4O2G2B5X5Z1S6g57"
+        "5d3B0E285R455c6o6k1m506k476s5c2Y2Y2a5o5T5X2F2W4a2O2G475Z6j4f2O0f1c6x2M4Y315T5Z6s5X3d131m4M6f4M3H1T2K"
+        "5A6t3x0T6d476b0e085x4G2p4r1p0e0S5S6f3d5720062M1x2i423k0Q6c6k0C515f2M5y511Y5i6t0r5Z6k2S6p072I1p1k4f1T"
+        "2P5A1u2P0o2f2M5Z2Y2i450S076d2S6u2f1N214A4A590f4r3e1Z5I6u202a630N2M5D1u3K0b1G5H1z594e290q6p593d4A1p65"
+        "2p2b3k4A4A3K5y2P2b2y0k234Q6u5A3K5l3B2M6A133B5f2G3d4Y2h5y1E6h2h5W280u6k5L5Z1Y5X1T5r4n5u5u4e3o6t5j3E1t"
+        "284Q0L3W6g4G1Y6i281p604n0X2e511n550S2h61062e1u6i456t0E1Y612K5y1u5D4M0k6l4f2T6l4K1x5O1u5o6g0W0F4O6j5A"
+        "6w2g084f3k4Q6y2A2f4n1R5D2d6l0E1H072k2A200N231D5a2d2w2c4g1w315J0d5A1u1B194q5f5S2K5D2j5I1w165i4Y2b5B25"
+        "2k6i2a2j0C3e6g2Y0B4e4Q095i5C234b1D5H5d5j5D1Y5y1u5h531d2C1u2f206i5N2g1q285I4n6u0A1f2M2Y2P0E4g4K45456r"
+        "455r475A4P5t455a5r1y5s0d6q0n1N0S302U456c0e0M2T3e454a5e6u1M6v5y6t5F2P2e1o4v3h5X6u1m2Y5I5T4J455I5B2a2r"
+        "5A4u3e281c0D133h3f5Y5D0a4Y4e0f231D0O3e5t1u5t5j1F3f5D2O6u0f605S5d1H6i600B0w0W5z5Y6u5I4N5t1D5J5T2e5R6q"
+        "3x091G3Q6k2a0N4g4U605z0S5y4q5a1u600A1z4s20625c5A516g6u5a240n0e1q0Q2M555N5y6u2K2j47366i2Y3m3Y2O3d5J6u"
+        "284I531m2Y0d5R4C3l5P48265A284G5H4j5J5349696A6i4I4A2S5X1m2Q0M6z2a4l0w4v5H25216x5y48600V4N255y4D2a2b23"
+        "650O5D2c0e0X5R3F535R4H5I280i472G445L6x453V5P3k2K5D6x2A5W5I2K5A0w2c2Y0w5T0n4k5A6y6x312M0Z2G2K2O4Y2h5X"
+        "1Y6k5A1A5Z285r2A284n5t601Y0L3W4G1y3o4n6u301p6i5u1n6l6g3E4Q5A1x5D1u2O6w4M5y6i6j6k081u0F4K5R2f0W094q2d"
+        "2w4l161R251B5J2b312k2c5i1D5C2j5H5y535a285d285I2T5T5I451o0M4J1M4N5t3e4P0d0E5a2U4g6u6c5r2Y6q6t2r5B2a3e"
+        "2G5d3f2860254Y1f1c0f5A1F6q23132Y0f3h5Y2e1u4s6g1q0S1z0w2M5R2a0i3Y362K5T553l4C5D2Q4I692b4749232c6x1t5D"
+        "1y1t4h1t450k415B6e1y5T5T4c5z1J6z580B455v5T2K582Y1J5s5s1y5s1Q31311u4M1l1G6l2i381G3h1y061H5d2j1u4M5N6e"
+        "6y1H6s5X6i031l2G4Q4Y3W342U061l2M0y5t0e28690D2U282j3d6e313W28282Z5O3d480V3a5O5W5W1p061z5O1G48641z2T5R"
+        "6l135H485R5A4q4i4i4823555A5R5O48475X1D2d595Y5y1m4I1p4I2O2K1D3G480w5X1E5R0D5v1p1Y0C0C0S1u5z0c5R2E5R3W"
+        "2T2U6i4f5y5D5B5y5y2r4925255C4G1Y2b130S1o0Z4G0C6l2a5J0C3X6u5r251Z1T1T1Q053Y5R2O1Z052S3U49051m5R255J0Z"
+        "5P2I2I2q386f451F1F1F16161k4R4u3p3p1c2K5h6t1D0y1S60063W5R4Y4f292i270F2I3028593N2X3G2b3R6a2X282I275W3k"
+        "221k5R175Q0V4Z4b600C0X0X1Y1D6i3Q3B0X6g0z2T6h5W5p2Q2W6i3D5f1k5M5g1H5I2O1S4N2R402f2i0e131N5u5I410O173x"
+        "5h2i0O2B2O2B0O2O5v2B2O2O0O054N4Z5h2B3B6i0X3D4a3x5h5h2W5X5X6e4Y515R514Y6e6e4r5R2J284e2s0q1A0k23240C4n"
+        "5C4s6k5Y1b1y4q1x0u5w0x1G6i1Q1u1o1p3T3R2a1n6r5W3o042s4j1E5X5u5P453W475y5y1o2s2f574M6j6d5D4M5t6k160X1o"
+        "060k4f5e0b1H576t1o6i3x416t1u3R6g5A6A3T294N6i0a3m4f202r0C5S5I5O2W192m2Y2f3H5N3R2x5R1K1P1A190C2c5G5G1k"
+        "031W3X3w6t1L0B5f6i0S3a5D0S5D3535285D3C2y4y64453s3d3F2Z5r0k5u5r5H2c2f5W1W0U2R4I5h3a0L4M47102j0Q5H5E5o"
+        "3S0B3u441a5o3A3s3W1G312M2O6d0S2d2P4V3W0g303X2K2B0K0X5e3u2f3p2E5Q5N4n4M0M1u1u2i1o485r193W1N6u175w3a3x"
+        "6o0C0P313N13035F3s4Q4T3q606j4r1g4z5k5P2a5t2c5X291c0e0x1u5A3x3e5p5c5m09472Y5p4P59516q1A5R0k2Q283W5D1z"
+        "2Y0i3N0x2Y1N3R0H0g2b1u593k5y6o2Y2c5T2Y6i5K0T2S5i3V3x0H2Q0S1L5C5c1m6i2c4I200S4w5B531p5T4I6m0X2y3F5n2O"
+        "0e5V2k0F5R2j2E2O4C5n1G450S0i5L3s5w645A0g5F2z2E5N2Y2761314f642Z3x610A475w1K642S1K6t2c3B0E281z0E3e3B6i"
+        "6i1A2a166i5H576g2h5A5X0u5P5X0D5y5y2h5X5X5F2i2h5E4L4L4L2h4O584Q4O5e5844441J215e0I4W5z5x6k0Z0I4I5R1m3O"
+        "571m080I1R1n080e2Y6j2a0p2T6l661f0k5A1A0I5z2Y4d3R5y2x1u651q2M4K5X2H5h5X5t0k3c3y2i244P2r0f3m160Z090u5R"
+        "500p0q2X0W5K5P0D120Y482Y5R282a273c452Y2Y0w4U1C2P2a2a4D5N1u415N5N0q0q5R2J5h2c023p5f2c2d3V5r5R0v3e3d1x"
+        "475X5X4K4d1b2045376t25536i5B3W1u5n5t5x6i454I5u474n1u2v2d2Y5I284b455N1p064v5E2821211n5x2k1F6i604b050F"
+        "385M1o4o1R0O5S5W0f5R4a5t2M3W1g5A0x0p6l515d5Y4j2T574K133f4c2M5V2r3m0b0a1F3h5R5R2i3Z4x2w3D3x0k0j4I5H5P"
+        "5A0c1Y5T6a192i163B1x20413a1u4N1G0e5t1u6s381m293838060N3k6t6i0C282f2W0O3A5Y5K5T4d1A3i2M4q5S1C470v0A5X"
+        "1S6t2R5x281L0N2a0N1F1K370u2c2c1u5X6l6t2b255S0u1l4q4s0D375i6j476l5L231u4g1w0V2f5F0I0q2f1k03490C4n2a5d"
+        "24412M2e2I4Q6p0V294l0e0r4925280Y6t4q265F315T5L2e545S351Y6k5P1b5t2M1a1u4n5S1T0e0l60135k53530B0A5x0h5y"
+        "1D2M446l3k2M6p6A5o4e4G550A3V2i3a3c5F2f0z4M2l5N5h5W0U1J1Q5W0U295s513E4K5A2H1u1g3k5u2d3q3m2o2F2O4O5w5k"
+        "5A275W5T5T1E0L37370N5r2f134f192a6v1G2E2Y2i5t2l3B2C1T44621z1N1u300x0E4Z0K6c3b0n062M5k0k1Q0a4b2j5y4b13"
+        "2d440Y2e49571D211G2T1o4b035s0d6k5N2i2a2S584Q5e0Z20451T0S5a0L0e0x231o2F453c415t0X4G235N5R5f455r0r3p6g"
+        "5o2h5g310e5R3Q0k3S175T5T5T5C4y4e2r5B5r5X5X1u2O5J5J3q0r5w0L5C5X0f38031g315T2D2D2b3e6A6A6w0a4r5y5Q034f"
+        "2a1u2Y2f3U1q1Y1Y1Z5N5k6l6t5B4n1A464c3d244M441w196k2a5t0k5t3O282064291c5P530O4g5t6g2B5h265y4O452G6u5P"
+        "5Y3a604Q136o1J4j5K0w2n2B212b2X5t3P5W505S4O0L4O606g2H4s3c2M4h525Y2M2i5y090F5I5k2U2714476w420U5Y0F5X2y"
+        "3Q44443o4X5y1p606h2a284x0p1i3d1S546g3i505I2U5y1G2H4q5v1w0U4O59314s555J0b5P1L0e6u1M6A5f0r3T2G0X282M4M"
+        "2H5X2T5T3k155f385i0F3V032O0O5y414e2e0L2d5t5m0q5X5R6t2Q0e2Y5I0l6d2K48365N2T280g1M1Q13512Y4L4J133g5L36"
+        "0k130U6f4M5J5t20053d2X0Q6j0n422b3d0O3A252j5S2a3y4Q5S1N0A204G2v47346466481a2O2S2v020e2M5t28474N1m3c3N"
+        "0w145L2c4v4v2K5X490F212a35600a5W4f2Y4l251g5d1o2k6y1l4s1p2B4W4v5M5I1u2k0Y5x194Y5C5y2W5u4K452a60542T5X"
+        "5z5v281Y4Y3F2K5J605X5y1S0a1S025t2525280N5B5r3g5R2L2b0o4M482O2r5Y0V5d595K0e6c545A1m175D1G5D4Q2a1S1Y4y"
+        "5E5L5P07504Q5L1d405t3D0E354s3Y5728650A6g1k3x5T1z0O5C451l2a5I2B280f153d2G2e0p3f4d4a5A2Q3N5A512Y5R5I5D"
+        "2M5R2E2K2c136i0b5c5P3k230g1m50585m4d495t2U253N1z600a2M4Q0F022S655J4b2F275o5x4v4v451W2Y515m3c60415X5L"
+        "282g5J3k4e512g3V3B0k4k5R5A5X2i2O2O5S485T2W5j215Z2T4f5P1m3a1Q2B2G280Y362K2K251q6i5t2B6c222M283d2K2231"
+        "282B2Y2a4y5c2K4g5C5R2Z3b0h20202Y3L2Y4Y5C470F205I0U1u5I5I2Y205X1S2c2i1N0a5N6c6c2B0i5y4Q0D4e15284e174O"
+        "5z2k6f4L5X1Q6t1Y253c1A535z0v4O5R345B1n1g060C475u5u4v093W5Z5Z2l455i5S450o5Y2k254b456j5M1S3m5s1p1p1R1E"
+        "651u4j2d1u0C1a0a5A3x0W4e5W6a410C5W1T1Q2i2M1u4j6a1F3W3W5A6l150h0j1G6c4f4L5g2T1G0X1G5T2M0B4f3l1A0N2525"
+        "371u5O5p2R6l5R5A2D2c2M5R41451O4L5R5s3k4d4a1L4d6i362I6f293s4Y455F2d4e4K5V295m0z0b1g1Q4Q5J1q4M4M1u5A6f"
+        "5x1u2M2H0e0F5Y5W2d0X5N5h145m255w6i4Z1o2i3d45455X2l2E3c484Y5y302M165f5a2C1Q1Q5X091o3W5t1e5R5Y554g474v"
+        "3x4c5t2P1N5r191g08135s0o5O5T1N0w172E2r2d5D5h385I3e5X2d4O5J245N0f4r5t1u5Y3a5t1u4s5D5W4e385z5T4O0D596l"
+        "6u5d1u5Y2B3c2E1b204e162M5w604f3q2X0L4q5T2b082H3R4Y5y0N5y5Y5v2O50084q4q285x5H1Q4b5R0e21595R1b3p1T201L"
+        "343i5R5u5T5b6j0p4C45365f4J4O0q0C13052Y5t6i590A3Y4f3W5X2a312X4b6j5S2b4S5u5C5r6f6f34341N2U385y0O2M365C"
+        "0x6d375B3k6y4Y4e5b6i3V3V2c4f0h2Q3Q1L5y286o241o2I2k2k255S0w2c4I3s5C5x0D5L4Y0F0B0Y2M5D4I5R2f0V0w450N5B"
+        "4L314b5T0v2M675J2O6l665D375D454q2a3c1S4s276s2d401T3g1m2K2d2E3h2M0L2M4e3B2Y1b5C6l2W2M2W1q5Q3W3r1G2j5T"
+        "4Q5y0o4f4g1b0o364f2d6l6s5K243H3T3H5E6j351k2m3g5y5F5N2o5Y4f2T5J4Q5A5i5B2d5A5M205t0Z0D5t0Z6r1W4f5R5R0l"
+        "1x5X0g0u5R4I0A1u1M1p4S2d3o6j0X5R6j6j2d6i5D4j6i4n4b2e2l5Y3a0v053A254j295o2T0W0a3S5P6A0e4K582i1T5K5H6g"
+        "5R3O0k135p1u1M6i6i4j3Q5R385o3o1F5J6f4f0b5X5y3d0k0k1u0C0C2w4n2b292a0k2d1k1A4s6l1L5S0n2R2m5F6p0Y5I2C2s"
+        "3A4Q292C0B2M2j4M431A5R5X6g2U4e4i285R0l6p4V4G4i2M2O2O2w2a1t0w0e2C5a5Y2T0C0x0E1f0g2P4J3T3T1o5Y311N5N1b"
+        "5d6i2i5R451N1H2s455d5d1u0D5D0f162C1c5H5H1T5Y0a0a1u5X5l5N250b0F2Y3S0X60561F0V224q5Y4s3p2g55085m0C4B3A"
+        "5T2d47222w2O2G2M6f4O2Y5R165D5A5t0g0q28484E0a5B0e1u2a6o2a0S280X611m0k5B5E0h4l362G05661L0q533F0w2O0e2e"
+        "0Y4Q580e2G1u4s6i1d4Q5p4O075D0k0A2F2W5y5A2G6f0W2i634O2a3Q5R2G5M5y5y5P1q581u1r1u061T28282a1J0f5N1L2k3X"
+        "383d3d3g4O4Y0w312k3d5f2O5P6i2l5y4I5t5y5e5X2G1g1b4b3R283i5T1F4f6c2e1J122a314f2a5t2k4f312G4M131J2a1J5N"
+        "1L3d4O0w2G2k285y135e5X1F2e4f2c4e2e0Q2k6i0y281G0X6t134J214g1A4O2d1L1E0F2d264e5F513x282Y6i6a0e5F204J1E"
+        "6i5K0F5y5R2M2k5y5N5y5N5N171u4e4e2c1Y281m5L151Y0v5a5I2d5R4n5L5S4I455o285L5S1g1p5M5P4Z4M5S5E2k5C3t0A5W"
+        "6i5G1n5E0y4L5N4y6r5I5R5R510C1T4M1T5I6g6l6h1F6t6t6c1G1u2a162T135O2M3s3Q6k1x5R2i5P6a5R5R4f6e410e5G4f06"
+        "0V6w5a6l0N6f5V5I5L5R241T4O0u5C4O1V0u1F1L4g252d211w5B5t4M6k5i3d6c3i1g255N5G1H1k0j5f5R2K6l2A2x5x5X5c28"
+        "6i4n0Q2H1g2A1h4O5h0X0b0w5W2t494b4R035X5C0B2d5A5x5x1z4Z0l252f4X6g4X1b210x4V2d2r4f0O5C535s5A1o0C565R3x"
+        "5S153W6s0w0A6r2845586q5t2i4c196h666v476s2P2a0F1S304M0g213X5X165I3X4O5J4O26211g6j135D1u445h2a455X6t6o"
+        "5y255S035A3q0A1q6l5O5N245J1A3K453l5Q5t5F5c6k4I2a422B24271A5T3d5C3d5y480A5K5d51090C474O2b5Y5D1T5a5P5P"
+        "2Y5X0g0O4c2M3k3k4J6f3j2a662d2O2X0o3N1M5y6s05052e6f5R202b360y1Q210w5I694D5y6a1d6h3s2G1g5T2k286z2c0k25"
+        "6o5x686a4O495868444N5J65580Y535A282c2f6c3r5R026c3W25215R5R4I4k3G471d56206k1S025T2a5X2a251b6f5J632K4M"
+        "5t0w2M5R0f6f5N1g0E5t0E5P0w4k5S2G0A5D3B23635R0Y6c5N1b5N28171u4n282d1Y5a4k4I455o5L5R5L284n2b253N2i5M3t"
+        "5I1g305G4Z1q4L1n2k6h1G1T416w4O5G6a516g136k0N4f6e0e5R5R2A2K4O1H4O28250B6l4M210X1F4g1L5L5R6h1w5B0u265I"
+        "6k2d5x5X495x1z5W252A4X4Z1h4c6l6v3K1b6s1o2r5t5X4V4M150w2P6r53584M5R3l0A16242a5D5K5Q5t1g5X5J0w6t035N13"
+        "3d3X5I3k0Y515D5P094O473d2e366f2a3j5868492G442k5N476c0A1G471Y5z281Y1Q1Y5y5y272Q1Q1b2W1a2b454O2M125r0e"
+        "4Q5A1q6i6i5N5N4O0F255n5R5n5R2a061Z1g0F5B232a2s1w2i1u5y0i1S5X6l291p5y0k5u230i136u1p5R6i0a0v033W3o3W1F"
+        "3o5W153k4Y5H232C1T1S3k03382M3x0e5X295l383W5y5R2i3k0F58232k0b6g5Y1u0n1E5b5R1R5r40271m581J666i1k6l4O0e"
+        "6t1k1L3X0f350W4N2A1o5g5R0C381T0e2Y2S251w3X6t295I672c1w642a5T5L6g4L0i0i4e4L0I646k2F630N0A4J5e3T1D5A35"
+        "2a531u580O0O6i286d1b2e5G0L600a622F1q0p284N5R6o1u1F4z662Q5R070A5r6i6q0g60690X635N444I5r5T2e1x5A640e1b"
+        "4Q5N4J5J2W1x640b6g1u5Y1E0n665A076d276i1m58400f1F6l1J1k2a0c4O5g1L2A0W381o1T5R676i29256t2S2Y646t1w2e4e"
+        "6g2F4L1u1b284Q4J0N0e6k1D3T0X2F1q6q1u6o4z665N6360694I5T1x0C5y4L3q5i5y0B1T0B6f5z596v6v2M2h1u6e1x454I4d"
+        "5S5A6t2k4b0C0N0A0A162i0y135y6c2k5Z4f280C0F1H5K6t5f1f2R1x550Q5y6e515S2i2a4h590M0S2Y4f0Y4e6t5d4f0C2449"
+        "492c655d1k63636w3O0a2w2r1e2k1u0A2a1n6i565Z06455Z485o575R3y2T3a06162w5o290N3S466l2i146i1u3Q2i4I0k3x2i"
+        "2M1C5R281f5A2c1f6l4g2x6n1L4d2B5B0C2Y3X6i295f0n2a0V490e5A1f282i284Q5k0F2f3B5C0l5K0T3m4Q2P5V2c0E493l56"
+        "2a455w5t0M2d283B2i3B302Y2L222i0C5r4g5d0k6w4a5R0Q6u0n6u3V6i6h146i5X1f1e0I5V6j136a0A0H2a1H592i1u6w163X"
+        "4r3K5d0u5m2a0Z0U4556483y145d283B3Q2U630e0D2Y2Q0Q590W515y2B286i48133Q6u2O0d653y0h5m2i120t5A1m0F6j1e0k"
+        "0Q0Q2k2k2S56492k442Q1e0R1J650V0e0e6l2i0F491e0E285x5Z3y2S2R6i2M6i0w0F1c5t2W2S5A5t6x2G5D4k4y3B564f280R"
+        "0U5y2B2k2S4M1E0X1p4f5d1f1f1E2H4n3102282i592u2I5N3a2p4f2X2I1f6i5N5d0Z5T5X0z5M1L2l5t5Z5E0W5J1m4n4I2A4Q"
+        "5n0A0W1g3o45384u2A476o1Y204f2A132T0W056g1m2A5O3V0b1G1G3S6l4q1g066k6i5P2r5R6i4O411k1E2i2c1K2Y2n4g6k62"
+        "6i4L2P5X4K5W5r5S6f5r1u4c6k3x2L6f6c2P6t255s0M1N2o5R3V471M3y411J0b303P2P4u4r285O5A0I0P0L1A5W1Y4Q1u6t1u"
+        "5u0c6c5X5u5a1G6g5z5Y2Y2c0y6o5t265K6f2c6c0l2I1p1m2S1A4D2o235R286q1k5X2a1Y2K3T2M2M2Y2S0z5M1L5J0W4n6o1g"
+        "304u1Y1G2r2Y6k6i5R206g2M5P4c4O626i2c6k4g2Y2c6f1u2P3y0b251M5s2P0M6t0P1u285u4Q3T5Y5z3y2Y6f2S5E1G0N0N3W"
+        "6y0f2E2E0N5K080f0f0f5K0f080N0f0f0A4s3F3F0w0M0M5R4o0f0f4O5X2Q0V0w1x475X5X455L5R1N3545615s5k6r5T0V602e"
+        "1R5M1m5x0V1g1P6f0V2e5Y5t2O0C0z3x5f6i5R2g290A0W1k13426l16665a4Q5o4f2f25195W3d0d283p5R2d6q2R5L5m4Z4O5a"
+        "3R1Z3x1e2g5J5L0l5W5C4e5j6l4e13135k2f5d1a5R6f5i1K5x4O0B51654i1q2O55252M1G2F0c0U2k0d230W2Y5W6k2e5X0M2B"
+        "5t5d5R0V5Y310e3K5X0Y531e535N0I0C5d5X4O6g5W601g0f1N1g5z244e0Z0V5t3q5R1F5P0E2U5L56130C5Y515647345P1J6d"
+        "054O0m0C51656f1e132X0C0U2S6z4l475J5X5R1g2Q2i4O0e5P355D531P6c5c1k3f0f0f2E2M5Y5P312M5R5h12455V4I1Q5X37"
+        "4s4d5y2A1u2p0i1n5F3o5E4M095Y0T275D095x2i5W1Q574e0e3W0j4K0b5p136v5Q2S2A1L6l4O2w5X1w1T4a6i28231Z5F2c5y"
+        "1L3K2H292y6h2H605N0B1a5y2Y1u5x1u1z1S2H291D2l5T0k5y0b2M600l5C453W4c1N6k586v412F3x0A5W0l5B0X2i5V495R1a"
+        "5N3a4x0b1g4Q2j5X601Z2B5B5B50593i5y4s0F6t6v5Q5x5B601S5V0e380y1u2Q5S6o20495N6d36495I120e5L0e695t6h384I"
+        "2S420X3c5Q0q2y1q3c6v2A2O630w5W285N0w0U2T235y1q632M5W174e6s3T6k5R1x5X2h5N6y386g5I1a6g1p5Y1u60575e465o"
+        "0Q1Q1G51420E623i2I0M0E5W5i6i5A2b0B5S5k2c3a2w522K446y1P5N4H3z5t2Y2G5N5a3T6c0L586y6q0Q2C5d5A1b205I5F58"
+        "4e0L60422r503d4g0E0U605V046a1P592b3Y0A5X2M652I5R2b0l2c5y581l3F5R2M2i5N5R3z4s5L0E5N2T3d3d3z5E2c4H3d5N"
+        "0f0n4O5W4O4O2M6j5Q2P2M2e2e1v5R2Q0Z6e17424e061u6g6i062Z1u3p154I492v0I6t1m21211Q1y45374p134Y5y5R0v4O5k"
+        "5y3H474e2a3W5Q2e061n0A5F1a5Z471u0l3o5E1g2k1e1F5S47084y4n0y3E1p605R4b3W1N1Y5S2l155R6j5y1w4p27572p5Y2Y"
+        "1g4b1f6t3x5k4O3h1G2r2T0j4Y1G0k3W5X4Y6A0l5W5e296g4O4O6i2i0w4O4O5J6e0a1T0e4N0F4O0k6l0C61425i471u6b3847"
+        "1u2M5Z3W5O080k2d1F4Q6h3m5y5y13293m58235R4Y2A2m0b2a5i5F1Y2c0C1k1A0j4O3l295S2l6k0D5B5i3k2K285X5I4n6z6i"
+        "4d4I0C5A5F4g3W5g6l5B3i2x5P5A5A5H2l0u2I283W4s3d5R5S1K03185W4D2q472Z4Y02151Q4v4O2t4e5C6f5H645d0U1H1Y6j"
+        "5j2Y3a2H5r5E600b5x515X0w170k1Q291Y0R1q0w5r6i4Y5J215X5f2A6s325F4b4M1Q325Q0F692i5A1g37442M3Q4v0B1z2M5b"
+        "0j6l6g5k2U6y2i0x5Y2a1y155a0x301N2T3W2Y2M48432j3h6y3V033W5A5M6q2K012u562C1b3u0K6t6h0c3B6u0L581745476q"
+        "285X2e1J380x5e5y2O5a1G0U4Q6g2Y3c2Y210g1v2F2s1n5x3p5r6320105A3X272P1l3b2n5T132O1N5A1b5k5t6u1u4r281g2l"
+        "0A5d6a205O1c5z5X2t4N245t1u6e0u4a4O1Y2B5e3l49491Z5j0O235Q3h2a1c2a4Z2B205J6f2d6g0f6j6t5H5Q3a3P022d473a"
+        "550V095z2O552n2U5P5Q3G5v4q5955482M4X0K0k3Q0V0e4B1y6t5x5T245f2U2n544G505r1S6g6g2H5R5Y593B5y291A342j4Z"
+        "6w555z1q5u3o2Y553N6w5l5H1J5J2O4P05363k310e5t2U134A6u5R2Y052t480S450x59365V0w1q2f0g4Q2X5H0O2W632a0q2M"
+        "5z5y2p4U0d6d470B2Y2128442548422S4D5H4A0B2B4Y2U3s243Z531m494g5O595B2k2c6z2Q4a2I1d5E63282a6j125M5T1d2k"
+        "3G63445g1m0B174I2n2a1o532Y2j255X2O6s492a6s2K0e5g235Q1f1N0Y2i1p0V0b5R026u5L156l1W6q283B1T274c0i5T2B3D"
+        "5I2a2a470u6i3g2M2K286x2A4J3V2E1b4X0M2Y0g0a2Y5A2z2W1g2Y5E2a2G0k2a5P0w5B2a5y1J0p3B2K0R4f3Q316x2Z653B2k"
+        "596l2G2e1v5R6g176e422Q5k470I4I4y1m153b3H5O0v5F1w0l572i1e0y6j3o0b1y08475P4b2l5x1F2p1n275j3E065X476h47"
+        "1G0k2r420l0k5Z6x3m5829145W5g0k2T4X47380a4O5J560e3x3W1f5F2q2I1k375M5W0B295Q3s6i0Y5i2Y155S2n6a6l5y1718"
+        "5A214g4G1O151A3i6h4D2c5R0w0D59035S4s6l2I445x2F5b2O2t5C552M690F1N1z1g5H0U321q5E2U2n2a4v5d2H4b2i01486f"
+        "3K0U380c45102r2C0x5y1G310K6q2e6i5A2j273T58172a2i3c6t4a5T2n484Y1g0u496j1c502423021b3a2X6t1o3a3k6g0k1A"
+        "3B592j3B3o2U1z095R290i4q0g5936310d5V2f136w5J2U0w2k2Q442Y1d2G440R4812272K236s2O5R0u0g2E0w5B6d0x2h0516"
+        "4f2Q3d6d3b344T4I273b5N0e1Q0e4I2n2p0d1Y4w4A5A5A2a3h5z4V1a6a3s6c3V5z2T0f0e4w021J1A1A1l0F1Y1L3h4D2C2H2Y"
+        "5h4G2i5Z5Z0w4f2S0x4H2C5N5u5N1g265X5u1Y0a1Y4f5P5u08035t5S2D4h2G1b4g1q5e3B562n1T4h0J1J1a452B591J3Y2o5y"
+        "250w3W0Y23565u563b4T4I5N1Q0e5u0J4w5t5A1Y2a3h2p3b6a3s1L5u563h2Y2n1l1A1T2C2h5Z2H1b5X5N0x5y5u265N1g0w2G"
+        "4f252D4h1T5e0V4h1Q231u1u2J1d5E475x1w6i5S5O1a1g4N083T2t604u6i3W2f1n5O5S6g2d0B1g4f136w6A142T015o5o0b0j"
+        "1u282Y2W0A5F1f2X3k2b4Q1f5A1k1L5X1w4I2l495F0L1u0e5z4I4N6i441a5Y6g0F5A0Z3B605A3T1o6v5R1d305S2i0K0A3W2T"
+        "5a5A2Y4N5A5S6l5O4o5z0D5N5S4Q135X2W5t5t3B1d5303242d535S1w5N251A605x2B025y59286d0Z055y5S4y4l2S5m122c53"
+        "53055A1p3x1k280Z5y5S6i252W5y2M2M2M6q206i542j3q5R4h5N4b475G5M281G236i1F2j0N5V2i0F2061315X0E15531Q5w4U"
+        "1J0F615V285y0E2U2M3q5K6128285X5X5K3o1t4D3m5u1p3R602M0C5O2T2K030a5x140Y205x155I283m0A5C6a5h6g3T3a2T45"
+        "6k274G1o1Y6c5S3x6l5n2S2T195T5x2T4U2T5z1Y5S3535602U3c0i5x5t2D5S5y5R020X5c5A5X2Y2W0W283R5O063W5t1q5y28"
+        "353c3c2K2M27021o0W2W2T021q2M0a1T1T1T0j4c4c2f5e6g2f0B4c2f2f142f5e1o1o2q3d3e3e0a5Q5e255Q1A170u474n131b"
+        "5x4n4b2e5K3E065S4y3o3k6w0V085R5P5a0b2d1Y3S5O0j5S1A5a2d5D03031V1E460V495h365T535f495J2u0d564J0j2D2i2E"
+        "5D4r091j4e4e1T493m2i2a0f132a5u5a1F560b5D3Q1A0e2D592X1L495K282a2b0w0V205A471b5p2a2G5t4n1u3a4g1A5t491Q"
+        "0x2D4r604L5t1A075a1F601z0e5t531b5p1b5t4n1u1Q5t605a2h2h5A5D5A285S61604K2J3V245T603V035S5B205Q174c2B5B"
+        "4W1Q5I5R5I1g4Z2B451R5X5r081e130X3Q422T0z2f2K1T491g1g5t5D2D4M5R5R1P1d5X412K1u295j252B29315h0B5T60201Q"
+        "2f5m5m402F5m6t6t0K172F581Q472r0S5J4b5R4z5d1g1g5N5u2o5V6o5N5A5E5R5Y4B14142b2B2K2I3Y5q360Q5P1S491G5L5N"
+        "250w4s3c0i5A402Y2G3B4g5Q174c1Q5B4W5I5I5r1G1e45084Z1R5X2Y2T422f2d295h1T5T2g2r5R40255m1Q5T5T2r5d5V1g6o"
+        "5N1g3B36144B1S2K0w4s404g1q0g1H1u5z6c0g4y06572R1H5J4K2i0g4Y5t5O5P502n501m2U5y2U3Y3Y2U0g0g0g2Q0g4D1q5H"
+        "1q5O6c0g4y2i4Y505P2U3Y0g0g1o1m1o1o4O4O0o28174Y5o6c545B5n4n5X2j0C5S1m1m545S5j5R6A0e2d5a0a0N5g4Y0a4O1f"
+        "1P4n5e2c290j5P5i0N5B5O2j1k5N2J5y0o0k3u1g0l2l1a515X4O5P261N4O2a6q0j5A0l5Q581o6d5t1J1g3I6020245g252a1Z"
+        "02591p5t1G0u4Z590k1z5y2B2U505a5Q5u3k59360e5X5H2e4A2B6o4I0C0X5R284l0B5V5a5t5B6c1p1P3c5N3k0w5B31633r4O"
+        "17285o595n5y4n5X0C1m5S2a4O0a4Y1f5R1k4l5B1T2J2c5y0j0k1a1g5X3u2l1N265A1J0u2B1G500w5Q3k0k2U5H2e364A6o3r"
+        "4P2B1N5B1p0k3x0e0k5k1Q1o2a03021u5A605E1p405E345X1q1Q135o6f0C5L6l6i3T5E4p4y605u6i0X2Y5W0k0a2k5o5R4f5u"
+        "4f2g426e5Y3T6k2i6l3H2i3W64292T6g571u5O4O0e5o5o4Y2U343X5a6i4q5c195L4g4M2g1k1P0k6l5S316k0X1P2U2i4Z4b37"
+        "2H1Q5k5J5m2l1g0B5F022Y6q6k4L3X2C5a2F6u2r45455N1o4C5N1A5P5x3X0O3X471o2447275X5d4g5z6u2B4r4Y1H5o1L5047"
+        "0B6i2U3V5c5y0q1b5N5Y6v4C4I456i4U2Y5y316d3k050o0g0O4f0e6i5X5I210k515C2S6c1e2U5o0t142c5g5N316c2f5R5Q5o"
+        "406k5N2W2Y5c5B284U2i5y232M0g345X5o5L0C4f4p0k2Y644O4Y1u2i6v6l5o3H295R0W5C345S2c21311P3X0g2M0B5N5F4b2l"
+        "45452r6q6u510o3X6i2B4C5x052U474I0g310O0w6k284U5B1G5t5t5t5X1x5R045j2d0a0b0N5d132w1P491Z2x1A5m1D3X0e2r"
+        "465X532X0k5C090k0N2z0i3k2Q2X5C1b64535d0i2z2Y1z1z492q492I4C0g2C2C131n5H4j380X2C0i1l5f3W6t1l4j5d0a0e38"
+        "1u1k4q4f1E5H2D283V6m4K555d2M0i6u133V4Z6h4g6u4W2a5o202E2h452O6g0i3V344A36364F5I2R47473r232D3D0i2R4k1a"
+        "1a3s1Y5y1a1Q1a1a2h0x5X5X1A5N1u4b1L6u2U1L4J5X1L3a28451v2B2606423a5I5N5C2P5X5m455s2P5t1x0C3Y0e3k285I0E"
+        "5N6c5X0Z4n2d061Y5o15285I1g1g4G1R5n3k2d4M085Y3W2Y5u202Y611n1p3o5W3X3k1T5z4f1Q3W2T5o0k4e411u0e0N5t2i15"
+        "065W1M3W3y5F570a1u6a2i1G4O190W562d4Q1Z5B1k035t6e6l5S2R315i5d5R0j5t2c2w1L5A1A252I1u2q5H1f2l5d3e4K6a55"
+        "4b5X3u6f1M1D515x4e4I44235f2M4G4G2q3c0B2M6v5y5V4M6t456h5B3u0L28154a1G6k192F1o3x5R2C2Y2h0x2f302T6v2M3c"
+        "6u6i3y205X134O4M235d1Z5F6l2E6u670f0f234g675t5t5X0L4r16242O5N4e4e2a0e1g5O1u4z1x5z5o204O4x5J5u471S5x1n"
+        "4C2U344O4O1J6t5c565P1g5V47455u4x4M2O052J253h285f4f2a4M365y4e0g28286l2b5H6o5V6d2p5K0h5X4f5B0k2c5L5124"
+        "6z4I4I1m1L2S5L3f5y695B1p1J1Z2y674C6c1x1L5T2M0x2K4Q024s285I204Q2M2R2M3g6g5B1g2Y1J2M5A5X0Z285W5n2Y1n06"
+        "1T06413y2Y5W6a1u060a1Z3W571L2d2q5t1k5i671Z2y282c5A6a5B5L1D2M2O2a2M4O5f1M4G232l285V4c2T456v1o2C0x1G3x"
+        "3y152f4M4O6t1p160e0x5d5u5t4z1g4e1u244g2b0f4C0545561J5P3R2a2J0g5K0h363h5V5t5y1L4I2S6z201x2M6c1J3A5R1u"
+        "2M2h0l5N1u15281q4s1x4O1q3i0a5Y6i204b1u085u2a4O5X1t5P2k2k3W236g0a5N5M6h1n1q5u3N0W1A4s2T3g1u5o3h2M0f6i"
+        "1A5Y0N4f5C0C0X2i5P1G6j5X5O5X5M5g5X5e5T1d5x1k1H026i5N1W5C292R6l5O5d1Y314s3l1A4n2c5H6k0C311W3y1g2Z2928"
+        "5k235o0l5x2j5X0k2l2l0e5y2l2i5k2f5d1g1g2A205x4M2F2c3Q2Y3W4Q1u036s3V4b470b152Y4h2a2i5k5M5Y452M5Q6q2u1f"
+        "2C4N452f5R5R2f6t2F19450L1D2i2k5R6z284Q5T0C3f4r034e5d205d1g2d381u0L5k5N1T5Y3X2C3a205T0I5x2i190p1n1T5T"
+        "5Y5A5v4O1T0F595z4x2U281G2a541Q0N0N5R5P5N282M5e2v5d5d5R5k345C1z5e0A285l6f055P5R3N0C6i2U5V2Y0e4U6s5X5x"
+        "2k5S5d4Y2c5R210e5T51241m2c2Q5N1z2h5A5A5k356z5X5T2Y5l5A5K5R3W0F315y5R28665X6c5Q5O3W3D203d5T3c135Z5X2K"
+        "0l2Y1T2W4U5Z5T1J4f2M2Z3A2h285Y3i4O3N5M0p0a6g1G192Y5M5C5O2T0C4f5Y5K5o4Y6i1k1H5H1W6k1A2Z1Y5x0k2M2j1G1g"
+        "5X5A5d5x4h3f032C0b3V470L1D5Y51201T1g1G4e0N3a5x5R5P5v2U285R2a1T5R5T6f2U2Q2c2h5X2Y236c5T203c1J4U2Y2e2T"
+        "2a5A0U2a2a5N0U2Y5W0Q283S0Q3S6l2l6l2a3d3d5X2U0A2l2S3x452Y2h2l2f2M5B5A293d2M4L6d2S2f452T5N0Q35351T0y1u"
+        "3e3e1u3S4f4f3l1u5A2F4f3e0C1q1u4f3e34393k253d6v3J1p24242e1K5e5j1Y212A1Y4Q2M3y0C1U1U5R470X5y5n3k3k470W"
+        "0F5W145R5z5N4f3a5N4c5Z2M0Y1b0o5N5N5N0X036g0W0o5R3a6c5N1b2Y6i1p1u1u3e3h5Y0Q4f0y5p6l6i3c050h5o0e5Y0y5o"
+        "173d3p176t1G1G191p5a5Y3W0x1z455Y595c4Q4Q1p1o5u06155o6j4f4N4O5W4O5h5x2i2f262i5N5k4Y5y5A5N2K0e5P4e1Q5x"
+        "5x1Z5D1g6a5H5v6a3F3r456b286t282845280C0A0A1T5M5S5D0a665D0v0C5N2i5f2T2T0F4g5D2s3B2h5P0M605X0F5R3x666v"
+        "4f605N3N1g5w5R0N6v140F2e5M0C0A1T5S2i2T0a5f6t2s5X0M4f5w2W3R1E3R5N2W2W1E2o0V2T0V2W1E2o1L4e0h1L5Z0K1T2k"
+        "5D5X000000006c005s0000006v000000004P00000000002Z000000000000004I2P00006h000000002P1y5635000000001A0X"
+        "000000000000000000000000000000000000000000055e3x00001Q062I5o196i2H035o3d350l29002H5F"
+    )),
+)
@@ -1,9 +1,38 @@
 # main.py
-from core.app import YeahBusinessApp
+import sys
+
+from core import startup
+
+with startup.phase("导入主窗口模块"):
+    from core.app import YeahBusinessApp
+from data.db import close_all
 from data.db_init import init_database
 
 
+def show_startup_error(message):
+    """主窗口创建前出错：弹出错误对话框"""
+    import tkinter
+    from tkinter import messagebox
+
+    root = tkinter.Tk()
+    root.withdraw()
+    messagebox.showerror("启动失败", message)
+    root.destroy()
+
+
 if __name__ == "__main__":
-    init_database()
-    app = YeahBusinessApp()
-    app.mainloop()
+    with startup.phase("数据库初始化"):
+        try:
+            init_database()
+        except Exception as e:
+            # 迁移失败时表结构不完整，页面会因缺少表或字段出错，不再继续启动
+            print(f"⚠️  数据库初始化失败：{e}")
+            show_startup_error(f"数据库初始化失败，程序无法启动：\n{e}\n\n请备份数据库后联系维护人员。")
+            sys.exit(1)
+    with startup.phase("创建主窗口"):
+        app = YeahBusinessApp()
+    try:
+        app.mainloop()
+    finally:
+        close_all()
+    sys.exit(getattr(app, "exit_code", 0))
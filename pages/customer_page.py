@@ -1,30 +1,30 @@
 import datetime
-import math
-import sqlite3
 import os
 import json
 from pathlib import Path
 from tkinter import ttk, messagebox, Menu
 
 import customtkinter as ctk
-import pyperclip
 
-from data.db_init import get_user_db_path
+from core.bulk_window import BulkWindow
+from core.grid import VirtualGrid
+from core.list_page import ListPageMixin
+from core.selection import Selection
+from data.bulk import bulk_delete
+from data.db import get_connection
+from data.fulltext import fts_filters
+from data.pinyin import full_pinyin, initials, name_filter
+from data.list_query import KeysetWindow, build_where, row_to_map, select_columns
 from pages.setting_page import get_table_settings
 
-DB_PATH = get_user_db_path()
-PAGE_SIZE = 10
 
-
-class CustomerPage(ctk.CTkFrame):
+class CustomerPage(ListPageMixin, ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F7F9FC")
 
-        self.conn = sqlite3.connect(DB_PATH)
+        self.conn = get_connection()
         self.cursor = self.conn.cursor()
-        self.current_page = 1
-        self.total_pages = 1
-        self.selected_items = set()
+        self.selection = Selection("customer")
         self.search_filters = {}
 
         # 获取表格设置
@@ -32,6 +32,8 @@ class CustomerPage(ctk.CTkFrame):
         content_font_size = settings.get("table_content_font_size", 20)
         heading_font_size = settings.get("table_heading_font_size", 22)
         row_height = settings.get("table_row_height", 36)
+        # 大表无筛选时可只显示近似总数（settings.json 中 approx_count_threshold，0 为关闭）
+        self.window = KeysetWindow("customer", approx_threshold=settings.get("approx_count_threshold", 0))
 
         style = ttk.Style()
         style.configure("Treeview", font=("微软雅黑", content_font_size), rowheight=row_height)
@@ -47,6 +49,8 @@ class CustomerPage(ctk.CTkFrame):
                       command=self.edit_customer).pack(side="left", padx=5)
         ctk.CTkButton(toolbar, text="🗑 删除客户", width=140, fg_color="#E53E3E",
                       command=self.delete_customer).pack(side="left", padx=5)
+        ctk.CTkButton(toolbar, text="📦 批量操作", width=140, fg_color="#DD6B20",
+                      command=self.open_bulk_window).pack(side="left", padx=5)
         ctk.CTkButton(toolbar, text="🔄 刷新", width=120, fg_color="#A0AEC0",
                       command=self.reset_filters).pack(side="right", padx=5)
         ctk.CTkButton(toolbar, text="🔍 搜索", width=140, fg_color="#4A5568",
@@ -117,13 +121,21 @@ class CustomerPage(ctk.CTkFrame):
             for c in self.columns_default:
                 if c not in ordered:
                     ordered.append(c)
-            self.columns = ["select"] + ordered
+            self.column_order = ordered
         else:
-            self.columns = ["select"] + self.columns_default
+            self.column_order = list(self.columns_default)
+        # 隐藏的列既不显示也不查询
+        hidden = set(settings_all.get("columns_hidden_customer") or [])
+        visible = [c for c in self.column_order if c not in hidden] or self.column_order
+        self.columns = ["select"] + visible
+        self.headers_map = headers_map
 
         headers = ["✔"] + [headers_map[c] for c in self.columns if c != "select"]
 
-        self.tree = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=10)
+        # 虚拟滚动：Treeview 中只有可见的行，滚动时按需读取
+        self.table = VirtualGrid(table_frame, self.columns, self.window, self.format_row,
+                                 on_scroll=self.update_status)
+        self.tree = self.table.tree
         for c, h in zip(self.columns, headers):
             if c == "select":
                 # 勾选列头绑定全选功能
@@ -132,28 +144,13 @@ class CustomerPage(ctk.CTkFrame):
                 self.tree.heading(c, text=h)
             self.tree.column(c, width=160, anchor="center")
 
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
-        y_scroll.pack(side="right", fill="y")
-        x_scroll.pack(side="bottom", fill="x")
-        self.tree.pack(fill="both", expand=True)
         self.tree.bind("<Button-1>", self.toggle_select)
         self.tree.bind("<Button-3>", self.show_context_menu)  # 右键菜单
 
-        # ======== 分页 ========
-        self.page_frame = ctk.CTkFrame(self, fg_color="#F7F9FC")
-        self.page_frame.pack(fill="x", pady=5)
-        ctk.CTkButton(self.page_frame, text="⬅ 上一页", width=100,
-                      command=self.prev_page).pack(side="left", padx=10)
-        self.page_label = ctk.CTkLabel(self.page_frame, text="第 1 / 1 页", font=("微软雅黑", 16))
-        self.page_label.pack(side="left", padx=5)
-        ctk.CTkButton(self.page_frame, text="下一页 ➡", width=100,
-                      command=self.next_page).pack(side="left", padx=10)
-        self.total_label = ctk.CTkLabel(self.page_frame, text="", font=("微软雅黑", 16))
-        self.total_label.pack(side="right", padx=10)
+        # ======== 状态栏 ========
+        self.build_status_bar()
 
-        self.refresh_table()
+        self.refresh_table(reset=True)
 
     def open_column_order_window(self):
         win = ctk.CTkToplevel(self)
@@ -161,7 +158,7 @@ class CustomerPage(ctk.CTkFrame):
         win.geometry("680x520")
         win.grab_set()
 
-        tip = ctk.CTkLabel(win, text="请为下列各列填写排序值（可为任意整数，数值越小排序越靠前）。保存后重启应用生效。", font=("微软雅黑", 14))
+        tip = ctk.CTkLabel(win, text="请为下列各列填写排序值（数值越小越靠前），取消勾选“显示”可隐藏该列。保存后重启应用生效。", font=("微软雅黑", 14))
         tip.pack(pady=8)
 
         # 中文名映射
@@ -179,27 +176,30 @@ class CustomerPage(ctk.CTkFrame):
         scroll = ctk.CTkScrollableFrame(win, width=640, height=360, fg_color="#FFFFFF")
         scroll.pack(fill="both", expand=True, padx=12, pady=6)
 
-        current_order = [c for c in self.columns if c != "select"]
+        current_order = self.column_order
         editors = []  # (key, entry, default_index)
 
         header_row = ctk.CTkFrame(scroll, fg_color="transparent")
         header_row.grid(row=0, column=0, sticky="ew", padx=6, pady=(4, 8))
-        ctk.CTkLabel(header_row, text="列名", font=("微软雅黑", 15, "bold"), width=420, anchor="w").pack(side="left")
+        ctk.CTkLabel(header_row, text="列名", font=("微软雅黑", 15, "bold"), width=360, anchor="w").pack(side="left")
         ctk.CTkLabel(header_row, text="顺序", font=("微软雅黑", 15, "bold"), width=80).pack(side="left", padx=10)
+        ctk.CTkLabel(header_row, text="显示", font=("微软雅黑", 15, "bold"), width=80).pack(side="left", padx=10)
 
         for i, key in enumerate(current_order, start=1):
             row = ctk.CTkFrame(scroll, fg_color="transparent")
             row.grid(row=i, column=0, sticky="ew", padx=6, pady=4)
-            ctk.CTkLabel(row, text=headers_map.get(key, key), font=("微软雅黑", 15), width=420, anchor="w").pack(side="left")
+            ctk.CTkLabel(row, text=headers_map.get(key, key), font=("微软雅黑", 15), width=360, anchor="w").pack(side="left")
             e = ctk.CTkEntry(row, width=80)
             e.insert(0, str(i))
             e.pack(side="left", padx=10)
-            editors.append((key, e, i))
+            visible_var = ctk.BooleanVar(value=key in self.columns)
+            ctk.CTkCheckBox(row, text="", variable=visible_var, width=80).pack(side="left", padx=10)
+            editors.append((key, e, i, visible_var))
 
         def save_order():
             # 收集排序数字，数字越小越靠前；非数字报错
             order_list = []
-            for key, entry, original in editors:
+            for key, entry, original, _ in editors:
                 val = entry.get().strip()
                 if val == "":
                     messagebox.showwarning("提示", f"请为列“{headers_map.get(key, key)}”填写排序值。")
@@ -216,6 +216,10 @@ class CustomerPage(ctk.CTkFrame):
             for c in self.columns_default:
                 if c not in ordered:
                     ordered.append(c)
+            hidden = [key for key, _, __, visible_var in editors if not visible_var.get()]
+            if len(hidden) == len(editors):
+                messagebox.showwarning("提示", "请至少保留一列显示。")
+                return
 
             try:
                 cfg_dir = Path(os.path.expanduser("~")) / "Yeah2Data"
@@ -229,6 +233,7 @@ class CustomerPage(ctk.CTkFrame):
                         except:
                             settings_all = {}
                 settings_all["columns_order_customer"] = ordered
+                settings_all["columns_hidden_customer"] = hidden
                 with open(cfg_file, 'w', encoding='utf-8') as f:
                     json.dump(settings_all, f, indent=4, ensure_ascii=False)
                 messagebox.showinfo("成功", "列顺序已保存。请重启应用以使设置生效。")
@@ -239,78 +244,24 @@ class CustomerPage(ctk.CTkFrame):
         ctk.CTkButton(win, text="保存", width=140, fg_color="#2B6CB0", command=save_order).pack(pady=10)
 
     # ========== 刷新表格 ==========
-    def refresh_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        # 显式指定列顺序以便映射（含 wrist_unit，若不存在也已在启动迁移中新增）
-        base_sql = (
-            "SELECT id, customer_name, customer_status, customer_phone, customer_address, "
-            "customer_email, wrist_circumference, wrist_unit, source_platform, source_account, "
-            "wechat_account, qq_account, last_purchase_date, total_purchase_amount, last_return_date, "
-            "total_return_amount, purchase_times, return_times, remark, create_time, update_time "
-            "FROM customer"
-        )
-        params, where = [], []
-
-        for field, val in self.search_filters.items():
-            if not val:
-                continue
-            if isinstance(val, dict):
-                min_v, max_v = val.get("min"), val.get("max")
-                if min_v and max_v:
-                    where.append(f"{field} BETWEEN ? AND ?")
-                    params += [min_v, max_v]
-                elif min_v:
-                    where.append(f"{field} >= ?")
-                    params.append(min_v)
-                elif max_v:
-                    where.append(f"{field} <= ?")
-                    params.append(max_v)
-            else:
-                where.append(f"{field} LIKE ?")
-                params.append(f"%{val}%")
-
-        if where:
-            base_sql += " WHERE " + " AND ".join(where)
-
-        self.cursor.execute(f"SELECT COUNT(*) FROM ({base_sql})", params)
-        total = self.cursor.fetchone()[0]
-        self.total_pages = max(1, math.ceil(total / PAGE_SIZE))
-        offset = (self.current_page - 1) * PAGE_SIZE
-
-        self.cursor.execute(base_sql + " ORDER BY id DESC LIMIT ? OFFSET ?", (*params, PAGE_SIZE, offset))
-        rows = self.cursor.fetchall()
-        # 获取列名以构建键值映射
-        col_names = [d[0] for d in self.cursor.description]
-
-        for r in rows:
-            row_map = {k: ("" if v is None else str(v)) for k, v in zip(col_names, r)}
-            ordered_values = tuple(row_map.get(c, "") for c in self.columns if c != "select")
-            self.tree.insert("", "end", values=("☐",) + ordered_values)
-
-        self.page_label.configure(text=f"第 {self.current_page} / {self.total_pages} 页")
-        self.total_label.configure(text=f"共 {total} 条记录")
-
-    def _get_checked_ids(self):
-        """从表格当前显示状态收集勾选的客户ID（更稳健，避免事件丢失）"""
-        checked = []
-        for item in self.tree.get_children():
-            vals = self.tree.item(item, "values")
-            if not vals:
-                continue
-            # vals[0] 是勾选列，vals[1] 是客户ID
-            if len(vals) > 1 and vals[0] == "☑":
-                cid = vals[1]
-                if cid:
-                    checked.append(cid)
-        return checked
+    def refresh_table(self, reset=False):
+        """重新统计并显示（后台查询）；reset 时回到顶部，否则保持当前滚动位置（新增 / 编辑 / 删除之后）"""
+        # 只查询当前显示的列，按列名取值
+        columns_sql = select_columns(self.columns)
+        # 文本条件走全文索引；名称还可按拼音首字母查找
+        special = fts_filters(self.conn, "customer")
+        special["customer_name"] = name_filter(special.get("customer_name"))
+        where, params = build_where(self.search_filters, special=special)
+
+        self.window.set_query(columns_sql, where, params)
+        # 统计与读取在后台执行，完成后表格自动重绘
+        self.table.reload(reset=reset)
 
     # ========== 重置 ==========
     def reset_filters(self):
         self.search_filters.clear()
-        self.current_page = 1
-        self.refresh_table()
+        self.selection.clear()
+        self.refresh_table(reset=True)
 
     # ========== 搜索 ==========
     def open_search_window(self):
@@ -326,9 +277,11 @@ class CustomerPage(ctk.CTkFrame):
             ("名称", "customer_name", "text"),
             ("状态", "customer_status", "text"),
             ("电话", "customer_phone", "text"),
+            ("地址", "customer_address", "text"),
             ("来源平台", "source_platform", "text"),
             ("微信号", "wechat_account", "text"),
             ("QQ号", "qq_account", "text"),
+            ("备注", "remark", "text"),
             ("最近购买日期", "last_purchase_date", "range"),
             ("总采购额", "total_purchase_amount", "range"),
             ("最近退货日期", "last_return_date", "range"),
@@ -401,39 +354,13 @@ class CustomerPage(ctk.CTkFrame):
                     if v1 or v2:
                         filters[key] = {"min": v1, "max": v2}
             self.search_filters = filters
-            self.current_page = 1
+            # 条件变化后勾选的行可能已不在结果中，一并清除
+            self.selection.clear()
             win.destroy()
-            self.refresh_table()
+            self.refresh_table(reset=True)
 
         ctk.CTkButton(win, text="确定", width=120, fg_color="#2B6CB0", command=confirm).pack(pady=10)
 
-    # ========== 全选/取消全选 ==========
-    def toggle_select_all(self):
-        """全选或取消全选当前页所有数据"""
-        all_items = self.tree.get_children()
-        if not all_items:
-            return
-        
-        # 检查是否所有项都已选中
-        all_selected = all(self.tree.item(item, "values")[0] == "☑" for item in all_items)
-        
-        if all_selected:
-            # 取消全选
-            for item in all_items:
-                vals = list(self.tree.item(item, "values"))
-                cid = vals[1]  # ID 在第2列
-                vals[0] = "☐"
-                self.tree.item(item, values=vals)
-                self.selected_items.discard(cid)
-        else:
-            # 全选
-            for item in all_items:
-                vals = list(self.tree.item(item, "values"))
-                cid = vals[1]  # ID 在第2列
-                vals[0] = "☑"
-                self.tree.item(item, values=vals)
-                self.selected_items.add(cid)
-    
     # ========== 右键菜单 ==========
     def show_context_menu(self, event):
         """显示右键菜单"""
@@ -478,18 +405,15 @@ class CustomerPage(ctk.CTkFrame):
     
     def copy_cell(self, cell_value):
         """复制单元格内容"""
+        import pyperclip  # 仅复制时用到，首次使用时再导入
         pyperclip.copy(str(cell_value))
         messagebox.showinfo("复制成功", f"已复制: {cell_value}")
     
     def copy_row(self, values):
         """复制整行数据"""
-        # 获取表头的中文名称
-        headers = [
-            "✔", "ID", "名称", "状态", "电话", "地址", "邮箱", "手围",
-            "来源平台", "来源账号", "微信", "QQ",
-            "最近购买", "总采购额", "最近退货", "总退货额",
-            "购买次数", "退货次数", "备注", "创建日期", "更新日期"
-        ]
+        import pyperclip
+        # 表头与当前显示的列一致
+        headers = ["✔"] + [self.headers_map.get(c, c) for c in self.columns if c != "select"]
         
         # 跳过勾选列，从第二列开始复制
         lines = []
@@ -501,39 +425,6 @@ class CustomerPage(ctk.CTkFrame):
         pyperclip.copy(copied)
         messagebox.showinfo("复制成功", "整行数据已复制到剪贴板")
     
-    # ========== 勾选 ==========
-    def toggle_select(self, event):
-        item_id = self.tree.identify_row(event.y)
-        col = self.tree.identify_column(event.x)
-        if not item_id:
-            return
-        
-        # 只处理勾选列（第一列）
-        if col != "#1":
-            return
-        
-        vals = list(self.tree.item(item_id, "values"))
-        cid = vals[1]  # ID 在第2列
-
-        if vals[0] == "☐":
-            vals[0] = "☑"
-            self.selected_items.add(cid)
-        else:
-            vals[0] = "☐"
-            self.selected_items.discard(cid)
-        self.tree.item(item_id, values=vals)
-
-    # ========== 分页 ==========
-    def prev_page(self):
-        if self.current_page > 1:
-            self.current_page -= 1
-            self.refresh_table()
-
-    def next_page(self):
-        if self.current_page < self.total_pages:
-            self.current_page += 1
-            self.refresh_table()
-
     # ========== CRUD ==========
     def add_customer(self):
         self._open_edit_window("add")
@@ -547,17 +438,27 @@ class CustomerPage(ctk.CTkFrame):
         self._open_edit_window("edit", cid)
 
     def delete_customer(self):
-        selected_ids = self._get_checked_ids()
-        if not selected_ids:
+        if not self.selection:
             messagebox.showwarning("提示", "请至少勾选一条记录删除。")
             return
-        if messagebox.askyesno("确认删除", f"确定删除选中的 {len(selected_ids)} 条记录？"):
-            for cid in selected_ids:
-                self.cursor.execute("DELETE FROM customer WHERE id=?", (cid,))
-            self.conn.commit()
-            self.selected_items.clear()
+        count = self.selection.count(self.cursor)
+        if messagebox.askyesno("确认删除", f"确定删除选中的 {count} 条记录？"):
+            try:
+                bulk_delete(self.conn, "customer", self.selection.scope())
+            except Exception as e:
+                messagebox.showerror("错误", f"删除失败，已回滚：{e}")
+                return
+            self.selection.clear()
             self.refresh_table()
 
+    def open_bulk_window(self):
+        BulkWindow(self, "客户", "customer", [
+            ("状态", "customer_status", ["启用", "禁用"]),
+            ("来源平台", "source_platform", None),
+            ("手围单位", "wrist_unit", None),
+            ("备注", "remark", None),
+        ])
+
     # ========== 新增/编辑 ==========
     def _open_edit_window(self, mode, cid=None):
         win = ctk.CTkToplevel(self)
@@ -572,16 +473,17 @@ class CustomerPage(ctk.CTkFrame):
             data["customer_status"] = "启用"  # 默认状态
         else:
             win.title("编辑客户")
-            self.cursor.execute("SELECT * FROM customer WHERE id=?", (cid,))
+            self.cursor.execute(
+                "SELECT id, customer_name, customer_status, customer_phone, customer_address, customer_email, "
+                "wrist_circumference, wrist_unit, source_platform, source_account, wechat_account, qq_account, "
+                "remark FROM customer WHERE id=?",
+                (cid,)
+            )
             r = self.cursor.fetchone()
             if not r:
                 messagebox.showerror("错误", "未找到该客户记录")
                 return
-            data = dict(zip(
-                ["id", "customer_name", "customer_status", "customer_phone", "customer_address", "customer_email",
-                 "wrist_circumference", "source_platform", "source_account", "wechat_account", "qq_account",
-                 "last_purchase_date", "total_purchase_amount", "last_return_date", "total_return_amount",
-                 "purchase_times", "return_times", "remark", "create_time", "update_time"], r))
+            data = {k: ("" if v is None else v) for k, v in row_to_map(self.cursor, r).items()}
 
         fields = [
             ("客户名称*", "customer_name"),
@@ -626,30 +528,37 @@ class CustomerPage(ctk.CTkFrame):
                 return
             now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            if mode == "add":
-                self.cursor.execute("""
-                    INSERT INTO customer (
-                        customer_name, customer_status, customer_phone, customer_address, customer_email,
-                        wrist_circumference, wrist_unit, source_platform, source_account, wechat_account, qq_account,
-                        remark, create_time, update_time
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    vals["customer_name"], vals["customer_status"], vals["customer_phone"], vals["customer_address"],
-                    vals["customer_email"], wrist_v, vals.get("wrist_unit", ""), vals["source_platform"], vals["source_account"],
-                    vals["wechat_account"], vals["qq_account"], vals["remark"], now, now
-                ))
-            else:
-                self.cursor.execute("""
-                    UPDATE customer SET
-                        customer_name=?, customer_status=?, customer_phone=?, customer_address=?, customer_email=?,
-                        wrist_circumference=?, wrist_unit=?, source_platform=?, source_account=?, wechat_account=?, qq_account=?,
-                        remark=?, update_time=? WHERE id=?
-                """, (
-                    vals["customer_name"], vals["customer_status"], vals["customer_phone"], vals["customer_address"],
-                    vals["customer_email"], wrist_v, vals.get("wrist_unit", ""), vals["source_platform"], vals["source_account"],
-                    vals["wechat_account"], vals["qq_account"], vals["remark"], now, cid
-                ))
-            self.conn.commit()
+            try:
+                if mode == "add":
+                    self.cursor.execute("""
+                        INSERT INTO customer (
+                            customer_name, customer_status, customer_phone, customer_address, customer_email,
+                            wrist_circumference, wrist_unit, source_platform, source_account, wechat_account, qq_account,
+                            remark, create_time, update_time, customer_name_initials, customer_name_pinyin
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        vals["customer_name"], vals["customer_status"], vals["customer_phone"], vals["customer_address"],
+                        vals["customer_email"], wrist_v, vals.get("wrist_unit", ""), vals["source_platform"], vals["source_account"],
+                        vals["wechat_account"], vals["qq_account"], vals["remark"], now, now,
+                        initials(vals["customer_name"]), full_pinyin(vals["customer_name"])
+                    ))
+                else:
+                    self.cursor.execute("""
+                        UPDATE customer SET
+                            customer_name=?, customer_status=?, customer_phone=?, customer_address=?, customer_email=?,
+                            wrist_circumference=?, wrist_unit=?, source_platform=?, source_account=?, wechat_account=?, qq_account=?,
+                            remark=?, update_time=?, customer_name_initials=?, customer_name_pinyin=? WHERE id=?
+                    """, (
+                        vals["customer_name"], vals["customer_status"], vals["customer_phone"], vals["customer_address"],
+                        vals["customer_email"], wrist_v, vals.get("wrist_unit", ""), vals["source_platform"], vals["source_account"],
+                        vals["wechat_account"], vals["qq_account"], vals["remark"], now,
+                        initials(vals["customer_name"]), full_pinyin(vals["customer_name"]), cid
+                    ))
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                messagebox.showerror("错误", f"保存客户失败：{e}")
+                return
             win.destroy()
             self.refresh_table()
 
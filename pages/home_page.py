@@ -1,27 +1,41 @@
-import sqlite3
-
 import customtkinter as ctk
 
-from data.db_init import get_user_db_path
-
-DB_PATH = get_user_db_path()
+from core import startup
+from core.tasks import run_async
+from data.dashboard import get_low_stock, get_overview, get_recent_orders, get_top_customers
+from data.db import get_read_connection
+from pages.setting_page import get_table_settings
 
 
 class HomePage(ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F7F9FC")
-        
-        self.conn = sqlite3.connect(DB_PATH)
-        self.cursor = self.conn.cursor()
-        
+
+        # 统计卡片中的数值标签：(卡片, 字段) -> CTkLabel
+        self.stat_labels = {}
+        # 列表容器 -> 行控件列表 / 提示文字标签
+        self.row_widgets = {}
+        self.messages = {}
+        self._loading = False
+        self._reload_pending = False
+        self._data_version = None
+
+        # 先显示骨架，数据在后台线程查询完成后再填入
         self.create_ui()
-    
+        self.refresh_all_data()
+
+        # 自动刷新间隔（秒，0 为关闭）；数据库没有新的提交时只执行一条 PRAGMA
+        interval = get_table_settings().get("dashboard_refresh_seconds", 0)
+        self.auto_refresh_ms = int(interval) * 1000 if interval else 0
+        if self.auto_refresh_ms > 0:
+            self.after(self.auto_refresh_ms, self._auto_refresh)
+
     def create_ui(self):
         """创建UI组件"""
         # 创建滚动框架
         main_scroll = ctk.CTkScrollableFrame(self, fg_color="#F7F9FC")
         main_scroll.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # ======== 标题 ========
         title = ctk.CTkLabel(
             main_scroll,
@@ -30,77 +44,77 @@ class HomePage(ctk.CTkFrame):
             text_color="#2B6CB0"
         )
         title.pack(pady=(10, 30))
-        
+
         # ======== 总览卡片区域 ========
         overview_frame = ctk.CTkFrame(main_scroll, fg_color="transparent")
         overview_frame.pack(fill="x", pady=(0, 20))
-        
+
         # 配置列权重
         overview_frame.grid_columnconfigure(0, weight=1)
         overview_frame.grid_columnconfigure(1, weight=1)
         overview_frame.grid_columnconfigure(2, weight=1)
-        
+
         # 客户统计卡片
-        customer_stats = self.get_customer_stats()
         customer_card = self.create_stat_card_widget(
-            "👥 客户统计", 
+            "customer",
+            "👥 客户统计",
             [
-                ("总客户数", customer_stats["total"], "#2B6CB0"),
-                ("已下单客户", customer_stats["ordered"], "#38A169"),
-                ("启用客户", customer_stats["active"], "#319795")
+                ("total", "总客户数", "#2B6CB0"),
+                ("ordered", "已下单客户", "#38A169"),
+                ("active", "启用客户", "#319795")
             ]
         )
         customer_card.grid(row=0, column=0, padx=10, pady=10, sticky="nsew", in_=overview_frame)
-        
+
         # 库存统计卡片
-        inventory_stats = self.get_inventory_stats()
         inventory_card = self.create_stat_card_widget(
+            "inventory",
             "📦 库存统计",
             [
-                ("总库存数", inventory_stats["total"], "#2B6CB0"),
-                ("库存为0", inventory_stats["zero"], "#E53E3E"),
-                ("低库存(<10)", inventory_stats["low"], "#DD6B20")
+                ("total", "总库存数", "#2B6CB0"),
+                ("zero", "库存为0", "#E53E3E"),
+                ("low", "低库存(<10)", "#DD6B20")
             ]
         )
         inventory_card.grid(row=0, column=1, padx=10, pady=10, sticky="nsew", in_=overview_frame)
-        
+
         # 订单统计卡片
-        order_stats = self.get_order_stats()
         order_card = self.create_stat_card_widget(
+            "order",
             "🧾 订单统计",
             [
-                ("总订单数", order_stats["total"], "#2B6CB0"),
-                ("草稿", order_stats["draft"], "#718096"),
-                ("已完成", order_stats["completed"], "#38A169"),
-                ("已送达", order_stats["delivered"], "#805AD5")
+                ("total", "总订单数", "#2B6CB0"),
+                ("draft", "草稿", "#718096"),
+                ("completed", "已完成", "#38A169"),
+                ("delivered", "已送达", "#805AD5")
             ]
         )
         order_card.grid(row=0, column=2, padx=10, pady=10, sticky="nsew", in_=overview_frame)
-        
+
         # ======== 详细排名区域 ========
         details_frame = ctk.CTkFrame(main_scroll, fg_color="transparent")
         details_frame.pack(fill="both", expand=True, pady=20)
-        
+
         # 左侧：客户排名
         left_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
         left_frame.pack(side="left", fill="both", expand=True, padx=(0, 10))
-        
-        self.create_top_customers_section(left_frame)
-        
+
+        self.top_customers_box = self.create_section(left_frame, "🏆 下单最多客户 TOP 5")
+
         # 中间：库存告急
         middle_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
         middle_frame.pack(side="left", fill="both", expand=True, padx=10)
-        
-        self.create_low_stock_section(middle_frame)
-        
+
+        self.low_stock_box = self.create_section(middle_frame, "⚠️ 库存告急 TOP 5")
+
         # 右侧：最新订单
         right_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
         right_frame.pack(side="left", fill="both", expand=True, padx=(10, 0))
-        
-        self.create_recent_orders_section(right_frame)
-        
+
+        self.recent_orders_box = self.create_section(right_frame, "📋 最新订单")
+
         # 刷新按钮
-        refresh_btn = ctk.CTkButton(
+        self.refresh_btn = ctk.CTkButton(
             main_scroll,
             text="🔄 刷新数据",
             font=("微软雅黑", 16),
@@ -109,13 +123,13 @@ class HomePage(ctk.CTkFrame):
             fg_color="#2B6CB0",
             command=self.refresh_all_data
         )
-        refresh_btn.pack(pady=20)
-    
+        self.refresh_btn.pack(pady=20)
+
     # ========== 统计卡片 ==========
-    def create_stat_card_widget(self, title, stats):
-        """创建统计卡片并返回"""
+    def create_stat_card_widget(self, card_key, title, stats):
+        """创建统计卡片并返回；数值先显示为 “…”，加载完成后由 render_overview 填入"""
         card = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=15)
-        
+
         # 标题
         title_label = ctk.CTkLabel(
             card,
@@ -124,318 +138,299 @@ class HomePage(ctk.CTkFrame):
             text_color="#333"
         )
         title_label.pack(pady=(20, 15))
-        
+
         # 统计数据
-        for label, value, color in stats:
+        for key, label, color in stats:
             stat_frame = ctk.CTkFrame(card, fg_color="transparent")
             stat_frame.pack(fill="x", padx=20, pady=8)
-            
+
             ctk.CTkLabel(
                 stat_frame,
                 text=label,
                 font=("微软雅黑", 14),
                 text_color="#666"
             ).pack(side="left")
-            
-            ctk.CTkLabel(
+
+            value_label = ctk.CTkLabel(
                 stat_frame,
-                text=str(value),
+                text="…",
                 font=("微软雅黑", 20, "bold"),
                 text_color=color
-            ).pack(side="right")
-        
+            )
+            value_label.pack(side="right")
+            self.stat_labels[(card_key, key)] = value_label
+
         # 添加底部间距
         ctk.CTkLabel(card, text="", height=10).pack()
-        
+
         return card
-    
-    # ========== 获取统计数据 ==========
-    def get_customer_stats(self):
-        """获取客户统计"""
-        # 总客户数
-        self.cursor.execute("SELECT COUNT(*) FROM customer")
-        total = self.cursor.fetchone()[0]
-        
-        # 已下单客户数（有订单的客户）
-        self.cursor.execute('''
-            SELECT COUNT(DISTINCT customer_id) 
-            FROM "order" 
-            WHERE customer_id IS NOT NULL AND customer_id != ''
-        ''')
-        ordered = self.cursor.fetchone()[0]
-        
-        # 启用客户数
-        self.cursor.execute("SELECT COUNT(*) FROM customer WHERE customer_status='启用'")
-        active = self.cursor.fetchone()[0]
-        
-        return {"total": total, "ordered": ordered, "active": active}
-    
-    def get_inventory_stats(self):
-        """获取库存统计"""
-        # 总库存数
-        self.cursor.execute("SELECT COUNT(*) FROM inventory")
-        total = self.cursor.fetchone()[0]
-        
-        # 库存为0
-        self.cursor.execute("SELECT COUNT(*) FROM inventory WHERE stock_qty = 0")
-        zero = self.cursor.fetchone()[0]
-        
-        # 低库存（<10）
-        self.cursor.execute("SELECT COUNT(*) FROM inventory WHERE stock_qty > 0 AND stock_qty < 10")
-        low = self.cursor.fetchone()[0]
-        
-        return {"total": total, "zero": zero, "low": low}
-    
-    def get_order_stats(self):
-        """获取订单统计"""
-        # 总订单数
-        self.cursor.execute('SELECT COUNT(*) FROM "order"')
-        total = self.cursor.fetchone()[0]
-        
-        # 草稿订单
-        self.cursor.execute('SELECT COUNT(*) FROM "order" WHERE order_status="草稿"')
-        draft = self.cursor.fetchone()[0]
-        
-        # 已完成订单
-        self.cursor.execute('SELECT COUNT(*) FROM "order" WHERE order_status="已完成"')
-        completed = self.cursor.fetchone()[0]
-        
-        # 已送达订单
-        self.cursor.execute('SELECT COUNT(*) FROM "order" WHERE order_status="已送达"')
-        delivered = self.cursor.fetchone()[0]
-        
-        return {"total": total, "draft": draft, "completed": completed, "delivered": delivered}
-    
-    # ========== 客户排名 ==========
-    def create_top_customers_section(self, parent):
-        """创建下单最多客户排名"""
+
+    def render_overview(self, overview):
+        for (card_key, key), label in self.stat_labels.items():
+            set_label(label, str(overview[card_key][key]))
+
+    # ========== 列表区域 ==========
+    def create_section(self, parent, title_text):
+        """创建带标题的列表区域，返回用于放置内容的容器"""
         section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
         section.pack(fill="both", expand=True)
-        
+
         # 标题
         title = ctk.CTkLabel(
             section,
-            text="🏆 下单最多客户 TOP 5",
+            text=title_text,
             font=("微软雅黑", 18, "bold"),
             text_color="#333"
         )
         title.pack(pady=(20, 15))
-        
-        # 获取数据
-        self.cursor.execute('''
-            SELECT 
-                c.customer_name,
-                COUNT(o.id) as order_count,
-                COALESCE(SUM(o.sell_price), 0) as total_amount
-            FROM customer c
-            LEFT JOIN "order" o ON c.id = o.customer_id
-            WHERE o.id IS NOT NULL
-            GROUP BY c.id, c.customer_name
-            ORDER BY order_count DESC, total_amount DESC
-            LIMIT 5
-        ''')
-        top_customers = self.cursor.fetchall()
-        
-        if not top_customers:
-            ctk.CTkLabel(
-                section,
-                text="暂无客户订单数据",
-                font=("微软雅黑", 14),
-                text_color="#999"
-            ).pack(pady=30)
-        else:
-            # 表格
-            for idx, (name, count, amount) in enumerate(top_customers, 1):
-                rank_frame = ctk.CTkFrame(section, fg_color="#F7F9FC", corner_radius=8)
-                rank_frame.pack(fill="x", padx=15, pady=5)
-                
-                # 排名
-                rank_color = ["#FFD700", "#C0C0C0", "#CD7F32"][idx-1] if idx <= 3 else "#718096"
-                ctk.CTkLabel(
-                    rank_frame,
-                    text=f"#{idx}",
-                    font=("微软雅黑", 16, "bold"),
-                    text_color=rank_color,
-                    width=40
-                ).pack(side="left", padx=(10, 5))
-                
-                # 客户信息
-                info_frame = ctk.CTkFrame(rank_frame, fg_color="transparent")
-                info_frame.pack(side="left", fill="x", expand=True, padx=10, pady=8)
-                
-                # 处理 None 值
-                display_name = name if name else "未知客户"
-                display_amount = amount if amount else 0
-                
-                ctk.CTkLabel(
-                    info_frame,
-                    text=display_name,
-                    font=("微软雅黑", 14, "bold"),
-                    text_color="#333",
-                    anchor="w"
-                ).pack(anchor="w")
-                
-                ctk.CTkLabel(
-                    info_frame,
-                    text=f"订单数: {count}  |  总金额: ¥{display_amount:.2f}",
-                    font=("微软雅黑", 12),
-                    text_color="#666",
-                    anchor="w"
-                ).pack(anchor="w")
-        
+
+        box = ctk.CTkFrame(section, fg_color="transparent")
+        box.pack(fill="both", expand=True)
+        # 列表行控件在刷新之间复用，只更新文字
+        self.row_widgets[box] = []
+        self.messages[box] = ctk.CTkLabel(
+            box,
+            text="加载中…",
+            font=("微软雅黑", 14),
+            text_color="#999"
+        )
+        self.messages[box].pack(pady=30)
+
         section.pack_configure(ipady=10)
-    
+        return box
+
+    def show_message(self, box, text):
+        """隐藏列表行并显示一行提示文字"""
+        for row in self.row_widgets[box]:
+            row["frame"].pack_forget()
+        set_label(self.messages[box], text)
+        if not self.messages[box].winfo_manager():
+            self.messages[box].pack(pady=30)
+
+    def render_rows(self, box, records, make_row, fill_row, empty_text):
+        """
+        更新列表：行数不够时才新建行控件，多余的行隐藏；
+        已有的行只更新变化的文字，不销毁重建。
+        """
+        if not records:
+            self.show_message(box, empty_text)
+            return
+        self.messages[box].pack_forget()
+        rows = self.row_widgets[box]
+        while len(rows) < len(records):
+            rows.append(make_row(box))
+        for idx, row in enumerate(rows):
+            if idx < len(records):
+                fill_row(row, idx + 1, records[idx])
+                if not row["frame"].winfo_manager():
+                    row["frame"].pack(fill="x", padx=15, pady=5)
+            else:
+                row["frame"].pack_forget()
+
+    # ========== 客户排名 ==========
+    def make_customer_row(self, box):
+        rank_frame = ctk.CTkFrame(box, fg_color="#F7F9FC", corner_radius=8)
+
+        # 排名
+        rank_label = ctk.CTkLabel(
+            rank_frame,
+            text="",
+            font=("微软雅黑", 16, "bold"),
+            width=40
+        )
+        rank_label.pack(side="left", padx=(10, 5))
+
+        # 客户信息
+        info_frame = ctk.CTkFrame(rank_frame, fg_color="transparent")
+        info_frame.pack(side="left", fill="x", expand=True, padx=10, pady=8)
+
+        name_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=("微软雅黑", 14, "bold"),
+            text_color="#333",
+            anchor="w"
+        )
+        name_label.pack(anchor="w")
+
+        detail_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=("微软雅黑", 12),
+            text_color="#666",
+            anchor="w"
+        )
+        detail_label.pack(anchor="w")
+        return {"frame": rank_frame, "rank": rank_label, "name": name_label, "detail": detail_label}
+
+    def fill_customer_row(self, row, idx, record):
+        name, count, amount = record
+        rank_color = ["#FFD700", "#C0C0C0", "#CD7F32"][idx-1] if idx <= 3 else "#718096"
+        # 处理 None 值
+        display_name = name if name else "未知客户"
+        display_amount = amount if amount else 0
+        set_label(row["rank"], f"#{idx}", rank_color)
+        set_label(row["name"], display_name)
+        set_label(row["detail"], f"购买次数: {count}  |  总金额: ¥{display_amount:.2f}")
+
     # ========== 库存告急 ==========
-    def create_low_stock_section(self, parent):
-        """创建库存告急列表"""
-        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
-        section.pack(fill="both", expand=True)
-        
-        # 标题
-        title = ctk.CTkLabel(
-            section,
-            text="⚠️ 库存告急 TOP 5",
-            font=("微软雅黑", 18, "bold"),
+    def make_stock_row(self, box):
+        stock_frame = ctk.CTkFrame(box, fg_color="#F7F9FC", corner_radius=8)
+
+        # 产品编码
+        code_label = ctk.CTkLabel(
+            stock_frame,
+            text="",
+            font=("微软雅黑", 14, "bold"),
             text_color="#333"
         )
-        title.pack(pady=(20, 15))
-        
-        # 获取数据（库存最少的前5个，排除已停用）
-        self.cursor.execute('''
-            SELECT product_code, stock_qty, stock_status
-            FROM inventory
-            WHERE stock_status='启用'
-            ORDER BY stock_qty ASC
-            LIMIT 5
-        ''')
-        low_stocks = self.cursor.fetchall()
-        
-        if not low_stocks:
-            ctk.CTkLabel(
-                section,
-                text="暂无库存数据",
-                font=("微软雅黑", 14),
-                text_color="#999"
-            ).pack(pady=30)
-        else:
-            for product_code, qty, status in low_stocks:
-                stock_frame = ctk.CTkFrame(section, fg_color="#F7F9FC", corner_radius=8)
-                stock_frame.pack(fill="x", padx=15, pady=5)
-                
-                # 产品编码
-                ctk.CTkLabel(
-                    stock_frame,
-                    text=product_code,
-                    font=("微软雅黑", 14, "bold"),
-                    text_color="#333"
-                ).pack(side="left", padx=15, pady=10)
-                
-                # 库存数量
-                qty_color = "#E53E3E" if qty == 0 else "#DD6B20" if qty < 10 else "#38A169"
-                qty_text = "缺货" if qty == 0 else f"剩余 {qty}"
-                
-                ctk.CTkLabel(
-                    stock_frame,
-                    text=qty_text,
-                    font=("微软雅黑", 14, "bold"),
-                    text_color=qty_color
-                ).pack(side="right", padx=15, pady=10)
-        
-        section.pack_configure(ipady=10)
-    
+        code_label.pack(side="left", padx=15, pady=10)
+
+        # 库存数量
+        qty_label = ctk.CTkLabel(
+            stock_frame,
+            text="",
+            font=("微软雅黑", 14, "bold")
+        )
+        qty_label.pack(side="right", padx=15, pady=10)
+        return {"frame": stock_frame, "code": code_label, "qty": qty_label}
+
+    def fill_stock_row(self, row, idx, record):
+        product_code, qty, status = record
+        qty_color = "#E53E3E" if qty == 0 else "#DD6B20" if qty < 10 else "#38A169"
+        qty_text = "缺货" if qty == 0 else f"剩余 {qty}"
+        set_label(row["code"], product_code)
+        set_label(row["qty"], qty_text, qty_color)
+
     # ========== 最新订单 ==========
-    def create_recent_orders_section(self, parent):
-        """创建最新订单列表"""
-        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
-        section.pack(fill="both", expand=True)
-        
-        # 标题
-        title = ctk.CTkLabel(
-            section,
-            text="📋 最新订单",
-            font=("微软雅黑", 18, "bold"),
-            text_color="#333"
+    def make_order_row(self, box):
+        order_frame = ctk.CTkFrame(box, fg_color="#F7F9FC", corner_radius=8)
+
+        # 左侧信息
+        info_frame = ctk.CTkFrame(order_frame, fg_color="transparent")
+        info_frame.pack(side="left", fill="x", expand=True, padx=15, pady=10)
+
+        title_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=("微软雅黑", 13, "bold"),
+            text_color="#333",
+            anchor="w"
         )
-        title.pack(pady=(20, 15))
-        
-        # 获取数据
-        self.cursor.execute('''
-            SELECT order_no, customer_name, order_status, sell_price, create_time
-            FROM "order"
-            ORDER BY id DESC
-            LIMIT 5
-        ''')
-        recent_orders = self.cursor.fetchall()
-        
-        if not recent_orders:
-            ctk.CTkLabel(
-                section,
-                text="暂无订单数据",
-                font=("微软雅黑", 14),
-                text_color="#999"
-            ).pack(pady=30)
-        else:
-            for order_no, customer_name, status, price, create_time in recent_orders:
-                order_frame = ctk.CTkFrame(section, fg_color="#F7F9FC", corner_radius=8)
-                order_frame.pack(fill="x", padx=15, pady=5)
-                
-                # 左侧信息
-                info_frame = ctk.CTkFrame(order_frame, fg_color="transparent")
-                info_frame.pack(side="left", fill="x", expand=True, padx=15, pady=10)
-                
-                # 处理 None 值
-                display_order_no = order_no if order_no else "未知订单"
-                display_customer = customer_name if customer_name else "未知客户"
-                display_price = price if price else 0
-                
-                ctk.CTkLabel(
-                    info_frame,
-                    text=f"{display_order_no} - {display_customer}",
-                    font=("微软雅黑", 13, "bold"),
-                    text_color="#333",
-                    anchor="w"
-                ).pack(anchor="w")
-                
-                # 时间
-                time_str = create_time.split()[0] if create_time else "未知"
-                ctk.CTkLabel(
-                    info_frame,
-                    text=f"{time_str}  |  ¥{display_price:.2f}",
-                    font=("微软雅黑", 11),
-                    text_color="#666",
-                    anchor="w"
-                ).pack(anchor="w")
-                
-                # 右侧状态
-                status_colors = {
-                    "草稿": "#718096",
-                    "已完成": "#38A169",
-                    "已送达": "#805AD5"
-                }
-                display_status = status if status else "未知"
-                status_color = status_colors.get(display_status, "#718096")
-                
-                status_label = ctk.CTkLabel(
-                    order_frame,
-                    text=display_status,
-                    font=("微软雅黑", 12, "bold"),
-                    text_color=status_color
-                )
-                status_label.pack(side="right", padx=15)
-        
-        section.pack_configure(ipady=10)
-    
+        title_label.pack(anchor="w")
+
+        # 时间
+        time_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=("微软雅黑", 11),
+            text_color="#666",
+            anchor="w"
+        )
+        time_label.pack(anchor="w")
+
+        # 右侧状态
+        status_label = ctk.CTkLabel(
+            order_frame,
+            text="",
+            font=("微软雅黑", 12, "bold")
+        )
+        status_label.pack(side="right", padx=15)
+        return {"frame": order_frame, "title": title_label, "time": time_label, "status": status_label}
+
+    def fill_order_row(self, row, idx, record):
+        order_no, customer_name, status, price, create_time = record
+        # 处理 None 值
+        display_order_no = order_no if order_no else "未知订单"
+        display_customer = customer_name if customer_name else "未知客户"
+        display_price = price if price else 0
+        time_str = create_time.split()[0] if create_time else "未知"
+
+        status_colors = {
+            "草稿": "#718096",
+            "已完成": "#38A169",
+            "已送达": "#805AD5"
+        }
+        display_status = status if status else "未知"
+        status_color = status_colors.get(display_status, "#718096")
+
+        set_label(row["title"], f"{display_order_no} - {display_customer}")
+        set_label(row["time"], f"{time_str}  |  ¥{display_price:.2f}")
+        set_label(row["status"], display_status, status_color)
+
+    # ========== 加载数据 ==========
+    @staticmethod
+    def load_dashboard(last_version=None):
+        """
+        在后台线程中执行：使用该线程自己的只读连接查询全部首页数据。
+        传入上次的 data_version 且数据库此后没有任何提交时，直接返回 None，
+        自动刷新在数据未变化时只需这一条 PRAGMA。
+        """
+        conn = get_read_connection()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if last_version is not None and version == last_version:
+            return None
+        cursor = conn.cursor()
+        return {
+            "version": version,
+            "overview": get_overview(cursor),
+            "top_customers": get_top_customers(cursor),
+            "low_stock": get_low_stock(cursor),
+            "recent_orders": get_recent_orders(cursor),
+        }
+
+    def apply_dashboard(self, data):
+        """在主线程中执行：把查询结果填入界面（数据未变化时 data 为 None）"""
+        self._loading = False
+        self.refresh_btn.configure(state="normal", text="🔄 刷新数据")
+        if data is not None:
+            self._data_version = data["version"]
+            self.render_overview(data["overview"])
+            self.render_rows(self.top_customers_box, data["top_customers"],
+                             self.make_customer_row, self.fill_customer_row, "暂无客户订单数据")
+            self.render_rows(self.low_stock_box, data["low_stock"],
+                             self.make_stock_row, self.fill_stock_row, "暂无库存数据")
+            self.render_rows(self.recent_orders_box, data["recent_orders"],
+                             self.make_order_row, self.fill_order_row, "暂无订单数据")
+            startup.mark("首页数据加载完成")
+        if self._reload_pending:
+            self._reload_pending = False
+            self.refresh_all_data()
+
+    def on_load_error(self, error):
+        self._loading = False
+        self._reload_pending = False
+        self._data_version = None
+        self.refresh_btn.configure(state="normal", text="🔄 刷新数据")
+        print(f"⚠️  首页数据加载失败：{error}")
+        for box in (self.top_customers_box, self.low_stock_box, self.recent_orders_box):
+            self.show_message(box, "数据加载失败，请点击刷新重试")
+
     # ========== 刷新数据 ==========
-    def refresh_all_data(self):
-        """刷新所有数据"""
-        # 重新连接数据库
-        self.conn.close()
-        self.conn = sqlite3.connect(DB_PATH)
-        self.cursor = self.conn.cursor()
-        
-        # 清除所有子组件
-        for widget in self.winfo_children():
-            widget.destroy()
-        
-        # 重新创建所有组件
-        self.create_ui()
+    def refresh_all_data(self, only_if_changed=False):
+        """
+        在后台重新查询并更新数据（界面组件保留，只更新变化的文字）。
+        only_if_changed=True 时（自动刷新）数据库没有新的提交则不查询。
+        """
+        if self._loading:
+            # 正在加载时再次刷新：本次完成后再加载一次
+            self._reload_pending = True
+            return
+        self._loading = True
+        last_version = self._data_version if only_if_changed else None
+        if not only_if_changed:
+            self.refresh_btn.configure(state="disabled", text="加载中…")
+        run_async(self, lambda: self.load_dashboard(last_version), self.apply_dashboard, self.on_load_error)
+
+    def _auto_refresh(self):
+        """按设置的间隔自动刷新"""
+        self.refresh_all_data(only_if_changed=True)
+        self.after(self.auto_refresh_ms, self._auto_refresh)
+
+
+def set_label(label, text, color=None):
+    """只在文字或颜色变化时更新标签，避免无谓的重绘"""
+    if label.cget("text") != text:
+        label.configure(text=text)
+    if color is not None and label.cget("text_color") != color:
+        label.configure(text_color=color)
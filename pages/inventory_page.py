@@ -1,27 +1,26 @@
 import datetime
-import math
-import sqlite3
 from tkinter import ttk, messagebox, Menu
 
 import customtkinter as ctk
-import pyperclip
 
-from data.db_init import get_user_db_path
+from core.bulk_window import BulkWindow
+from core.grid import VirtualGrid
+from core.list_page import ListPageMixin
+from core.selection import Selection
+from data.bulk import bulk_delete
+from data.db import get_connection
+from data.fulltext import fts_filters
+from data.list_query import KeysetWindow, build_where, row_to_map, select_columns
 from pages.setting_page import get_table_settings
 
-DB_PATH = get_user_db_path()
-PAGE_SIZE = 10
 
-
-class InventoryPage(ctk.CTkFrame):
+class InventoryPage(ListPageMixin, ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F7F9FC")
 
-        self.conn = sqlite3.connect(DB_PATH)
+        self.conn = get_connection()
         self.cursor = self.conn.cursor()
-        self.current_page = 1
-        self.total_pages = 1
-        self.selected_items = set()
+        self.selection = Selection("inventory")
         self.search_filters = {}
 
         # 获取表格设置
@@ -29,6 +28,8 @@ class InventoryPage(ctk.CTkFrame):
         content_font_size = settings.get("table_content_font_size", 20)
         heading_font_size = settings.get("table_heading_font_size", 22)
         row_height = settings.get("table_row_height", 36)
+        # 大表无筛选时可只显示近似总数（settings.json 中 approx_count_threshold，0 为关闭）
+        self.window = KeysetWindow("inventory", approx_threshold=settings.get("approx_count_threshold", 0))
 
         # ======== 样式 ========
         style = ttk.Style()
@@ -45,6 +46,8 @@ class InventoryPage(ctk.CTkFrame):
                       command=self.edit_inventory).pack(side="left", padx=5)
         ctk.CTkButton(toolbar, text="🗑 删除库存", width=140, fg_color="#E53E3E",
                       command=self.delete_inventory).pack(side="left", padx=5)
+        ctk.CTkButton(toolbar, text="📦 批量操作", width=140, fg_color="#DD6B20",
+                      command=self.open_bulk_window).pack(side="left", padx=5)
         ctk.CTkButton(toolbar, text="🔄 刷新", width=120, fg_color="#A0AEC0",
                       command=self.reset_filters).pack(side="right", padx=5)
         ctk.CTkButton(toolbar, text="🔍 搜索", width=140, fg_color="#4A5568",
@@ -97,13 +100,21 @@ class InventoryPage(ctk.CTkFrame):
             for c in self.columns_default:
                 if c not in ordered:
                     ordered.append(c)
-            self.columns = ["select"] + ordered
+            self.column_order = ordered
         else:
-            self.columns = ["select"] + self.columns_default
+            self.column_order = list(self.columns_default)
+        # 隐藏的列既不显示也不查询
+        hidden = set(settings_all.get("columns_hidden_inventory") or [])
+        visible = [c for c in self.column_order if c not in hidden] or self.column_order
+        self.columns = ["select"] + visible
+        self.headers_map = headers_map
 
         headers = ["✔"] + [headers_map[c] for c in self.columns if c != "select"]
 
-        self.tree = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=10)
+        # 虚拟滚动：Treeview 中只有可见的行，滚动时按需读取
+        self.table = VirtualGrid(table_frame, self.columns, self.window, self.format_row,
+                                 on_scroll=self.update_status)
+        self.tree = self.table.tree
         for c, h in zip(self.columns, headers):
             if c == "select":
                 # 勾选列头绑定全选功能
@@ -113,97 +124,27 @@ class InventoryPage(ctk.CTkFrame):
                 self.tree.heading(c, text=h)
                 self.tree.column(c, width=160, anchor="center")
 
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
-        y_scroll.pack(side="right", fill="y")
-        x_scroll.pack(side="bottom", fill="x")
-        self.tree.pack(fill="both", expand=True)
         self.tree.bind("<Button-1>", self.toggle_select)
         self.tree.bind("<Button-3>", self.show_context_menu)  # 右键菜单
 
-        # ======== 分页 ========
-        self.page_frame = ctk.CTkFrame(self, fg_color="#F7F9FC")
-        self.page_frame.pack(fill="x", pady=5)
-        ctk.CTkButton(self.page_frame, text="⬅ 上一页", width=100,
-                      command=self.prev_page).pack(side="left", padx=10)
-        self.page_label = ctk.CTkLabel(self.page_frame, text="第 1 / 1 页", font=("微软雅黑", 16))
-        self.page_label.pack(side="left", padx=5)
-        ctk.CTkButton(self.page_frame, text="下一页 ➡", width=100,
-                      command=self.next_page).pack(side="left", padx=10)
-        self.total_label = ctk.CTkLabel(self.page_frame, text="", font=("微软雅黑", 16))
-        self.total_label.pack(side="right", padx=10)
+        # ======== 状态栏 ========
+        self.build_status_bar()
 
-        self.refresh_table()
+        self.refresh_table(reset=True)
 
     # ========== 刷新表格 ==========
-    def refresh_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        base_sql = "SELECT * FROM inventory"
-        params, where = [], []
-
-        for field, val in self.search_filters.items():
-            if not val:
-                continue
-            if isinstance(val, dict):
-                min_v, max_v = val.get("min"), val.get("max")
-                if min_v and max_v:
-                    where.append(f"{field} BETWEEN ? AND ?")
-                    params += [min_v, max_v]
-                elif min_v:
-                    where.append(f"{field} >= ?")
-                    params.append(min_v)
-                elif max_v:
-                    where.append(f"{field} <= ?")
-                    params.append(max_v)
-            elif field in ["stock_code", "product_code"]:
-                where.append(f"{field} = ?")
-                params.append(val)
-            else:
-                where.append(f"{field} LIKE ?")
-                params.append(f"%{val}%")
-
-        if where:
-            base_sql += " WHERE " + " AND ".join(where)
-
-        self.cursor.execute(f"SELECT COUNT(*) FROM ({base_sql})", params)
-        total = self.cursor.fetchone()[0]
-        self.total_pages = max(1, math.ceil(total / PAGE_SIZE))
-        offset = (self.current_page - 1) * PAGE_SIZE
-
-        self.cursor.execute(base_sql + " ORDER BY id DESC LIMIT ? OFFSET ?", (*params, PAGE_SIZE, offset))
-        rows = self.cursor.fetchall()
-
-        for r in rows:
-            # 构建键值映射，支持可变列顺序
-            row_map = {
-                "stock_code": "" if r[1] is None else str(r[1]),
-                "stock_status": "" if r[3] is None else str(r[3]),
-                "product_code": "" if r[4] is None else str(r[4]),
-                "product_type": "" if r[5] is None else str(r[5]),
-                "stock_qty": "" if r[2] is None else str(r[2]),
-                "weight_gram": "" if r[7] is None else str(r[7]),
-                "cost_price": "" if r[11] is None else str(r[11]),
-                "price_per_gram": "" if r[8] is None else str(r[8]),
-                "sell_price": "" if r[12] is None else str(r[12]),
-                "size": "" if r[13] is None else str(r[13]),
-                "color": "" if r[14] is None else str(r[14]),
-                "material": "" if r[15] is None else str(r[15]),
-                "element": "" if r[16] is None else str(r[16]),
-                "stock_unit": "" if not (len(r) > 20 and r[20] is not None) else str(r[20]),
-                "weight_unit": "" if not (len(r) > 21 and r[21] is not None) else str(r[21]),
-                "supplier": "" if not (len(r) > 22 and r[22] is not None) else str(r[22]),
-                "remark": "" if r[17] is None else str(r[17]),
-                "create_time": "" if r[18] is None else str(r[18]),
-                "update_time": "" if r[19] is None else str(r[19])
-            }
-            ordered_values = tuple(row_map.get(c, "") for c in self.columns if c != "select")
-            self.tree.insert("", "end", values=("☐",) + ordered_values, tags=(r[0],))
-
-        self.page_label.configure(text=f"第 {self.current_page} / {self.total_pages} 页")
-        self.total_label.configure(text=f"共 {total} 条记录")
+    def refresh_table(self, reset=False):
+        """重新统计并显示（后台查询）；reset 时回到顶部，否则保持当前滚动位置（新增 / 编辑 / 删除之后）"""
+        # 文本条件走全文索引
+        where, params = build_where(
+            self.search_filters, exact_fields=("stock_code", "product_code"),
+            special=fts_filters(self.conn, "inventory")
+        )
+
+        # 只查询当前显示的列，按列名取值
+        self.window.set_query(select_columns(self.columns), where, params)
+        # 统计与读取在后台执行，完成后表格自动重绘
+        self.table.reload(reset=reset)
 
         if self.search_filters:
             txt = "当前筛选：" + ", ".join(
@@ -221,7 +162,7 @@ class InventoryPage(ctk.CTkFrame):
         win.geometry("680x540")
         win.grab_set()
 
-        tip = ctk.CTkLabel(win, text="请为下列各列填写排序值（可为任意整数，数值越小排序越靠前）。保存后重启应用生效。", font=("微软雅黑", 14))
+        tip = ctk.CTkLabel(win, text="请为下列各列填写排序值（数值越小越靠前），取消勾选“显示”可隐藏该列。保存后重启应用生效。", font=("微软雅黑", 14))
         tip.pack(pady=8)
 
         headers_map = {
@@ -236,26 +177,29 @@ class InventoryPage(ctk.CTkFrame):
         scroll = ctk.CTkScrollableFrame(win, width=640, height=380, fg_color="#FFFFFF")
         scroll.pack(fill="both", expand=True, padx=12, pady=6)
 
-        current_order = [c for c in self.columns if c != "select"]
+        current_order = self.column_order
         editors = []
 
         header_row = ctk.CTkFrame(scroll, fg_color="transparent")
         header_row.grid(row=0, column=0, sticky="ew", padx=6, pady=(4, 8))
-        ctk.CTkLabel(header_row, text="列名", font=("微软雅黑", 15, "bold"), width=420, anchor="w").pack(side="left")
+        ctk.CTkLabel(header_row, text="列名", font=("微软雅黑", 15, "bold"), width=360, anchor="w").pack(side="left")
         ctk.CTkLabel(header_row, text="顺序", font=("微软雅黑", 15, "bold"), width=80).pack(side="left", padx=10)
+        ctk.CTkLabel(header_row, text="显示", font=("微软雅黑", 15, "bold"), width=80).pack(side="left", padx=10)
 
         for i, key in enumerate(current_order, start=1):
             row = ctk.CTkFrame(scroll, fg_color="transparent")
             row.grid(row=i, column=0, sticky="ew", padx=6, pady=4)
-            ctk.CTkLabel(row, text=headers_map.get(key, key), font=("微软雅黑", 15), width=420, anchor="w").pack(side="left")
+            ctk.CTkLabel(row, text=headers_map.get(key, key), font=("微软雅黑", 15), width=360, anchor="w").pack(side="left")
             e = ctk.CTkEntry(row, width=80)
             e.insert(0, str(i))
             e.pack(side="left", padx=10)
-            editors.append((key, e, i))
+            visible_var = ctk.BooleanVar(value=key in self.columns)
+            ctk.CTkCheckBox(row, text="", variable=visible_var, width=80).pack(side="left", padx=10)
+            editors.append((key, e, i, visible_var))
 
         def save_order():
             order_list = []
-            for key, entry, original in editors:
+            for key, entry, original, _ in editors:
                 val = entry.get().strip()
                 if val == "":
                     messagebox.showwarning("提示", f"请为列“{headers_map.get(key, key)}”填写排序值。")
@@ -271,6 +215,10 @@ class InventoryPage(ctk.CTkFrame):
             for c in self.columns_default:
                 if c not in ordered:
                     ordered.append(c)
+            hidden = [key for key, _, __, visible_var in editors if not visible_var.get()]
+            if len(hidden) == len(editors):
+                messagebox.showwarning("提示", "请至少保留一列显示。")
+                return
 
             try:
                 import os, json
@@ -286,6 +234,7 @@ class InventoryPage(ctk.CTkFrame):
                         except:
                             settings_all = {}
                 settings_all["columns_order_inventory"] = ordered
+                settings_all["columns_hidden_inventory"] = hidden
                 with open(cfg_file, 'w', encoding='utf-8') as f:
                     json.dump(settings_all, f, indent=4, ensure_ascii=False)
                 messagebox.showinfo("成功", "列顺序已保存。请重启应用以使设置生效。")
@@ -295,24 +244,10 @@ class InventoryPage(ctk.CTkFrame):
 
         ctk.CTkButton(win, text="保存", width=140, fg_color="#2B6CB0", command=save_order).pack(pady=10)
 
-    def _get_checked_ids(self):
-        """从表格当前显示状态收集勾选的行ID（更稳健，避免事件丢失）"""
-        checked = []
-        for item in self.tree.get_children():
-            vals = self.tree.item(item, "values")
-            if not vals:
-                continue
-            if len(vals) > 0 and vals[0] == "☑":
-                tags = self.tree.item(item, "tags")
-                sid = tags[0] if tags else None
-                if sid:
-                    checked.append(sid)
-        return checked
-
     def reset_filters(self):
         self.search_filters.clear()
-        self.current_page = 1
-        self.refresh_table()
+        self.selection.clear()
+        self.refresh_table(reset=True)
 
     # ========== 搜索 ==========
     def open_search_window(self):
@@ -401,43 +336,13 @@ class InventoryPage(ctk.CTkFrame):
                     if v1 or v2:
                         filters[key] = {"min": v1, "max": v2}
             self.search_filters = filters
-            self.current_page = 1
+            # 条件变化后勾选的行可能已不在结果中，一并清除
+            self.selection.clear()
             win.destroy()
-            self.refresh_table()
+            self.refresh_table(reset=True)
 
         ctk.CTkButton(win, text="确定", width=120, fg_color="#2B6CB0", command=confirm).pack(pady=10)
 
-    # ========== 全选/取消全选 ==========
-    def toggle_select_all(self):
-        """全选或取消全选当前页所有数据"""
-        all_items = self.tree.get_children()
-        if not all_items:
-            return
-        
-        # 检查是否所有项都已选中
-        all_selected = all(self.tree.item(item, "values")[0] == "☑" for item in all_items)
-        
-        if all_selected:
-            # 取消全选
-            for item in all_items:
-                vals = list(self.tree.item(item, "values"))
-                tags = self.tree.item(item, "tags")
-                sid = tags[0] if tags else None
-                if sid:
-                    vals[0] = "☐"
-                    self.tree.item(item, values=vals)
-                    self.selected_items.discard(sid)
-        else:
-            # 全选
-            for item in all_items:
-                vals = list(self.tree.item(item, "values"))
-                tags = self.tree.item(item, "tags")
-                sid = tags[0] if tags else None
-                if sid:
-                    vals[0] = "☑"
-                    self.tree.item(item, values=vals)
-                    self.selected_items.add(sid)
-    
     # ========== 右键菜单 ==========
     def show_context_menu(self, event):
         """显示右键菜单"""
@@ -482,16 +387,15 @@ class InventoryPage(ctk.CTkFrame):
     
     def copy_cell(self, cell_value):
         """复制单元格内容"""
+        import pyperclip  # 仅复制时用到，首次使用时再导入
         pyperclip.copy(str(cell_value))
         messagebox.showinfo("复制成功", f"已复制: {cell_value}")
     
     def copy_row(self, values):
         """复制整行数据"""
-        # 获取表头的中文名称
-        headers = [
-            "✔", "库存编号", "状态", "产品编号", "类型", "数量", "克重",
-            "成本价", "克价", "销售价", "尺寸", "颜色", "材质", "元素", "备注", "创建日期", "更新日期"
-        ]
+        import pyperclip
+        # 表头与当前显示的列一致
+        headers = ["✔"] + [self.headers_map.get(c, c) for c in self.columns if c != "select"]
         
         # 跳过勾选列，从第二列开始复制
         lines = []
@@ -503,45 +407,6 @@ class InventoryPage(ctk.CTkFrame):
         pyperclip.copy(copied)
         messagebox.showinfo("复制成功", "整行数据已复制到剪贴板")
     
-    # ========== 勾选 ==========
-    def toggle_select(self, event):
-        item_id = self.tree.identify_row(event.y)
-        col = self.tree.identify_column(event.x)
-        if not item_id:
-            return
-        
-        # 只处理勾选列（第一列）
-        if col != "#1":
-            return
-        
-        vals = list(self.tree.item(item_id, "values"))
-        
-        # 从 tags 中获取 ID
-        tags = self.tree.item(item_id, "tags")
-        sid = tags[0] if tags else None
-        
-        if not sid:
-            return
-
-        if vals[0] == "☐":
-            vals[0] = "☑"
-            self.selected_items.add(sid)
-        else:
-            vals[0] = "☐"
-            self.selected_items.discard(sid)
-        self.tree.item(item_id, values=vals)
-
-    # ========== 分页 ==========
-    def prev_page(self):
-        if self.current_page > 1:
-            self.current_page -= 1
-            self.refresh_table()
-
-    def next_page(self):
-        if self.current_page < self.total_pages:
-            self.current_page += 1
-            self.refresh_table()
-
     # ========== CRUD ==========
     def add_inventory(self):
         self._open_edit_window("add")
@@ -555,17 +420,33 @@ class InventoryPage(ctk.CTkFrame):
         self._open_edit_window("edit", sid)
 
     def delete_inventory(self):
-        selected_ids = self._get_checked_ids()
-        if not selected_ids:
+        if not self.selection:
             messagebox.showwarning("提示", "请至少勾选一条记录删除。")
             return
-        if messagebox.askyesno("确认删除", f"确定删除选中的 {len(selected_ids)} 条记录？"):
-            for sid in selected_ids:
-                self.cursor.execute("DELETE FROM inventory WHERE id=?", (sid,))
-            self.conn.commit()
-            self.selected_items.clear()
+        count = self.selection.count(self.cursor)
+        if messagebox.askyesno("确认删除", f"确定删除选中的 {count} 条记录？"):
+            try:
+                bulk_delete(self.conn, "inventory", self.selection.scope())
+            except Exception as e:
+                messagebox.showerror("错误", f"删除失败，已回滚：{e}")
+                return
+            self.selection.clear()
             self.refresh_table()
 
+    def open_bulk_window(self):
+        BulkWindow(self, "库存", "inventory", [
+            ("状态", "stock_status", ["启用", "停用"]),
+            ("产品类型", "product_type", None),
+            ("供应商", "supplier", None),
+            ("材质", "material", None),
+            ("颜色", "color", None),
+            ("尺寸", "size", None),
+            ("元素", "element", None),
+            ("库存单位", "stock_unit", None),
+            ("重量单位", "weight_unit", None),
+            ("备注", "remark", None),
+        ])
+
     # ========== 新增 / 编辑 ==========
     def _open_edit_window(self, mode, sid=None):
         win = ctk.CTkToplevel(self)
@@ -577,10 +458,17 @@ class InventoryPage(ctk.CTkFrame):
             data = {}
         else:
             win.title("编辑库存")
-            self.cursor.execute("SELECT * FROM inventory WHERE id=?", (sid,))
+            self.cursor.execute(
+                "SELECT id, stock_code, stock_status, product_code, stock_qty, product_type, weight_gram, "
+                "cost_price, price_per_gram, sell_price, stock_unit, weight_unit, supplier, size, color, "
+                "material, element, remark FROM inventory WHERE id=?",
+                (sid,)
+            )
             r = self.cursor.fetchone()
-            cols = [d[0] for d in self.cursor.description]
-            data = dict(zip(cols, r))
+            if not r:
+                messagebox.showerror("错误", "未找到该库存记录")
+                return
+            data = {k: ("" if v is None else v) for k, v in row_to_map(self.cursor, r).items()}
 
         fields = [
             ("库存编号*", "stock_code", True),
@@ -666,34 +554,40 @@ class InventoryPage(ctk.CTkFrame):
                 messagebox.showwarning("提示", "数量/克重/价格字段必须为数字")
                 return
 
-            if mode == "add":
-                self.cursor.execute("""
-                    INSERT INTO inventory (
-                        stock_code, stock_status, product_code, stock_qty, product_type,
-                        weight_gram, cost_price, price_per_gram, sell_price, stock_unit, weight_unit, supplier,
-                        size, color, material, element, remark, create_time, update_time
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    vals["stock_code"], vals["stock_status"], vals["product_code"], stock_qty_v,
-                    vals["product_type"], weight_gram_v, cost_price_v, price_per_gram_v,
-                    sell_price_v, vals.get("stock_unit", ""), vals.get("weight_unit", ""), vals.get("supplier", ""),
-                    vals["size"], vals["color"], vals["material"], vals["element"],
-                    vals["remark"], now, now
-                ))
-            else:
-                self.cursor.execute("""
-                    UPDATE inventory SET
-                        stock_status=?, product_code=?, stock_qty=?, product_type=?, weight_gram=?,
-                        cost_price=?, price_per_gram=?, sell_price=?, stock_unit=?, weight_unit=?, supplier=?,
-                        size=?, color=?, material=?, element=?, remark=?, update_time=? WHERE id=?
-                """, (
-                    vals["stock_status"], vals["product_code"], stock_qty_v, vals["product_type"],
-                    weight_gram_v, cost_price_v, price_per_gram_v, sell_price_v,
-                    vals.get("stock_unit", ""), vals.get("weight_unit", ""), vals.get("supplier", ""),
-                    vals["size"], vals["color"], vals["material"], vals["element"], vals["remark"],
-                    now, sid
-                ))
-            self.conn.commit()
+            # 共用写连接：出错时必须回滚，否则事务一直未结束，之后其他页面的写入都会失败
+            try:
+                if mode == "add":
+                    self.cursor.execute("""
+                        INSERT INTO inventory (
+                            stock_code, stock_status, product_code, stock_qty, product_type,
+                            weight_gram, cost_price, price_per_gram, sell_price, stock_unit, weight_unit, supplier,
+                            size, color, material, element, remark, create_time, update_time
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        vals["stock_code"], vals["stock_status"], vals["product_code"], stock_qty_v,
+                        vals["product_type"], weight_gram_v, cost_price_v, price_per_gram_v,
+                        sell_price_v, vals.get("stock_unit", ""), vals.get("weight_unit", ""), vals.get("supplier", ""),
+                        vals["size"], vals["color"], vals["material"], vals["element"],
+                        vals["remark"], now, now
+                    ))
+                else:
+                    self.cursor.execute("""
+                        UPDATE inventory SET
+                            stock_status=?, product_code=?, stock_qty=?, product_type=?, weight_gram=?,
+                            cost_price=?, price_per_gram=?, sell_price=?, stock_unit=?, weight_unit=?, supplier=?,
+                            size=?, color=?, material=?, element=?, remark=?, update_time=? WHERE id=?
+                    """, (
+                        vals["stock_status"], vals["product_code"], stock_qty_v, vals["product_type"],
+                        weight_gram_v, cost_price_v, price_per_gram_v, sell_price_v,
+                        vals.get("stock_unit", ""), vals.get("weight_unit", ""), vals.get("supplier", ""),
+                        vals["size"], vals["color"], vals["material"], vals["element"], vals["remark"],
+                        now, sid
+                    ))
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                messagebox.showerror("错误", f"保存库存失败：{e}")
+                return
             win.destroy()
             self.refresh_table()
 
@@ -704,6 +598,7 @@ class InventoryPage(ctk.CTkFrame):
     def _generate_stock_code(self):
         today = datetime.datetime.now().strftime("%Y%m%d")
         prefix = f"STK{today}"
-        self.cursor.execute("SELECT COUNT(*) FROM inventory WHERE stock_code LIKE ?", (f"{prefix}%",))
+        # GLOB 区分大小写，可直接走 idx_inventory_stock_code 做前缀范围查找（LIKE 不能）
+        self.cursor.execute("SELECT COUNT(*) FROM inventory WHERE stock_code GLOB ?", (f"{prefix}*",))
         count = self.cursor.fetchone()[0] + 1
         return f"{prefix}{count:03d}"
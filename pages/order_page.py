@@ -1,28 +1,35 @@
 import datetime
-import json
-import math
-import sqlite3
 from tkinter import ttk, messagebox, Menu
 
 import customtkinter as ctk
-import pyperclip
 
-from data.db_init import get_user_db_path
+from core.bulk_window import BulkWindow
+from core.grid import VirtualGrid
+from core.list_page import ListPageMixin
+from core.pickers import TypeAheadEntry
+from core.selection import Selection
+from data.bulk import bulk_delete, ids_scope
+from data.db import get_connection
+from data.fulltext import fts_filters
+from data.list_query import KeysetWindow, build_where, row_to_map, select_columns
+from data.lookups import find_product, load_products, search_customers, search_products
+from data.order_items import (
+    format_items, load_items_for_orders, load_order_items, save_order_items
+)
+from data.order_status import SOURCE_STATUS, batch_transition
 from pages.setting_page import get_table_settings
+# 客户搜索弹窗最多显示的匹配数、输入停顿多久后查询（毫秒）
+SEARCH_LIMIT = 50
+SEARCH_DELAY_MS = 250
 
-DB_PATH = get_user_db_path()
-PAGE_SIZE = 10
 
-
-class OrderPage(ctk.CTkFrame):
+class OrderPage(ListPageMixin, ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F7F9FC")
 
-        self.conn = sqlite3.connect(DB_PATH)
+        self.conn = get_connection()
         self.cursor = self.conn.cursor()
-        self.current_page = 1
-        self.total_pages = 1
-        self.selected_items = set()
+        self.selection = Selection('"order"')
         self.search_filters = {}
 
         # 获取表格设置
@@ -30,6 +37,8 @@ class OrderPage(ctk.CTkFrame):
         content_font_size = settings.get("table_content_font_size", 20)
         heading_font_size = settings.get("table_heading_font_size", 22)
         row_height = settings.get("table_row_height", 36)
+        # 大表无筛选时可只显示近似总数（settings.json 中 approx_count_threshold，0 为关闭）
+        self.window = KeysetWindow('"order"', approx_threshold=settings.get("approx_count_threshold", 0))
 
         style = ttk.Style()
         style.configure("Treeview", font=("微软雅黑", content_font_size), rowheight=row_height)
@@ -47,6 +56,8 @@ class OrderPage(ctk.CTkFrame):
                       command=self.delete_order).pack(side="left", padx=3)
         ctk.CTkButton(toolbar, text="🔄 订单操作", width=120, fg_color="#38A169",
                       command=self.open_order_operations).pack(side="left", padx=3)
+        ctk.CTkButton(toolbar, text="📦 批量操作", width=120, fg_color="#DD6B20",
+                      command=self.open_bulk_window).pack(side="left", padx=3)
         ctk.CTkButton(toolbar, text="🔄 刷新", width=100, fg_color="#A0AEC0",
                       command=self.reset_filters).pack(side="right", padx=3)
         ctk.CTkButton(toolbar, text="🔍 搜索", width=100, fg_color="#4A5568",
@@ -102,13 +113,21 @@ class OrderPage(ctk.CTkFrame):
             for c in self.columns_default:
                 if c not in ordered:
                     ordered.append(c)
-            self.columns = ["select"] + ordered
+            self.column_order = ordered
         else:
-            self.columns = ["select"] + self.columns_default
+            self.column_order = list(self.columns_default)
+        # 隐藏的列既不显示也不查询
+        hidden = set(settings_all.get("columns_hidden_order") or [])
+        visible = [c for c in self.column_order if c not in hidden] or self.column_order
+        self.columns = ["select"] + visible
+        self.headers_map = headers_map
 
         headers = ["✔"] + [headers_map[c] for c in self.columns if c != "select"]
 
-        self.tree = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=10)
+        # 虚拟滚动：Treeview 中只有可见的行，滚动时按需读取
+        self.table = VirtualGrid(table_frame, self.columns, self.window, self.format_row,
+                                 on_scroll=self.update_status)
+        self.tree = self.table.tree
         for c, h in zip(self.columns, headers):
             if c == "select":
                 # 勾选列头绑定全选功能
@@ -117,28 +136,13 @@ class OrderPage(ctk.CTkFrame):
                 self.tree.heading(c, text=h)
             self.tree.column(c, width=160, anchor="center")
 
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
-        y_scroll.pack(side="right", fill="y")
-        x_scroll.pack(side="bottom", fill="x")
-        self.tree.pack(fill="both", expand=True)
         self.tree.bind("<Button-1>", self.toggle_select)
         self.tree.bind("<Button-3>", self.show_context_menu)  # 右键菜单
 
-        # ======== 分页 ========
-        self.page_frame = ctk.CTkFrame(self, fg_color="#F7F9FC")
-        self.page_frame.pack(fill="x", pady=5)
-        ctk.CTkButton(self.page_frame, text="⬅ 上一页", width=100,
-                      command=self.prev_page).pack(side="left", padx=10)
-        self.page_label = ctk.CTkLabel(self.page_frame, text="第 1 / 1 页", font=("微软雅黑", 16))
-        self.page_label.pack(side="left", padx=5)
-        ctk.CTkButton(self.page_frame, text="下一页 ➡", width=100,
-                      command=self.next_page).pack(side="left", padx=10)
-        self.total_label = ctk.CTkLabel(self.page_frame, text="", font=("微软雅黑", 16))
-        self.total_label.pack(side="right", padx=10)
+        # ======== 状态栏 ========
+        self.build_status_bar()
 
-        self.refresh_table()
+        self.refresh_table(reset=True)
 
     def open_column_order_window(self):
         win = ctk.CTkToplevel(self)
@@ -146,7 +150,7 @@ class OrderPage(ctk.CTkFrame):
         win.geometry("680x520")
         win.grab_set()
 
-        tip = ctk.CTkLabel(win, text="请为下列各列填写排序值（可为任意整数，数值越小排序越靠前）。保存后重启应用生效。", font=("微软雅黑", 14))
+        tip = ctk.CTkLabel(win, text="请为下列各列填写排序值（数值越小越靠前），取消勾选“显示”可隐藏该列。保存后重启应用生效。", font=("微软雅黑", 14))
         tip.pack(pady=8)
 
         headers_map = {
@@ -159,26 +163,29 @@ class OrderPage(ctk.CTkFrame):
         scroll = ctk.CTkScrollableFrame(win, width=640, height=360, fg_color="#FFFFFF")
         scroll.pack(fill="both", expand=True, padx=12, pady=6)
 
-        current_order = [c for c in self.columns if c != "select"]
+        current_order = self.column_order
         editors = []
 
         header_row = ctk.CTkFrame(scroll, fg_color="transparent")
         header_row.grid(row=0, column=0, sticky="ew", padx=6, pady=(4, 8))
-        ctk.CTkLabel(header_row, text="列名", font=("微软雅黑", 15, "bold"), width=420, anchor="w").pack(side="left")
+        ctk.CTkLabel(header_row, text="列名", font=("微软雅黑", 15, "bold"), width=360, anchor="w").pack(side="left")
         ctk.CTkLabel(header_row, text="顺序", font=("微软雅黑", 15, "bold"), width=80).pack(side="left", padx=10)
+        ctk.CTkLabel(header_row, text="显示", font=("微软雅黑", 15, "bold"), width=80).pack(side="left", padx=10)
 
         for i, key in enumerate(current_order, start=1):
             row = ctk.CTkFrame(scroll, fg_color="transparent")
             row.grid(row=i, column=0, sticky="ew", padx=6, pady=4)
-            ctk.CTkLabel(row, text=headers_map.get(key, key), font=("微软雅黑", 15), width=420, anchor="w").pack(side="left")
+            ctk.CTkLabel(row, text=headers_map.get(key, key), font=("微软雅黑", 15), width=360, anchor="w").pack(side="left")
             e = ctk.CTkEntry(row, width=80)
             e.insert(0, str(i))
             e.pack(side="left", padx=10)
-            editors.append((key, e, i))
+            visible_var = ctk.BooleanVar(value=key in self.columns)
+            ctk.CTkCheckBox(row, text="", variable=visible_var, width=80).pack(side="left", padx=10)
+            editors.append((key, e, i, visible_var))
 
         def save_order():
             order_list = []
-            for key, entry, original in editors:
+            for key, entry, original, _ in editors:
                 val = entry.get().strip()
                 if val == "":
                     messagebox.showwarning("提示", f"请为列“{headers_map.get(key, key)}”填写排序值。")
@@ -194,6 +201,10 @@ class OrderPage(ctk.CTkFrame):
             for c in self.columns_default:
                 if c not in ordered:
                     ordered.append(c)
+            hidden = [key for key, _, __, visible_var in editors if not visible_var.get()]
+            if len(hidden) == len(editors):
+                messagebox.showwarning("提示", "请至少保留一列显示。")
+                return
 
             try:
                 import os, json
@@ -209,6 +220,7 @@ class OrderPage(ctk.CTkFrame):
                         except:
                             settings_all = {}
                 settings_all["columns_order_order"] = ordered
+                settings_all["columns_hidden_order"] = hidden
                 with open(cfg_file, 'w', encoding='utf-8') as f:
                     json.dump(settings_all, f, indent=4, ensure_ascii=False)
                 messagebox.showinfo("成功", "列顺序已保存。请重启应用以使设置生效。")
@@ -219,101 +231,42 @@ class OrderPage(ctk.CTkFrame):
         ctk.CTkButton(win, text="保存", width=140, fg_color="#2B6CB0", command=save_order).pack(pady=10)
 
     # ========== 刷新表格 ==========
-    def refresh_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        base_sql = 'SELECT * FROM "order"'
-        params, where = [], []
-
-        for field, val in self.search_filters.items():
-            if not val:
-                continue
-            if isinstance(val, dict):
-                min_v, max_v = val.get("min"), val.get("max")
-                if min_v and max_v:
-                    where.append(f"{field} BETWEEN ? AND ?")
-                    params += [min_v, max_v]
-                elif min_v:
-                    where.append(f"{field} >= ?")
-                    params.append(min_v)
-                elif max_v:
-                    where.append(f"{field} <= ?")
-                    params.append(max_v)
+    def refresh_table(self, reset=False):
+        """重新统计并显示（后台查询）；reset 时回到顶部，否则保持当前滚动位置（新增 / 编辑 / 删除之后）"""
+        # 文本条件走全文索引；明细按产品编码在 order_item 的索引上查找
+        special = fts_filters(self.conn, "order")
+        item_filter = fts_filters(self.conn, "order_item").get("product_code")
+
+        def detail_clause(val):
+            if item_filter:
+                clause, clause_params = item_filter(val)
             else:
-                where.append(f"{field} LIKE ?")
-                params.append(f"%{val}%")
-
-        if where:
-            base_sql += " WHERE " + " AND ".join(where)
-
-        self.cursor.execute(f"SELECT COUNT(*) FROM ({base_sql})", params)
-        total = self.cursor.fetchone()[0]
-        self.total_pages = max(1, math.ceil(total / PAGE_SIZE))
-        offset = (self.current_page - 1) * PAGE_SIZE
-
-        self.cursor.execute(base_sql + " ORDER BY id DESC LIMIT ? OFFSET ?", (*params, PAGE_SIZE, offset))
-        rows = self.cursor.fetchall()
-
-        for r in rows:
-            # 格式化 detail 字段
-            detail_str = ""
-            if r[9]:  # detail 字段在第10个位置（索引9）
-                try:
-                    details = json.loads(r[9])
-                    detail_lines = []
-                    for d in details:
-                        detail_lines.append(
-                            f"产品:{d.get('product_code', '')} 数量:{d.get('qty', 0)} "
-                            f"成本:{d.get('cost', 0)} 售价:{d.get('sell', 0)}"
-                        )
-                    detail_str = "; ".join(detail_lines)
-                except:
-                    detail_str = str(r[9])
-            
-            # 重组数据（不显示ID），处理 None 值
-            row_map = {
-                "order_no": "" if r[1] is None else str(r[1]),
-                "order_status": "" if r[2] is None else str(r[2]),
-                "customer_id": "" if r[3] is None else str(r[3]),
-                "customer_name": "" if r[4] is None else str(r[4]),
-                "address": "" if r[5] is None else str(r[5]),
-                "express_no": "" if r[6] is None else str(r[6]),
-                "detail": detail_str,
-                "sell_price": "" if r[7] is None else str(r[7]),
-                "cost_price": "" if r[8] is None else str(r[8]),
-                "remark": "" if r[10] is None else str(r[10]),
-                "create_time": "" if r[11] is None else str(r[11]),
-                "update_time": "" if r[12] is None else str(r[12]),
-                "final_sell_price": "" if not (len(r) > 13 and r[13] is not None) else str(r[13]),
-                "shipping_fee": "" if not (len(r) > 14 and r[14] is not None) else str(r[14]),
-                "packaging_fee": "" if not (len(r) > 15 and r[15] is not None) else str(r[15])
-            }
-            ordered_values = tuple(row_map.get(c, "") for c in self.columns if c != "select")
-            self.tree.insert("", "end", values=("☐",) + ordered_values, tags=(r[0],))
-
-        self.page_label.configure(text=f"第 {self.current_page} / {self.total_pages} 页")
-        self.total_label.configure(text=f"共 {total} 条记录")
-
-    def _get_checked_ids(self):
-        """从表格当前显示状态收集已勾选的订单ID（更稳健，避免事件丢失）"""
-        checked = []
-        for item in self.tree.get_children():
-            vals = self.tree.item(item, "values")
-            if not vals:
-                continue
-            if len(vals) > 0 and vals[0] == "☑":
-                tags = self.tree.item(item, "tags")
-                oid = tags[0] if tags else None
-                if oid:
-                    checked.append(oid)
-        return checked
+                clause, clause_params = "product_code LIKE ?", [f"%{val}%"]
+            return f"id IN (SELECT order_id FROM order_item WHERE {clause})", clause_params
+
+        special["detail"] = detail_clause
+        where, params = build_where(self.search_filters, special=special)
+
+        # 只查询当前显示的列（明细不在订单表中，每读取一块时单独查询），按列名取值
+        self.window.set_query(
+            select_columns(self.columns, computed=("detail",)), where, params,
+            on_block=self.fill_details if "detail" in self.columns else None
+        )
+        # 统计与读取在后台执行，完成后表格自动重绘
+        self.table.reload(reset=reset)
+
+    @staticmethod
+    def fill_details(cursor, row_maps):
+        """一块订单的明细一次查出"""
+        items_map = load_items_for_orders(cursor, [r["id"] for r in row_maps])
+        for row_map in row_maps:
+            row_map["detail"] = format_items(items_map.get(row_map["id"], []))
 
     # ========== 重置 ==========
     def reset_filters(self):
         self.search_filters.clear()
-        self.current_page = 1
-        self.refresh_table()
+        self.selection.clear()
+        self.refresh_table(reset=True)
 
     # ========== 搜索 ==========
     def open_search_window(self):
@@ -399,43 +352,13 @@ class OrderPage(ctk.CTkFrame):
                     if v1 or v2:
                         filters[key] = {"min": v1, "max": v2}
             self.search_filters = filters
-            self.current_page = 1
+            # 条件变化后勾选的行可能已不在结果中，一并清除
+            self.selection.clear()
             win.destroy()
-            self.refresh_table()
+            self.refresh_table(reset=True)
 
         ctk.CTkButton(win, text="确定", width=120, fg_color="#2B6CB0", command=confirm).pack(pady=10)
 
-    # ========== 全选/取消全选 ==========
-    def toggle_select_all(self):
-        """全选或取消全选当前页所有数据"""
-        all_items = self.tree.get_children()
-        if not all_items:
-            return
-        
-        # 检查是否所有项都已选中
-        all_selected = all(self.tree.item(item, "values")[0] == "☑" for item in all_items)
-        
-        if all_selected:
-            # 取消全选
-            for item in all_items:
-                vals = list(self.tree.item(item, "values"))
-                tags = self.tree.item(item, "tags")
-                oid = tags[0] if tags else None
-                if oid:
-                    vals[0] = "☐"
-                    self.tree.item(item, values=vals)
-                    self.selected_items.discard(oid)
-        else:
-            # 全选
-            for item in all_items:
-                vals = list(self.tree.item(item, "values"))
-                tags = self.tree.item(item, "tags")
-                oid = tags[0] if tags else None
-                if oid:
-                    vals[0] = "☑"
-                    self.tree.item(item, values=vals)
-                    self.selected_items.add(oid)
-    
     # ========== 右键菜单 ==========
     def show_context_menu(self, event):
         """显示右键菜单"""
@@ -480,17 +403,15 @@ class OrderPage(ctk.CTkFrame):
     
     def copy_cell(self, cell_value):
         """复制单元格内容"""
+        import pyperclip  # 仅复制时用到，首次使用时再导入
         pyperclip.copy(str(cell_value))
         messagebox.showinfo("复制成功", f"已复制: {cell_value}")
     
     def copy_row(self, values):
         """复制整行数据"""
-        # 获取表头的中文名称
-        headers = [
-            "✔", "订单号", "状态", "客户ID", "客户名称",
-            "地址", "快递单号", "明细", "销售价", "成本价",
-            "备注", "创建日期", "更新日期"
-        ]
+        import pyperclip
+        # 表头与当前显示的列一致
+        headers = ["✔"] + [self.headers_map.get(c, c) for c in self.columns if c != "select"]
         
         # 跳过勾选列，从第二列开始复制
         lines = []
@@ -502,44 +423,6 @@ class OrderPage(ctk.CTkFrame):
         pyperclip.copy(copied)
         messagebox.showinfo("复制成功", "整行数据已复制到剪贴板")
     
-    # ========== 勾选 ==========
-    def toggle_select(self, event):
-        item_id = self.tree.identify_row(event.y)
-        col = self.tree.identify_column(event.x)
-        if not item_id:
-            return
-        
-        # 只处理勾选列（第一列）
-        if col != "#1":
-            return
-        
-        vals = list(self.tree.item(item_id, "values"))
-        # 从 tags 中获取订单ID
-        tags = self.tree.item(item_id, "tags")
-        oid = tags[0] if tags else None
-        
-        if not oid:
-            return
-
-        if vals[0] == "☐":
-            vals[0] = "☑"
-            self.selected_items.add(oid)
-        else:
-            vals[0] = "☐"
-            self.selected_items.discard(oid)
-        self.tree.item(item_id, values=vals)
-
-    # ========== 分页 ==========
-    def prev_page(self):
-        if self.current_page > 1:
-            self.current_page -= 1
-            self.refresh_table()
-
-    def next_page(self):
-        if self.current_page < self.total_pages:
-            self.current_page += 1
-            self.refresh_table()
-
     # ========== CRUD ==========
     def add_order(self):
         self._open_edit_window("add")
@@ -553,33 +436,46 @@ class OrderPage(ctk.CTkFrame):
         self._open_edit_window("edit", oid)
 
     def delete_order(self):
-        selected_ids = self._get_checked_ids()
-        if not selected_ids:
+        if not self.selection:
             messagebox.showwarning("提示", "请至少勾选一条记录删除。")
             return
 
-        # 检查是否都是草稿状态
-        for oid in selected_ids:
-            self.cursor.execute('SELECT order_status FROM "order" WHERE id=?', (oid,))
-            status = self.cursor.fetchone()
-            if status and status[0] != "草稿":
-                messagebox.showerror("错误", f"订单 ID {oid} 状态为 {status[0]}，只能删除草稿状态的订单！")
+        # 检查是否都是草稿状态（一次查询）
+        scope = self.selection.scope()
+        self.cursor.execute(
+            f'SELECT id, order_status FROM "order" WHERE ({scope[0]}) AND order_status != \'草稿\' ORDER BY id LIMIT 1',
+            scope[1]
+        )
+        row = self.cursor.fetchone()
+        if row:
+            messagebox.showerror("错误", f"订单 ID {row[0]} 状态为 {row[1]}，只能删除草稿状态的订单！")
+            return
+
+        count = self.selection.count(self.cursor)
+        if messagebox.askyesno("确认删除", f"确定删除选中的 {count} 条草稿订单？"):
+            try:
+                bulk_delete(self.conn, '"order"', scope, "order_status='草稿'")
+            except Exception as e:
+                messagebox.showerror("错误", f"删除失败，已回滚：{e}")
                 return
-        
-        if messagebox.askyesno("确认删除", f"确定删除选中的 {len(selected_ids)} 条草稿订单？"):
-            for oid in selected_ids:
-                self.cursor.execute('DELETE FROM "order" WHERE id=?', (oid,))
-            self.conn.commit()
-            self.selected_items.clear()
+            self.selection.clear()
             self.refresh_table()
             messagebox.showinfo("成功", "已删除选中的订单！")
 
+    def open_bulk_window(self):
+        """批量删除（只删除草稿）/ 批量修改备注；状态变更走订单操作"""
+        BulkWindow(self, "订单", '"order"', [("备注", "remark", None)],
+                   delete_only=("order_status='草稿'", "只能删除草稿状态的订单"))
+
     # ========== 订单操作窗口 ==========
     def open_order_operations(self):
         """打开订单操作窗口，根据当前状态显示可用操作"""
         selected_ids = self._get_checked_ids()
-        if len(selected_ids) != 1:
-            messagebox.showwarning("提示", "请勾选一条订单进行操作。")
+        if not selected_ids:
+            messagebox.showwarning("提示", "请勾选订单进行操作。")
+            return
+        if len(selected_ids) > 1:
+            self.open_batch_operations(selected_ids)
             return
         
         oid = selected_ids[0]
@@ -650,123 +546,121 @@ class OrderPage(ctk.CTkFrame):
         ctk.CTkButton(win, text="关闭", width=120, fg_color="#A0AEC0",
                      command=win.destroy).pack(pady=10)
     
-    # ========== 状态转换：草稿 -> 已完成 ==========
-    def _transition_to_completed(self, oid, current_status, target_status, parent_window):
-        """完成订单：扣减库存"""
-        try:
-            self.cursor.execute('BEGIN')
-            
-            # 查询订单信息
-            self.cursor.execute('SELECT detail FROM "order" WHERE id=?', (oid,))
-            order_info = self.cursor.fetchone()
-            
-            if not order_info:
-                raise Exception("订单不存在！")
-            
-            detail_json = order_info[0]
-            details = json.loads(detail_json) if detail_json else []
-            
-            if not details:
-                raise Exception("订单明细为空，无法完成！")
-            
-            # 检查库存
-            for item in details:
-                product_code = item.get('product_code', '')
-                qty = float(item.get('qty', 0))
-                
-                if not product_code or qty <= 0:
-                    continue
-                
-                self.cursor.execute(
-                    "SELECT stock_qty FROM inventory WHERE product_code=?",
-                    (product_code,)
-                )
-                stock_info = self.cursor.fetchone()
-                
-                if not stock_info:
-                    raise Exception(f"产品 {product_code} 不存在于库存中！")
-                
-                current_stock = float(stock_info[0])
-                
-                if current_stock < qty:
-                    raise Exception(
-                        f"产品 {product_code} 库存不足！\n"
-                        f"当前库存：{current_stock}\n"
-                        f"需要数量：{qty}\n"
-                        f"缺少：{qty - current_stock}"
-                    )
-            
-            # 扣减库存
-            for item in details:
-                product_code = item.get('product_code', '')
-                qty = float(item.get('qty', 0))
-                
-                if not product_code or qty <= 0:
-                    continue
-                
-                self.cursor.execute(
-                    "UPDATE inventory SET stock_qty = stock_qty - ? WHERE product_code=?",
-                    (qty, product_code)
+    # ========== 批量订单操作 ==========
+    def open_batch_operations(self, order_ids):
+        """勾选多条订单时：按状态统计，批量完成 / 送达 / 转为草稿 / 退货，一个事务完成"""
+        scope = ids_scope(order_ids)
+        self.cursor.execute(
+            f'SELECT order_status, COUNT(*) FROM "order" WHERE {scope[0]} GROUP BY order_status', scope[1]
+        )
+        counts = dict(self.cursor.fetchall())
+
+        win = ctk.CTkToplevel(self)
+        win.title(f"批量订单操作 - {len(order_ids)} 条")
+        win.geometry("520x560")
+        win.grab_set()
+
+        status_frame = ctk.CTkFrame(win, fg_color="#E8F4F8")
+        status_frame.pack(fill="x", padx=20, pady=20)
+        summary = "，".join(f"{status} {n} 条" for status, n in counts.items()) or "没有订单"
+        ctk.CTkLabel(status_frame, text=f"已勾选 {len(order_ids)} 条：{summary}",
+                     font=("微软雅黑", 16, "bold"), text_color="#2C5282", wraplength=460).pack(pady=15)
+
+        # 与单个订单操作相同的选项（转为草稿 / 退货时使用）
+        rollback_stock_var = ctk.BooleanVar(value=True)
+        rollback_purchase_var = ctk.BooleanVar(value=True)
+        add_return_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(win, text="回滚库存（转为草稿 / 退货时）", variable=rollback_stock_var,
+                        font=("微软雅黑", 13)).pack(anchor="w", padx=30, pady=4)
+        ctk.CTkCheckBox(win, text="回滚客户购买记录（退货时）", variable=rollback_purchase_var,
+                        font=("微软雅黑", 13)).pack(anchor="w", padx=30, pady=4)
+        ctk.CTkCheckBox(win, text="新增客户退货记录（退货时）", variable=add_return_var,
+                        font=("微软雅黑", 13)).pack(anchor="w", padx=30, pady=4)
+
+        def run(target, label):
+            source = SOURCE_STATUS[target]
+            n = counts.get(source, 0)
+            skipped = len(order_ids) - n
+            text = f"将 {n} 条{source}订单{label}？"
+            if skipped:
+                text += f"\n其余 {skipped} 条状态不符，将跳过。"
+            if not messagebox.askyesno("确认批量操作", text, parent=win):
+                return
+            try:
+                done, failures, order_nos = batch_transition(
+                    self.conn, order_ids, target,
+                    rollback_stock=rollback_stock_var.get(),
+                    rollback_purchase=rollback_purchase_var.get(),
+                    add_return=add_return_var.get()
                 )
-            
-            # 更新订单状态
-            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.cursor.execute(
-                'UPDATE "order" SET order_status=?, update_time=? WHERE id=?',
-                ("已完成", now, oid)
-            )
-            
-            self.conn.commit()
-            parent_window.destroy()
-            messagebox.showinfo("成功", "订单已完成，库存已扣减！")
+            except Exception as e:
+                messagebox.showerror("错误", f"批量操作失败，已回滚：{e}", parent=win)
+                return
+            win.destroy()
             self.refresh_table()
+            msg = f"成功{label} {len(done)} 条订单。"
+            if failures:
+                lines = [f"{order_nos.get(oid, oid)}：{reason}" for oid, reason in list(failures.items())[:20]]
+                if len(failures) > 20:
+                    lines.append(f"……共 {len(failures)} 条")
+                msg += f"\n以下 {len(failures)} 条未处理：\n" + "\n".join(lines)
+                messagebox.showwarning("批量操作结果", msg)
+            else:
+                messagebox.showinfo("成功", msg)
 
+        operations = [
+            ("✅ 批量完成（扣减库存）", "已完成", "完成", "#38A169"),
+            ("📦 批量送达", "已送达", "送达", "#805AD5"),
+            ("↩️ 批量转为草稿", "草稿", "转为草稿", "#E53E3E"),
+            ("🔙 批量退货", "已退货", "退货", "#DD6B20"),
+        ]
+        for btn_text, target, label, color in operations:
+            n = counts.get(SOURCE_STATUS[target], 0)
+            ctk.CTkButton(win, text=f"{btn_text}（{n} 条）", width=300, height=44, font=("微软雅黑", 15),
+                          fg_color=color, state="normal" if n else "disabled",
+                          command=lambda t=target, lb=label: run(t, lb)).pack(pady=6)
+
+        ctk.CTkButton(win, text="关闭", width=120, fg_color="#A0AEC0",
+                      command=win.destroy).pack(pady=10)
+
+    # ========== 状态转换（单个订单） ==========
+    def _apply_transition(self, oid, target, **options) -> bool:
+        """
+        单个订单与批量操作共用 batch_transition：事务内再次确认原状态，重复点击或多个窗口不会重复执行。
+        options 为 rollback_stock / rollback_purchase / add_return；失败时提示并返回 False。
+        """
+        try:
+            done, failures, _ = batch_transition(self.conn, [oid], target, **options)
         except Exception as e:
-            self.conn.rollback()
             messagebox.showerror("错误", str(e))
+            return False
+        if not done:
+            messagebox.showerror("错误", failures.get(oid, f"订单无法转为{target}！"))
+            return False
+        return True
+
+    # ========== 状态转换：草稿 -> 已完成 ==========
+    def _transition_to_completed(self, oid, current_status, target_status, parent_window):
+        """完成订单：扣减库存（库存扣减带条件）"""
+        if not self._apply_transition(oid, "已完成"):
+            return
+        parent_window.destroy()
+        messagebox.showinfo("成功", "订单已完成，库存已扣减！")
+        self.refresh_table()
     
     # ========== 状态转换：已完成 -> 已送达 ==========
     def _transition_to_delivered(self, oid, current_status, target_status, parent_window):
         """送达订单：更新客户购买记录"""
-        try:
-            self.cursor.execute('BEGIN')
-            
-            # 查询订单信息，使用最终售价来更新客户购买金额
-            self.cursor.execute('SELECT customer_id, final_sell_price, sell_price FROM "order" WHERE id=?', (oid,))
-            order_info = self.cursor.fetchone()
-            
-            if not order_info:
-                raise Exception("订单不存在！")
-            
-            customer_id, final_sell_price, sell_price = order_info
-            # 优先使用最终售价，如果没有则使用销售价
-            actual_price = float(final_sell_price or sell_price or 0)
-            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # 更新客户购买记录
-            self.cursor.execute('''
-                UPDATE customer SET
-                    last_purchase_date = ?,
-                    total_purchase_amount = COALESCE(total_purchase_amount, 0) + ?,
-                    purchase_times = COALESCE(purchase_times, 0) + 1,
-                    update_time = ?
-                WHERE id = ?
-            ''', (now, actual_price, now, customer_id))
-            
-            # 更新订单状态
-            self.cursor.execute(
-                'UPDATE "order" SET order_status=?, update_time=? WHERE id=?',
-                ("已送达", now, oid)
-            )
-            
-            self.conn.commit()
-            parent_window.destroy()
-            messagebox.showinfo("成功", f"订单已送达！\n客户购买记录已更新：\n- 购买次数 +1\n- 累计金额 +{actual_price:.2f}")
-            self.refresh_table()
+        # 提示中显示的金额：优先使用最终售价，如果没有则使用销售价
+        self.cursor.execute('SELECT final_sell_price, sell_price FROM "order" WHERE id=?', (oid,))
+        prices = self.cursor.fetchone()
+        actual_price = float(prices[0] or prices[1] or 0) if prices else 0.0
 
-        except Exception as e:
-            self.conn.rollback()
-            messagebox.showerror("错误", str(e))
+        if not self._apply_transition(oid, "已送达"):
+            return
+        parent_window.destroy()
+        messagebox.showinfo("成功", f"订单已送达！\n客户购买记录已更新：\n- 购买次数 +1\n- 累计金额 +{actual_price:.2f}")
+        self.refresh_table()
     
     # ========== 状态转换：已完成 -> 草稿 ==========
     def _transition_to_draft(self, oid, current_status, target_status, parent_window):
@@ -792,48 +686,16 @@ class OrderPage(ctk.CTkFrame):
                      font=("微软雅黑", 12), text_color="#E53E3E").pack(pady=10)
         
         def confirm():
-            try:
-                self.cursor.execute('BEGIN')
-                
-                rollback_stock = rollback_stock_var.get()
-                
-                # 回滚库存
-                if rollback_stock:
-                    self.cursor.execute('SELECT detail FROM "order" WHERE id=?', (oid,))
-                    detail_json = self.cursor.fetchone()[0]
-                    details = json.loads(detail_json) if detail_json else []
-                    
-                    for item in details:
-                        product_code = item.get('product_code', '')
-                        qty = float(item.get('qty', 0))
-                        
-                        if not product_code or qty <= 0:
-                            continue
-                        
-                        self.cursor.execute(
-                            "UPDATE inventory SET stock_qty = stock_qty + ? WHERE product_code=?",
-                            (qty, product_code)
-                        )
-                
-                # 更新订单状态
-                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.cursor.execute(
-                    'UPDATE "order" SET order_status=?, update_time=? WHERE id=?',
-                    ("草稿", now, oid)
-                )
-                
-                self.conn.commit()
-                confirm_win.destroy()
-                
-                msg = "订单已转为草稿！"
-                if rollback_stock:
-                    msg += "\n库存已回滚。"
-                messagebox.showinfo("成功", msg)
-                self.refresh_table()
+            rollback_stock = rollback_stock_var.get()
+            if not self._apply_transition(oid, "草稿", rollback_stock=rollback_stock):
+                return
+            confirm_win.destroy()
 
-            except Exception as e:
-                self.conn.rollback()
-                messagebox.showerror("错误", str(e))
+            msg = "订单已转为草稿！"
+            if rollback_stock:
+                msg += "\n库存已回滚。"
+            messagebox.showinfo("成功", msg)
+            self.refresh_table()
         
         btn_frame = ctk.CTkFrame(confirm_win, fg_color="transparent")
         btn_frame.pack(pady=20)
@@ -876,83 +738,23 @@ class OrderPage(ctk.CTkFrame):
                      font=("微软雅黑", 12), text_color="#DD6B20").pack(pady=10)
         
         def confirm():
-            try:
-                self.cursor.execute('BEGIN')
-                
-                # 查询订单信息，使用最终售价
-                self.cursor.execute('SELECT customer_id, final_sell_price, sell_price, detail FROM "order" WHERE id=?', (oid,))
-                order_info = self.cursor.fetchone()
-                
-                if not order_info:
-                    raise Exception("订单不存在！")
-                
-                customer_id, final_sell_price, sell_price, detail_json = order_info
-                # 优先使用最终售价，如果没有则使用销售价
-                actual_price = float(final_sell_price or sell_price or 0)
-                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                rollback_purchase = rollback_purchase_var.get()
-                add_return = add_return_var.get()
-                rollback_stock = rollback_stock_var.get()
-                
-                # 回滚购买记录
-                if rollback_purchase:
-                    self.cursor.execute('''
-                        UPDATE customer SET
-                            total_purchase_amount = COALESCE(total_purchase_amount, 0) - ?,
-                            purchase_times = COALESCE(purchase_times, 0) - 1,
-                            update_time = ?
-                        WHERE id = ?
-                    ''', (actual_price, now, customer_id))
-                
-                # 新增退货记录
-                if add_return:
-                    self.cursor.execute('''
-                        UPDATE customer SET
-                            last_return_date = ?,
-                            total_return_amount = COALESCE(total_return_amount, 0) + ?,
-                            return_times = COALESCE(return_times, 0) + 1,
-                            update_time = ?
-                        WHERE id = ?
-                    ''', (now, actual_price, now, customer_id))
-                
-                # 回滚库存
-                if rollback_stock:
-                    details = json.loads(detail_json) if detail_json else []
-                    for item in details:
-                        product_code = item.get('product_code', '')
-                        qty = float(item.get('qty', 0))
-                        
-                        if not product_code or qty <= 0:
-                            continue
-                        
-                        self.cursor.execute(
-                            "UPDATE inventory SET stock_qty = stock_qty + ? WHERE product_code=?",
-                            (qty, product_code)
-                        )
-                
-                # 更新订单状态
-                self.cursor.execute(
-                    'UPDATE "order" SET order_status=?, update_time=? WHERE id=?',
-                    ("已退货", now, oid)
-                )
-                
-                self.conn.commit()
-                confirm_win.destroy()
-                
-                msg = "订单已标记为退货！\n"
-                if rollback_purchase:
-                    msg += "✓ 已回滚购买记录\n"
-                if add_return:
-                    msg += "✓ 已新增退货记录\n"
-                if rollback_stock:
-                    msg += "✓ 已回滚库存\n"
-                messagebox.showinfo("成功", msg)
-                self.refresh_table()
-
-            except Exception as e:
-                self.conn.rollback()
-                messagebox.showerror("错误", str(e))
+            rollback_purchase = rollback_purchase_var.get()
+            add_return = add_return_var.get()
+            rollback_stock = rollback_stock_var.get()
+            if not self._apply_transition(oid, "已退货", rollback_stock=rollback_stock,
+                                          rollback_purchase=rollback_purchase, add_return=add_return):
+                return
+            confirm_win.destroy()
+
+            msg = "订单已标记为退货！\n"
+            if rollback_purchase:
+                msg += "✓ 已回滚购买记录\n"
+            if add_return:
+                msg += "✓ 已新增退货记录\n"
+            if rollback_stock:
+                msg += "✓ 已回滚库存\n"
+            messagebox.showinfo("成功", msg)
+            self.refresh_table()
         
         btn_frame = ctk.CTkFrame(confirm_win, fg_color="transparent")
         btn_frame.pack(pady=20)
@@ -976,7 +778,7 @@ class OrderPage(ctk.CTkFrame):
                 "customer_name": "",
                 "address": "",
                 "express_no": "",
-                "detail": "[]",
+                "details": [],
                 "sell_price": 0,
                 "cost_price": 0,
                 "shipping_fee": 0,
@@ -986,54 +788,58 @@ class OrderPage(ctk.CTkFrame):
             }
         else:
             win.title("编辑订单")
-            self.cursor.execute('SELECT * FROM "order" WHERE id=?', (oid,))
+            self.cursor.execute(
+                'SELECT id, order_no, order_status, customer_id, customer_name, address, express_no, '
+                'sell_price, cost_price, final_sell_price, shipping_fee, packaging_fee, remark '
+                'FROM "order" WHERE id=?',
+                (oid,)
+            )
             r = self.cursor.fetchone()
             if not r:
                 messagebox.showerror("错误", "未找到该订单记录")
                 return
+            row = row_to_map(self.cursor, r)
             
             # 检查是否可编辑
-            if r[2] != "草稿":  # order_status
-                messagebox.showerror("错误", f"订单状态为 {r[2]}，只能编辑草稿状态的订单！")
+            if row["order_status"] != "草稿":
+                messagebox.showerror("错误", f"订单状态为 {row['order_status']}，只能编辑草稿状态的订单！")
                 return
             
             data = {
-                "id": r[0],
-                "order_no": r[1],
-                "order_status": r[2],
-                "customer_id": r[3] or "",
-                "customer_name": r[4] or "",
-                "address": r[5] or "",
-                "express_no": r[6] or "",
-                "detail": r[9] or "[]",
-                "sell_price": r[7] or 0,
-                "cost_price": r[8] or 0,
-                "final_sell_price": (r[13] if len(r) > 13 and r[13] is not None else 0),
-                "shipping_fee": (r[14] if len(r) > 14 and r[14] is not None else 0),
-                "packaging_fee": (r[15] if len(r) > 15 and r[15] is not None else 0),
-                "remark": r[10] or ""
+                "id": row["id"],
+                "order_no": row["order_no"],
+                "order_status": row["order_status"],
+                "customer_id": row["customer_id"] or "",
+                "customer_name": row["customer_name"] or "",
+                "address": row["address"] or "",
+                "express_no": row["express_no"] or "",
+                "details": load_order_items(self.cursor, row["id"]),
+                "sell_price": row["sell_price"] or 0,
+                "cost_price": row["cost_price"] or 0,
+                "final_sell_price": row["final_sell_price"] or 0,
+                "shipping_fee": row["shipping_fee"] or 0,
+                "packaging_fee": row["packaging_fee"] or 0,
+                "remark": row["remark"] or ""
             }
 
-        # 查询客户列表
-        self.cursor.execute("SELECT id, customer_name, customer_address FROM customer WHERE customer_status='启用'")
-        customers = self.cursor.fetchall()
-        customer_options = [f"{c[0]} - {c[1]}" for c in customers]
-        
-        # 构建客户数据映射
+        # 已选过的客户：显示文本 -> {id, name, address}（不再预先加载全部客户）
         customer_data_map = {}
-        for c in customers:
-            display_text = f"{c[0]} - {c[1]}"
-            customer_data_map[display_text] = {
-                "id": c[0],
-                "name": c[1],
-                "address": c[2] or ""
-            }
 
-        # 查询库存产品列表
-        self.cursor.execute("SELECT product_code, cost_price, sell_price, size FROM inventory WHERE stock_status='启用'")
-        inventory_data = self.cursor.fetchall()
-        inventory_map = {item[0]: {"cost": item[1], "sell": item[2], "size": item[3] or ""} for item in inventory_data}
-        product_codes = list(inventory_map.keys())
+        # 已用到的产品：产品编码 -> {cost, sell, size}（只读取订单中已有的产品，其余按输入查询）
+        inventory_map = {}
+
+        def remember_product(r):
+            inventory_map[r[1]] = {"cost": r[3], "sell": r[4], "size": r[5] or ""}
+
+        for r in load_products(self.cursor, [d.get("product_code") for d in data["details"]]).values():
+            remember_product(r)
+
+        # 产品联想：按编码前缀、库存编号、材质 / 颜色 / 尺寸查询前 N 条（后台线程中执行）
+        def product_results(cursor, text):
+            return [
+                (" ".join(str(v) for v in (r[1], r[2], r[7], r[6], r[5], f"库存:{r[8]}") if v not in (None, "")), r)
+                for r in search_products(cursor, text)
+            ]
 
         # ===== 顶部表单区域 =====
         form_frame = ctk.CTkScrollableFrame(win, width=860, height=200, fg_color="#FFFFFF")
@@ -1056,31 +862,8 @@ class OrderPage(ctk.CTkFrame):
         customer_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
         customer_frame.grid(row=1, column=1, padx=10, pady=6, sticky="w")
         
-        # 客户下拉框
-        customer_combo = ctk.CTkComboBox(customer_frame, values=customer_options if customer_options else ["无可用客户"], width=280)
-        customer_combo.pack(side="left", padx=(0, 5))
-        
-        # 如果是编辑模式，设置当前客户
-        if mode == "edit" and data["customer_id"]:
-            match = [opt for opt in customer_options if opt.startswith(f"{data['customer_id']} -")]
-            if match:
-                customer_combo.set(match[0])
-            else:
-                customer_combo.set(f"{data['customer_id']} - {data['customer_name']}")
-        elif customer_options:
-            customer_combo.set(customer_options[0])
-        
-        # 客户选择事件处理
-        def on_customer_selected(event):
-            selected = customer_combo.get()
-            
-            if selected not in customer_data_map:
-                return
-            
-            customer_info = customer_data_map[selected]
-            customer_address = customer_info["address"]
-            
-            # 自动填充地址的逻辑
+        # 自动填充地址
+        def fill_address(customer_address):
             current_address = address_entry.get().strip()
             
             # 条件：客户有地址 且 (是新增模式 或 编辑模式下地址为空)
@@ -1093,8 +876,35 @@ class OrderPage(ctk.CTkFrame):
                     # 编辑模式：仅在地址为空时填充
                     address_entry.delete(0, "end")
                     address_entry.insert(0, customer_address)
+
+        # 选中客户：记录到数据映射并填入输入框
+        def pick_customer(customer_id, customer_name, customer_address):
+            display_text = f"{customer_id} - {customer_name}"
+            customer_data_map[display_text] = {
+                "id": customer_id,
+                "name": customer_name,
+                "address": customer_address or ""
+            }
+            customer_entry.set_text(display_text)
+            fill_address(customer_address)
+
+        # 客户联想输入框：按名称 / 拼音首字母 / 电话 / 微信查询前 N 条
+        def customer_results(cursor, text):
+            return [
+                (" ".join(str(v) for v in (f"{r[0]} - {r[1]}", r[2], r[3]) if v), r)
+                for r in search_customers(cursor, text)
+            ]
+
+        customer_entry = TypeAheadEntry(
+            customer_frame, customer_results,
+            lambda r: pick_customer(r[0], r[1], r[4]),
+            width=280, placeholder_text="输入名称 / 首字母 / 电话"
+        )
+        customer_entry.pack(side="left", padx=(0, 5))
         
-        customer_combo.bind("<<ComboboxSelected>>", on_customer_selected)
+        # 如果是编辑模式，设置当前客户
+        if mode == "edit" and data["customer_id"]:
+            customer_entry.set_text(f"{data['customer_id']} - {data['customer_name']}")
         
         # 搜索客户弹窗函数
         def open_customer_search():
@@ -1110,9 +920,12 @@ class OrderPage(ctk.CTkFrame):
             search_frame.pack(fill="x", padx=20, pady=20)
             
             ctk.CTkLabel(search_frame, text="客户名称:", font=("微软雅黑", 16)).pack(side="left", padx=5)
-            search_entry = ctk.CTkEntry(search_frame, width=300, placeholder_text="输入客户名进行模糊搜索")
+            search_entry = ctk.CTkEntry(search_frame, width=300, placeholder_text="名称 / 首字母 / 电话 / 微信")
             search_entry.pack(side="left", padx=5)
             
+            result_label = ctk.CTkLabel(search_win, text="", font=("微软雅黑", 14), text_color="#666")
+            result_label.pack(anchor="w", padx=25)
+            
             # 结果显示区域
             result_frame = ctk.CTkFrame(search_win, fg_color="#FFFFFF")
             result_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
@@ -1139,30 +952,18 @@ class OrderPage(ctk.CTkFrame):
                 for item in tree.get_children():
                     tree.delete(item)
                 
-                if not search_text:
-                    # 显示所有启用的客户
-                    self.cursor.execute(
-                        "SELECT id, customer_name, customer_address, customer_phone FROM customer WHERE customer_status='启用' ORDER BY id DESC"
-                    )
-                else:
-                    # 模糊搜索
-                    self.cursor.execute(
-                        "SELECT id, customer_name, customer_address, customer_phone FROM customer WHERE customer_status='启用' AND customer_name LIKE ? ORDER BY id DESC",
-                        (f"%{search_text}%",)
-                    )
-                
-                results = self.cursor.fetchall()
-                
-                if not results:
-                    messagebox.showinfo("提示", "未找到匹配的客户")
-                    return
+                # 只取排名靠前的匹配；关键字为空时显示最近新增的客户
+                results = search_customers(self.cursor, search_text, limit=SEARCH_LIMIT)
+                result_label.configure(
+                    text=f"显示前 {len(results)} 条匹配" if results else "未找到匹配的客户"
+                )
                 
                 for r in results:
                     tree.insert("", "end", values=(
                         r[0],
                         r[1] or "",
-                        r[2] or "",
-                        r[3] or ""
+                        r[4] or "",
+                        r[2] or ""
                     ))
             
             # 选择客户函数
@@ -1177,38 +978,8 @@ class OrderPage(ctk.CTkFrame):
                 customer_name = values[1]
                 customer_address = values[2]
                 
-                # 构建显示文本
-                display_text = f"{customer_id} - {customer_name}"
-                
-                # 更新主窗口的客户下拉框
-                # 先检查是否已在列表中
-                if display_text not in customer_data_map:
-                    # 添加到数据映射
-                    customer_data_map[display_text] = {
-                        "id": customer_id,
-                        "name": customer_name,
-                        "address": customer_address
-                    }
-                    # 更新下拉框选项
-                    current_values = list(customer_combo.cget("values"))
-                    if "无可用客户" in current_values:
-                        current_values.remove("无可用客户")
-                    if display_text not in current_values:
-                        current_values.insert(0, display_text)
-                    customer_combo.configure(values=current_values)
-                
-                # 设置选中
-                customer_combo.set(display_text)
-                
-                # 触发地址填充
-                if customer_address:
-                    current_address = address_entry.get().strip()
-                    if mode == "add":
-                        address_entry.delete(0, "end")
-                        address_entry.insert(0, customer_address)
-                    elif mode == "edit" and not current_address:
-                        address_entry.delete(0, "end")
-                        address_entry.insert(0, customer_address)
+                # 填入主窗口的客户输入框并填充地址
+                pick_customer(customer_id, customer_name, customer_address)
                 
                 # 关闭搜索窗口（不显示额外提示，避免焦点问题）
                 search_win.destroy()
@@ -1227,17 +998,31 @@ class OrderPage(ctk.CTkFrame):
             ctk.CTkButton(btn_frame, text="✅ 选择", width=120, fg_color="#2B6CB0", command=select_customer).pack(side="left", padx=5)
             ctk.CTkButton(btn_frame, text="❌ 取消", width=120, fg_color="#A0AEC0", command=search_win.destroy).pack(side="left", padx=5)
             
-            # 支持回车搜索
+            # 输入时自动搜索（停顿后才查询），回车立即搜索
+            pending = {"after_id": None}
+            
+            def schedule_search(event):
+                if event.keysym in ("Return", "KP_Enter"):
+                    return
+                if pending["after_id"] is not None:
+                    search_win.after_cancel(pending["after_id"])
+                pending["after_id"] = search_win.after(SEARCH_DELAY_MS, run_search)
+            
+            def run_search():
+                pending["after_id"] = None
+                do_search()
+            
+            search_entry.bind("<KeyRelease>", schedule_search)
             search_entry.bind("<Return>", lambda e: do_search())
             
-            # 初始加载所有客户
+            # 初始显示最近新增的客户
             do_search()
         
         # 搜索按钮
         search_customer_btn = ctk.CTkButton(customer_frame, text="🔍", width=50, fg_color="#4A5568", command=open_customer_search)
         search_customer_btn.pack(side="left")
         
-        entries["customer"] = customer_combo
+        entries["customer"] = customer_entry
         entries["customer_data_map"] = customer_data_map
 
         # 地址
@@ -1263,6 +1048,48 @@ class OrderPage(ctk.CTkFrame):
 
         # ===== 明细区域 =====
         ctk.CTkLabel(win, text="订单明细", font=("微软雅黑", 18, "bold")).pack(pady=(5, 0))
+
+        # 扫码录入：扫码枪输入编码后回车，已有该产品则数量 +1，否则新增一行
+        scan_frame = ctk.CTkFrame(win, fg_color="transparent")
+        scan_frame.pack(fill="x", padx=10)
+        ctk.CTkLabel(scan_frame, text="扫码录入:", font=("微软雅黑", 14)).pack(side="left", padx=5)
+        scan_entry = ctk.CTkEntry(scan_frame, width=220, placeholder_text="扫描或输入产品编码 / 库存编号")
+        scan_entry.pack(side="left", padx=5)
+        scan_status = ctk.CTkLabel(scan_frame, text="", font=("微软雅黑", 14))
+        scan_status.pack(side="left", padx=10)
+
+        def scan_product(event=None):
+            code = scan_entry.get().strip()
+            scan_entry.delete(0, "end")
+            if not code:
+                return "break"
+            r = find_product(self.cursor, code)
+            if r is None:
+                scan_status.configure(text=f"未找到启用的产品：{code}", text_color="#E53E3E")
+                scan_entry.bell()
+                return "break"
+
+            for row_data in detail_rows:
+                if row_data["product"].get().strip() == r[1]:
+                    try:
+                        qty = float(row_data["qty"].get() or 0)
+                    except ValueError:
+                        qty = 0
+                    break
+            else:
+                # 优先填入空行，没有空行再新增
+                empty_rows = [rd for rd in detail_rows if not rd["product"].get().strip()]
+                row_data = empty_rows[0] if empty_rows else add_detail_row()
+                row_data["set_product"](r)
+                qty = 0
+
+            row_data["qty"].delete(0, "end")
+            row_data["qty"].insert(0, f"{qty + 1:g}")
+            calculate_prices()
+            scan_status.configure(text=f"{r[1]} 数量 {qty + 1:g}", text_color="#38A169")
+            return "break"
+
+        scan_entry.bind("<Return>", scan_product)
         
         detail_frame = ctk.CTkScrollableFrame(win, width=860, height=250, fg_color="#F7F9FC")
         detail_frame.pack(fill="both", padx=10, pady=10, expand=True)
@@ -1395,14 +1222,16 @@ class OrderPage(ctk.CTkFrame):
             row_frame = ctk.CTkFrame(detail_frame, fg_color="#FFFFFF")
             row_frame.pack(fill="x", padx=5, pady=5)
 
-            # 产品编码下拉
+            # 产品编码联想输入
             ctk.CTkLabel(row_frame, text="产品编码:", font=("微软雅黑", 14)).pack(side="left", padx=5)
-            product_combo = ctk.CTkComboBox(row_frame, values=product_codes if product_codes else ["无可用产品"], width=150)
+            product_entry = TypeAheadEntry(
+                row_frame, product_results,
+                lambda r: on_product_picked(r),
+                width=150, placeholder_text="编码 / 材质 / 颜色"
+            )
             if detail_data:
-                product_combo.set(detail_data.get("product_code", ""))
-            elif product_codes:
-                product_combo.set(product_codes[0])
-            product_combo.pack(side="left", padx=5)
+                product_entry.set_text(detail_data.get("product_code", ""))
+            product_entry.pack(side="left", padx=5)
 
             # 尺寸展示框
             ctk.CTkLabel(row_frame, text="尺寸:", font=("微软雅黑", 14)).pack(side="left", padx=5)
@@ -1441,7 +1270,7 @@ class OrderPage(ctk.CTkFrame):
 
             row_data = {
                 "frame": row_frame,
-                "product": product_combo,
+                "product": product_entry,
                 "size": size_entry,
                 "qty": qty_entry,
                 "cost": cost_entry,
@@ -1466,22 +1295,22 @@ class OrderPage(ctk.CTkFrame):
                     
                     calculate_prices()
 
-            product_combo.configure(command=on_product_select)
+            def set_product(r):
+                remember_product(r)
+                product_entry.set_text(r[1])
+                on_product_select(r[1])
+
+            def on_product_picked(r):
+                set_product(r)
+                qty_entry.focus_set()
+
+            row_data["set_product"] = set_product
+
             qty_entry.bind("<KeyRelease>", lambda e: calculate_prices())
             cost_entry.bind("<KeyRelease>", lambda e: calculate_prices())
             sell_entry.bind("<KeyRelease>", lambda e: calculate_prices())
 
-            # 如果没有传入数据且有库存，自动填充第一个产品的价格和尺寸
-            if not detail_data and product_codes and product_combo.get() in inventory_map:
-                selected = product_combo.get()
-                cost_entry.insert(0, str(inventory_map[selected]["cost"]))
-                sell_entry.insert(0, str(inventory_map[selected]["sell"]))
-                
-                size_entry.configure(state="normal")
-                size_entry.insert(0, inventory_map[selected]["size"])
-                size_entry.configure(state="readonly")
-            
-            # 如果有传入数据，也需要填充尺寸
+            # 如果有传入数据，需要填充尺寸
             if detail_data:
                 product_code = detail_data.get("product_code", "")
                 if product_code in inventory_map:
@@ -1490,15 +1319,13 @@ class OrderPage(ctk.CTkFrame):
                     size_entry.insert(0, inventory_map[product_code]["size"])
                     size_entry.configure(state="readonly")
 
+            return row_data
+
         # 加载现有明细
-        try:
-            existing_details = json.loads(data["detail"])
-            if existing_details:
-                for detail in existing_details:
-                    add_detail_row(detail)
-            else:
-                add_detail_row()  # 至少添加一行
-        except:
+        if data["details"]:
+            for detail in data["details"]:
+                add_detail_row(detail)
+        else:
             add_detail_row()  # 至少添加一行
 
         # 初始计算价格
@@ -1506,7 +1333,7 @@ class OrderPage(ctk.CTkFrame):
 
         # 添加明细按钮
         add_detail_btn = ctk.CTkButton(win, text="➕ 添加明细行", width=150, fg_color="#2B6CB0", 
-                                       command=lambda: add_detail_row())
+                                       command=lambda: add_detail_row()["product"].focus_set())
         add_detail_btn.pack(pady=5)
 
         # ===== 保存按钮 =====
@@ -1571,8 +1398,6 @@ class OrderPage(ctk.CTkFrame):
                 messagebox.showwarning("提示", "请至少添加一条有效的订单明细")
                 return
 
-            detail_json = json.dumps(details, ensure_ascii=False)
-            
             # 获取价格，进行数值校验
             try:
                 cost_price_str = entries["cost_price"].get().strip()
@@ -1611,54 +1436,62 @@ class OrderPage(ctk.CTkFrame):
 
             now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            if mode == "add":
-                self.cursor.execute('''
-                    INSERT INTO "order" (
-                        order_no, order_status, customer_id, customer_name, address, express_no,
-                        sell_price, cost_price, shipping_fee, packaging_fee, final_sell_price, 
-                        detail, remark, create_time, update_time
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    entries["order_no"].get(),
-                    "草稿",
-                    customer_id,
-                    customer_name,
-                    entries["address"].get(),
-                    entries["express_no"].get(),
-                    sell_price,
-                    cost_price,
-                    shipping_fee,
-                    packaging_fee,
-                    final_sell_price,
-                    detail_json,
-                    entries["remark"].get(),
-                    now,
-                    now
-                ))
-            else:
-                self.cursor.execute('''
-                    UPDATE "order" SET
-                        customer_id=?, customer_name=?, address=?, express_no=?,
-                        sell_price=?, cost_price=?, shipping_fee=?, packaging_fee=?, 
-                        final_sell_price=?, detail=?, remark=?, update_time=?
-                    WHERE id=?
-                ''', (
-                    customer_id,
-                    customer_name,
-                    entries["address"].get(),
-                    entries["express_no"].get(),
-                    sell_price,
-                    cost_price,
-                    shipping_fee,
-                    packaging_fee,
-                    final_sell_price,
-                    detail_json,
-                    entries["remark"].get(),
-                    now,
-                    oid
-                ))
-
-            self.conn.commit()
+            try:
+                if mode == "add":
+                    self.cursor.execute('''
+                        INSERT INTO "order" (
+                            order_no, order_status, customer_id, customer_name, address, express_no,
+                            sell_price, cost_price, shipping_fee, packaging_fee, final_sell_price, 
+                            remark, create_time, update_time
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (
+                        entries["order_no"].get(),
+                        "草稿",
+                        customer_id,
+                        customer_name,
+                        entries["address"].get(),
+                        entries["express_no"].get(),
+                        sell_price,
+                        cost_price,
+                        shipping_fee,
+                        packaging_fee,
+                        final_sell_price,
+                        entries["remark"].get(),
+                        now,
+                        now
+                    ))
+                    order_id = self.cursor.lastrowid
+                else:
+                    self.cursor.execute('''
+                        UPDATE "order" SET
+                            customer_id=?, customer_name=?, address=?, express_no=?,
+                            sell_price=?, cost_price=?, shipping_fee=?, packaging_fee=?, 
+                            final_sell_price=?, remark=?, update_time=?, detail=NULL
+                        WHERE id=?
+                    ''', (
+                        customer_id,
+                        customer_name,
+                        entries["address"].get(),
+                        entries["express_no"].get(),
+                        sell_price,
+                        cost_price,
+                        shipping_fee,
+                        packaging_fee,
+                        final_sell_price,
+                        entries["remark"].get(),
+                        now,
+                        oid
+                    ))
+                    order_id = oid
+
+                # 订单与明细在同一事务中保存
+                save_order_items(self.cursor, order_id, details)
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                messagebox.showerror("错误", f"保存订单失败：{e}")
+                return
+
             win.destroy()
             self.refresh_table()
             messagebox.showinfo("成功", "订单已保存！")
@@ -1669,6 +1502,7 @@ class OrderPage(ctk.CTkFrame):
     def _generate_order_no(self):
         today = datetime.datetime.now().strftime("%Y%m%d")
         prefix = f"ORD{today}"
-        self.cursor.execute('SELECT COUNT(*) FROM "order" WHERE order_no LIKE ?', (f"{prefix}%",))
+        # GLOB 区分大小写，可直接走 idx_order_no 做前缀范围查找（LIKE 不能）
+        self.cursor.execute('SELECT COUNT(*) FROM "order" WHERE order_no GLOB ?', (f"{prefix}*",))
         count = self.cursor.fetchone()[0] + 1
         return f"{prefix}{count:04d}"
@@ -132,6 +132,36 @@ class SettingPage(ctk.CTkFrame):
         )
         self.rowheight_label.pack(side="left", padx=10)
         
+        # 首页自动刷新间隔
+        refresh_frame = ctk.CTkFrame(font_section, fg_color="transparent")
+        refresh_frame.pack(fill="x", pady=10)
+        
+        ctk.CTkLabel(
+            refresh_frame,
+            text="首页自动刷新：",
+            font=("微软雅黑", 16)
+        ).pack(side="left", padx=(0, 20))
+        
+        self.refresh_slider = ctk.CTkSlider(
+            refresh_frame,
+            from_=0,
+            to=300,
+            number_of_steps=30,
+            width=300,
+            command=self.update_refresh_label
+        )
+        self.refresh_slider.set(self.settings.get("dashboard_refresh_seconds", 0))
+        self.refresh_slider.pack(side="left", padx=10)
+        
+        self.refresh_label = ctk.CTkLabel(
+            refresh_frame,
+            text=self.refresh_text(self.refresh_slider.get()),
+            font=("微软雅黑", 16, "bold"),
+            text_color="#2B6CB0",
+            width=60
+        )
+        self.refresh_label.pack(side="left", padx=10)
+        
         # 提示信息
         tip_label = ctk.CTkLabel(
             font_section,
@@ -176,6 +206,13 @@ class SettingPage(ctk.CTkFrame):
     def update_rowheight_label(self, value):
         self.rowheight_label.configure(text=f"{int(value)} px")
     
+    def update_refresh_label(self, value):
+        self.refresh_label.configure(text=self.refresh_text(value))
+    
+    @staticmethod
+    def refresh_text(value):
+        return f"{int(value)} 秒" if int(value) > 0 else "关闭"
+    
     def load_settings(self):
         """加载配置文件"""
         if CONFIG_FILE.exists():
@@ -193,11 +230,14 @@ class SettingPage(ctk.CTkFrame):
     
     def save_settings_action(self):
         """保存设置"""
-        settings = {
+        # 在原配置基础上合并，保留列顺序、数据库性能配置（db_pragmas）等其他项
+        settings = self.load_settings()
+        settings.update({
             "table_content_font_size": int(self.content_font_slider.get()),
             "table_heading_font_size": int(self.heading_font_slider.get()),
-            "table_row_height": int(self.rowheight_slider.get())
-        }
+            "table_row_height": int(self.rowheight_slider.get()),
+            "dashboard_refresh_seconds": int(self.refresh_slider.get())
+        })
         
         # 确保目录存在
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -214,6 +254,8 @@ class SettingPage(ctk.CTkFrame):
             self.content_font_slider.set(20)
             self.heading_font_slider.set(22)
             self.rowheight_slider.set(36)
+            self.refresh_slider.set(0)
+            self.update_refresh_label(0)
             messagebox.showinfo("成功", "已恢复默认设置！")
 
 
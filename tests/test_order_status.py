@@ -0,0 +1,79 @@
+"""
+订单状态转换：同一个转换执行两次，库存与客户购买记录只变化一次
+（单个订单操作与批量操作都走 data/order_status.batch_transition）。
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from data.migrations import run_migrations
+from data.order_status import batch_transition
+
+
+class BatchTransitionTwiceTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.conn = sqlite3.connect(self.path)
+        run_migrations(self.conn)
+        cursor = self.conn.cursor()
+        cursor.execute("INSERT INTO customer (customer_name, purchase_times, total_purchase_amount) VALUES ('张三', 0, 0)")
+        self.customer_id = cursor.lastrowid
+        cursor.execute(
+            "INSERT INTO inventory (stock_code, stock_qty, stock_status, product_code) VALUES ('S1', 10, '在库', 'P1')"
+        )
+        cursor.execute(
+            'INSERT INTO "order" (order_no, order_status, customer_id, sell_price) VALUES (?, ?, ?, ?)',
+            ("NO1", "草稿", self.customer_id, 100)
+        )
+        self.order_id = cursor.lastrowid
+        cursor.execute(
+            "INSERT INTO order_item (order_id, line_no, product_code, qty, cost, sell) VALUES (?, 1, 'P1', 3, 0, 0)",
+            (self.order_id,)
+        )
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        os.remove(self.path)
+
+    def stock(self):
+        return self.conn.execute("SELECT stock_qty FROM inventory WHERE product_code='P1'").fetchone()[0]
+
+    def purchase_times(self):
+        return self.conn.execute(
+            "SELECT purchase_times FROM customer WHERE id=?", (self.customer_id,)
+        ).fetchone()[0]
+
+    def transition_twice(self, target, **options):
+        first = batch_transition(self.conn, [self.order_id], target, **options)
+        second = batch_transition(self.conn, [self.order_id], target, **options)
+        self.assertEqual(first[0], [self.order_id])
+        self.assertEqual(second[0], [])
+        self.assertIn(self.order_id, second[1])
+
+    def test_complete_twice_deducts_once(self):
+        self.transition_twice("已完成")
+        self.assertEqual(self.stock(), 7)
+
+    def test_deliver_twice_counts_purchase_once(self):
+        batch_transition(self.conn, [self.order_id], "已完成")
+        self.transition_twice("已送达")
+        self.assertEqual(self.purchase_times(), 1)
+
+    def test_draft_twice_restores_stock_once(self):
+        batch_transition(self.conn, [self.order_id], "已完成")
+        self.transition_twice("草稿", rollback_stock=True)
+        self.assertEqual(self.stock(), 10)
+
+    def test_return_twice_rolls_back_once(self):
+        batch_transition(self.conn, [self.order_id], "已完成")
+        batch_transition(self.conn, [self.order_id], "已送达")
+        self.transition_twice("已退货", rollback_stock=True, rollback_purchase=True, add_return=True)
+        self.assertEqual(self.stock(), 10)
+        self.assertEqual(self.purchase_times(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
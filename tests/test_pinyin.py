@@ -0,0 +1,72 @@
+"""
+拼音与首字母：多音姓氏按姓氏读音，完整拼音与首字母都可以按前缀查找。
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from data.lookups import search_customers
+from data.migrations import run_migrations
+from data.pinyin import full_pinyin, initials
+
+
+class PinyinTest(unittest.TestCase):
+    def test_common_names(self):
+        self.assertEqual(initials("张三丰"), "zsf")
+        self.assertEqual(full_pinyin("张三丰"), "zhangsanfeng")
+        self.assertEqual(initials("王梓涵"), "wzh")
+        self.assertEqual(full_pinyin("王梓涵"), "wangzihan")
+
+    def test_polyphonic_surnames(self):
+        cases = {
+            "乐嘉": ("yj", "yuejia"),
+            "曾小贤": ("zxx", "zengxiaoxian"),
+            "单田芳": ("stf", "shantianfang"),
+            "解缙": ("xj", "xiejin"),
+            "仇英": ("qy", "qiuying"),
+            "朴树": ("ps", "piaoshu"),
+            "翟天临": ("ztl", "zhaitianlin"),
+        }
+        for name, (short, spelled) in cases.items():
+            with self.subTest(name=name):
+                self.assertEqual(initials(name), short)
+                self.assertEqual(full_pinyin(name), spelled)
+
+    def test_surname_reading_only_for_first_char(self):
+        # “快乐” 中的 “乐” 不是姓氏，按最常用读音
+        self.assertEqual(full_pinyin("快乐"), "kuaile")
+
+    def test_unknown_and_ascii(self):
+        self.assertEqual(initials("Abc 王"), "abcw")
+        self.assertEqual(initials("王★一"), "wy")
+        self.assertEqual(initials(""), "")
+
+
+class CustomerPinyinSearchTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.conn = sqlite3.connect(self.path)
+        run_migrations(self.conn)
+        self.conn.execute(
+            "INSERT INTO customer (customer_name, customer_name_initials, customer_name_pinyin) VALUES (?, ?, ?)",
+            ("乐嘉", initials("乐嘉"), full_pinyin("乐嘉"))
+        )
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        os.remove(self.path)
+
+    def names(self, text):
+        return [r[1] for r in search_customers(self.conn.cursor(), text)]
+
+    def test_search_by_initials_and_full_pinyin(self):
+        self.assertEqual(self.names("yj"), ["乐嘉"])
+        self.assertEqual(self.names("yuej"), ["乐嘉"])
+        self.assertEqual(self.names("lej"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()